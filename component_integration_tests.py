@@ -236,6 +236,7 @@ class ComponentIntegrationTests:
             # Try to import BDD generator
             try:
                 from poc_bdd_generator import BDDGenerator, ClinicalScenario
+                from gherkin_parser import GherkinSyntaxError, parse as parse_gherkin
             except ImportError:
                 # If import fails, skip this test
                 self.log_test("BDD Generator Interface", False, "BDD generator module not available")
@@ -256,9 +257,16 @@ class ComponentIntegrationTests:
             # Generate BDD feature
             feature_text = generator.generate_feature(scenario)
 
-            # Validate feature structure
-            required_keywords = ["Feature:", "Scenario:", "Given", "When", "Then"]
-            missing_keywords = [kw for kw in required_keywords if kw not in feature_text]
+            # Validate feature structure: a Feature whose scenarios have Given, When and Then steps
+            try:
+                feature = parse_gherkin(feature_text)
+                missing_keywords = [] if feature.scenarios else ["Scenario:"]
+                missing_keywords += [
+                    keyword for keyword in ("Given", "When", "Then")
+                    if not any(scenario.step_texts(keyword.lower()) for scenario in feature.scenarios)
+                ]
+            except GherkinSyntaxError as e:
+                missing_keywords = [f"Feature: ({e})"]
 
             if not missing_keywords:
                 # Check for clinical content
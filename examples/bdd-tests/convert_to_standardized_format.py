@@ -5,19 +5,35 @@ BDD Test Format Conversion Script
 This script helps convert existing BDD test examples to the standardized format
 as defined in BDD_FORMAT_STANDARDIZATION.md.
 
+It can also regenerate the legacy by-domain/, by-fidelity/ and by-mode/
+trees from a set of example files named {domain}-{mode}-{fidelity}-...
+
 Usage:
     python convert_to_standardized_format.py --input <input_dir> --output <output_dir>
+    python convert_to_standardized_format.py --rebuild-trees <source_dir> --output <root_dir>
     
 Example:
     python convert_to_standardized_format.py --input examples/bdd-tests/unsorted/ --output examples/bdd-tests/scenarios/
+    python convert_to_standardized_format.py --rebuild-trees examples/bdd-tests/by-domain --output examples/bdd-tests
 """
 
 import argparse
 import os
+import re
+import sys
 import yaml
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "poc" / "bdd-generator"))
+from feature_writer import FeatureFile, FeatureWriter
+from gherkin_parser import GherkinParser
+
+# Legacy example file names: {domain}-{mode}-{fidelity}-{condition}-{id}...
+LEGACY_NAME_PATTERN = re.compile(
+    r'^(?P<domain>.+?)-(?P<mode>basic|advanced|expert)-(?P<fidelity>low|medium|high)-'
+)
+
 
 def generate_scenario_id(domain, category, condition):
     """
@@ -70,7 +86,8 @@ def get_next_sequence(base_id, output_dir):
     return "001"
 
 
-def create_clinical_yaml_template(scenario_id, domain, category, condition, original_file):
+def create_clinical_yaml_template(scenario_id, domain, category, condition, original_file,
+                                  title='TODO: Add descriptive title'):
     """
     Create a template for the clinical scenario YAML file.
     
@@ -80,7 +97,7 @@ def create_clinical_yaml_template(scenario_id, domain, category, condition, orig
     template = {
         'scenario': {
             'id': scenario_id,
-            'title': 'TODO: Add descriptive title',
+            'title': title,
             'domain': domain,
             'category': category,
             'condition': condition,
@@ -242,43 +259,37 @@ def convert_scenario(input_file, output_dir, domain, category, condition):
     sequence = get_next_sequence(base_id, output_dir)
     scenario_id = f"{base_id}-{sequence}"
     
-    # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-    
-    # Generate file paths
-    yaml_path = Path(output_dir) / f"{scenario_id}.yaml"
-    feature_path = Path(output_dir) / f"{scenario_id}.feature"
-    assert_path = Path(output_dir) / f"{scenario_id}.assert.yaml"
+    # Keep the original title when converting a feature file
+    title = 'TODO: Add descriptive title'
+    if Path(input_file).suffix == '.feature':
+        title = GherkinParser().parse_file(input_file).name or title
     
     # Create clinical YAML
     clinical_yaml = create_clinical_yaml_template(
-        scenario_id, domain, category, condition, Path(input_file).name
+        scenario_id, domain, category, condition, Path(input_file).name, title
     )
     
-    with open(yaml_path, 'w') as f:
-        yaml.dump(clinical_yaml, f, default_flow_style=False, sort_keys=False, indent=2)
-    
-    print(f"Created: {yaml_path}")
-    
     # Create feature file
     feature_content = create_feature_template(
         scenario_id, domain, category, clinical_yaml['scenario']['title']
     )
     
-    with open(feature_path, 'w') as f:
-        f.write(feature_content)
-    
-    print(f"Created: {feature_path}")
-    
     # Create assertions file
     assertions = create_assertions_template(
         scenario_id, clinical_yaml['scenario']['guidelines'][0]['name']
     )
     
-    with open(assert_path, 'w') as f:
-        yaml.dump(assertions, f, default_flow_style=False, sort_keys=False, indent=2)
+    # Write all three files atomically (output directory is created if missing)
+    yaml_path, feature_path, assert_path = FeatureWriter(output_dir, workers=1).write([
+        FeatureFile(f"{scenario_id}.yaml",
+                    yaml.dump(clinical_yaml, default_flow_style=False, sort_keys=False, indent=2)),
+        FeatureFile(f"{scenario_id}.feature", feature_content),
+        FeatureFile(f"{scenario_id}.assert.yaml",
+                    yaml.dump(assertions, default_flow_style=False, sort_keys=False, indent=2)),
+    ])
     
-    print(f"Created: {assert_path}")
+    for path in (yaml_path, feature_path, assert_path):
+        print(f"Created: {path}")
     
     print(f"\n✅ Conversion complete for scenario: {scenario_id}")
     print(f"⚠️  Manual steps required:")
@@ -288,6 +299,55 @@ def convert_scenario(input_file, output_dir, domain, category, condition):
     print(f"   4. Verify clinical accuracy against guidelines\n")
 
 
+def classify_example_file(path):
+    """
+    Read an example file and classify it from its legacy file name.
+    
+    Runs in FeatureWriter worker processes when rebuilding the trees.
+    
+    Returns:
+        FeatureFile routed into the by-domain, by-mode and by-fidelity trees
+    """
+    path = Path(path)
+    match = LEGACY_NAME_PATTERN.match(path.name)
+    if not match:
+        raise ValueError(f"Cannot classify {path.name}: expected {{domain}}-{{mode}}-{{fidelity}}-...")
+    
+    return FeatureFile(
+        name=path.name,
+        content=path.read_text(encoding='utf-8'),
+        domain=match.group('domain'),
+        fidelity=match.group('fidelity'),
+        mode=match.group('mode')
+    )
+
+
+def rebuild_trees(source_dir, output_root, workers=None):
+    """
+    Regenerate the by-domain/, by-fidelity/ and by-mode/ trees.
+    
+    Every classifiable file under source_dir (README files are skipped) is
+    copied into all three trees under output_root. Files are read and
+    written in parallel, each one atomically.
+    
+    Args:
+        source_dir: Directory searched recursively for example files
+        output_root: Directory containing the trees (e.g. examples/bdd-tests)
+        workers: Worker processes (default: CPU count)
+    
+    Returns:
+        Paths written
+    """
+    sources = sorted(
+        path for path in Path(source_dir).rglob('*')
+        if path.is_file() and not path.name.startswith('.') and path.name != 'README.md'
+    )
+    paths = FeatureWriter(output_root, workers=workers).write(sources, render=classify_example_file)
+    
+    print(f"✅ Rebuilt {len(paths)} files from {len(sources)} examples under {output_root}")
+    return paths
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Convert BDD tests to standardized format',
@@ -307,18 +367,33 @@ Examples:
     --input unsorted/example.feature \\
     --output scenarios/ \\
     --interactive
+
+  # Regenerate the by-domain/, by-fidelity/ and by-mode/ trees
+  python convert_to_standardized_format.py \\
+    --rebuild-trees by-domain/ \\
+    --output .
         """
     )
     
-    parser.add_argument('--input', required=True, help='Input file path')
+    parser.add_argument('--input', help='Input file path')
     parser.add_argument('--output', required=True, help='Output directory path')
     parser.add_argument('--domain', help='Clinical domain (e.g., cardiology, oncology)')
     parser.add_argument('--category', help='Category (e.g., treatment-recommendation)')
     parser.add_argument('--condition', help='Medical condition (e.g., afib, diabetes)')
     parser.add_argument('--interactive', action='store_true', help='Interactive mode')
+    parser.add_argument('--rebuild-trees', metavar='SOURCE_DIR',
+                        help='Regenerate by-domain/, by-fidelity/ and by-mode/ under --output from SOURCE_DIR')
+    parser.add_argument('--workers', type=int, help='Worker processes for --rebuild-trees (default: CPU count)')
     
     args = parser.parse_args()
     
+    if args.rebuild_trees:
+        rebuild_trees(args.rebuild_trees, args.output, workers=args.workers)
+        return
+    
+    if not args.input:
+        parser.error("--input is required (or use --rebuild-trees)")
+    
     # Interactive mode
     if args.interactive:
         print("Interactive Conversion Mode")
@@ -14,6 +14,12 @@ Options:
     --output-dir: Output directory for reports (default: generated/fidelity-reports)
     --comprehensive-report: Generate single comprehensive report (default: true)
     --per-guideline-reports: Generate individual reports per guideline (default: true)
+    --force: Re-run every test, even those the build manifest reports as up to date
+
+Runs are incremental: <output-dir>/build-manifest.json records each
+guideline/mode test's input hash (guideline text and mode), the validation
+service version and the hash of its saved result, and tests whose inputs,
+service code and result are unchanged reuse the saved result.
 """
 
 import json
@@ -31,6 +37,16 @@ from dataclasses import dataclass, asdict
 import tempfile
 import shutil
 
+sys.path.insert(0, str(Path(__file__).parent / "poc" / "bdd-generator"))
+from build_manifest import BuildManifest, input_hash, source_version
+from feature_writer import write_atomic
+
+# Source files the test results depend on; editing any of them re-runs every test
+SERVICE_SOURCES = (
+    Path(__file__).parent / "phase6-ai-validation" / "ai_validation_mcp_service.py",
+    Path(__file__).parent / "poc" / "bdd-generator" / "gherkin_parser.py",
+)
+
 @dataclass
 class FidelityTestResult:
     """Result of a single fidelity mode test"""
@@ -67,11 +83,16 @@ class ComprehensiveTestReport:
 class FidelityTestingFramework:
     """Framework for testing AI validation MCP service fidelity modes"""
 
-    def __init__(self, output_dir: Path = None):
+    def __init__(self, output_dir: Path = None, force: bool = False):
         self.project_root = Path(__file__).parent
         self.output_dir = output_dir or self.project_root / "generated" / "fidelity-reports"
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
+        # Saved test results, reused while the build manifest reports them up to date
+        self.results_dir = self.output_dir / "results"
+        self.manifest = BuildManifest(self.output_dir / BuildManifest.FILE_NAME,
+                                      source_version(*SERVICE_SOURCES), force=force)
+
         # Available guidelines
         self.available_guidelines = {
             "acc-afib": {
@@ -139,6 +160,14 @@ class FidelityTestingFramework:
             guideline_info = self.available_guidelines[guideline_name]
             guideline_text = self.extract_guideline_text(guideline_info["path"])
 
+            # Reuse the saved result when the guideline text, mode and service are unchanged
+            manifest_key = f"{guideline_name}/{fidelity_mode}"
+            inputs_digest = input_hash(guideline_text, fidelity_mode)
+            result_file = self.results_dir / f"{guideline_name}_{fidelity_mode}.json"
+            if self.manifest.is_current(manifest_key, inputs_digest):
+                with open(result_file, 'r') as f:
+                    return FidelityTestResult(**json.load(f))
+
             # Create temporary test script for MCP service
             test_script = f"""
 import sys
@@ -212,13 +241,16 @@ print(json.dumps(result))
                 if result.returncode == 0:
                     try:
                         result_data = json.loads(result.stdout.strip())
-                        return FidelityTestResult(
+                        test_result = FidelityTestResult(
                             guideline_name=guideline_name,
                             fidelity_mode=fidelity_mode,
                             execution_time=execution_time,
                             success=True,
                             result_data=result_data
                         )
+                        write_atomic(result_file, json.dumps(asdict(test_result), indent=2))
+                        self.manifest.record(manifest_key, inputs_digest, [result_file])
+                        return test_result
                     except json.JSONDecodeError:
                         return FidelityTestResult(
                             guideline_name=guideline_name,
@@ -377,11 +409,15 @@ print(json.dumps(result))
                 guideline_results[fidelity_mode] = result
 
                 status = "✅" if result.success else "❌"
-                print(f"    {status} {fidelity_mode}: {result.execution_time:.2f}s")
+                reused = " (up to date, reused)" if f"{guideline_name}/{fidelity_mode}" in self.manifest.up_to_date else ""
+                print(f"    {status} {fidelity_mode}: {result.execution_time:.2f}s{reused}")
 
             all_results[guideline_name] = guideline_results
             individual_reports[guideline_name] = self.generate_guideline_report(guideline_name, guideline_results)
 
+        self.manifest.save()
+        print(f"\n🔁 Build: {self.manifest.summary()}")
+
         # Generate cross-guideline analysis
         cross_analysis = self.generate_cross_guideline_analysis(all_results)
 
@@ -396,7 +432,9 @@ print(json.dumps(result))
             test_configuration={
                 "guidelines_tested": guideline_names,
                 "fidelity_modes_tested": fidelity_modes,
-                "total_combinations": len(guideline_names) * len(fidelity_modes)
+                "total_combinations": len(guideline_names) * len(fidelity_modes),
+                "rebuilt": self.manifest.rebuilt,
+                "up_to_date": self.manifest.up_to_date
             },
             guidelines_tested=guideline_names,
             fidelity_modes_tested=fidelity_modes,
@@ -612,6 +650,7 @@ def main():
     parser.add_argument("--output-dir", help="Output directory for reports")
     parser.add_argument("--comprehensive-report", action="store_true", default=True, help="Generate comprehensive report")
     parser.add_argument("--per-guideline-reports", action="store_true", default=True, help="Generate per-guideline reports")
+    parser.add_argument("--force", action="store_true", help="Re-run every test, even those the build manifest reports as up to date")
 
     args = parser.parse_args()
 
@@ -621,7 +660,7 @@ def main():
     output_dir = Path(args.output_dir) if args.output_dir else None
 
     # Create framework and run tests
-    framework = FidelityTestingFramework(output_dir)
+    framework = FidelityTestingFramework(output_dir, force=args.force)
 
     try:
         report = framework.run_comprehensive_test(guideline_names, fidelity_modes)
@@ -27,6 +27,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "poc" / "cikg-processor"))
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from poc_bdd_generator import BDDGenerator, ClinicalScenario
+from gherkin_parser import GherkinParser, Feature
 from poc_cikg_processor import CIKGProcessor
 from guideline_analyzer import GuidelineAnalyzer, CDSUsageScenario
 
@@ -149,6 +150,7 @@ class AIValidationMCPService:
         self.bdd_generator = BDDGenerator()
         self.cikg_processor = CIKGProcessor()
         self.guideline_analyzer = GuidelineAnalyzer()
+        self.gherkin_parser = GherkinParser()
         
         # Test repository (in production, would be database)
         self.test_repository: Dict[str, BDDTest] = {}
@@ -204,63 +206,50 @@ class AIValidationMCPService:
             for test in tests:
                 self.test_repository[test.test_id] = test
     
+    def load_feature_files(self, directory: str, metadata: Optional[Dict] = None) -> int:
+        """
+        Add the scenarios of every .feature file under a directory to the repository
+        
+        Args:
+            directory: Directory searched recursively (e.g. examples/bdd-tests/scenarios)
+            metadata: Clinical context shared by the loaded tests
+            
+        Returns:
+            Number of tests added
+        """
+        paths = sorted(Path(directory).rglob("*.feature"))
+        added = 0
+        for feature in self.gherkin_parser.parse_files(paths):
+            for test in self._feature_to_tests(feature, metadata or {}):
+                self.test_repository[test.test_id] = test
+                added += 1
+        return added
+    
     def _parse_gherkin_to_tests(self, gherkin: str, metadata: Dict) -> List[BDDTest]:
         """Parse Gherkin text into structured BDDTest objects"""
+        return self._feature_to_tests(self.gherkin_parser.parse(gherkin), metadata)
+    
+    def _feature_to_tests(self, feature: Feature, metadata: Dict) -> List[BDDTest]:
+        """One BDDTest per scenario; Background Given steps precede each scenario's own"""
+        background_given = feature.background.step_texts("given") if feature.background else []
+        first_number = len(self.test_repository) + 1
         tests = []
-        lines = gherkin.split('\n')
-        
-        current_scenario = None
-        current_given = []
-        current_when = ""
-        current_then = []
-        current_tags = []
-        feature_name = ""
         
-        for line in lines:
-            line = line.strip()
-            
-            if line.startswith('Feature:'):
-                feature_name = line.replace('Feature:', '').strip()
-            elif line.startswith('@'):
-                current_tags = [tag.strip() for tag in line.split() if tag.startswith('@')]
-            elif line.startswith('Scenario:'):
-                # Save previous scenario
-                if current_scenario:
-                    test = self._create_bdd_test(
-                        feature_name, current_scenario, current_tags,
-                        current_given, current_when, current_then, metadata
-                    )
-                    tests.append(test)
-                
-                # Start new scenario
-                current_scenario = line.replace('Scenario:', '').strip()
-                current_given = []
-                current_when = ""
-                current_then = []
-            elif line.startswith('Given ') or line.startswith('And ') and current_scenario and not current_when:
-                step = line.replace('Given ', '').replace('And ', '').strip()
-                current_given.append(step)
-            elif line.startswith('When '):
-                current_when = line.replace('When ', '').strip()
-            elif line.startswith('Then ') or line.startswith('And ') and current_when:
-                step = line.replace('Then ', '').replace('And ', '').strip()
-                current_then.append(step)
-        
-        # Save last scenario
-        if current_scenario:
+        for index, scenario in enumerate(feature.scenarios):
             test = self._create_bdd_test(
-                feature_name, current_scenario, current_tags,
-                current_given, current_when, current_then, metadata
+                f"test_{first_number + index:04d}", feature.name, scenario.name, scenario.tags,
+                background_given + scenario.step_texts("given"),
+                " AND ".join(scenario.step_texts("when")),
+                scenario.step_texts("then"), metadata
             )
             tests.append(test)
         
         return tests
     
-    def _create_bdd_test(self, feature: str, scenario: str, tags: List[str],
+    def _create_bdd_test(self, test_id: str, feature: str, scenario: str, tags: List[str],
                         given_steps: List[str], when_step: str, then_steps: List[str],
                         metadata: Dict) -> BDDTest:
         """Create structured BDDTest from parsed Gherkin"""
-        test_id = f"test_{len(self.test_repository) + 1:04d}"
         scenario_type = "positive" if "@positive" in tags else "negative"
         
         # Extract expected outcome from then steps
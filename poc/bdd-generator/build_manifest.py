@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Build Manifest POC - Incremental Regeneration of Generated Outputs
+
+Records, for each generated target (a scenario's feature file and companion
+outputs), the SHA-256 of its inputs, the version of the generator that built
+it and the SHA-256 of every output file. A target is up to date when its
+inputs hash the same, the generator version is unchanged and every recorded
+output is still on disk with the recorded content; pipelines skip up-to-date
+targets and rebuild the rest, like a build system.
+
+The manifest is a JSON file written atomically:
+
+    {
+      "manifest_version": 1,
+      "targets": {
+        "<key>": {
+          "input_hash": "...",
+          "generator_version": "...",
+          "outputs": {"<path relative to root>": "<sha256>"},
+          "built_at": "<ISO timestamp>"
+        }
+      }
+    }
+
+Author: GitHub Copilot
+Date: 2025-11-09
+"""
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from feature_writer import write_atomic
+
+# Bump when the manifest layout changes; manifests of other versions are ignored
+MANIFEST_VERSION = 1
+
+
+def content_hash(data: Union[str, bytes]) -> str:
+    """SHA-256 hex digest of text (UTF-8) or bytes"""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha256(data).hexdigest()
+
+
+def input_hash(*inputs: Any) -> str:
+    """SHA-256 of JSON-serializable inputs, independent of dict key order"""
+    return content_hash(json.dumps(inputs, sort_keys=True, separators=(',', ':'), default=str))
+
+
+def source_version(*paths: Union[str, Path]) -> str:
+    """
+    Generator version derived from the generator's source files
+
+    Any edit to one of the files changes the version, so outputs are rebuilt
+    without anyone having to remember to bump a version number.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(Path(path).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+@dataclass
+class ManifestEntry:
+    """Inputs, generator version and outputs of one built target"""
+    input_hash: str
+    generator_version: str
+    outputs: Dict[str, str] = field(default_factory=dict)
+    built_at: str = ""
+
+
+class BuildManifest:
+    """
+    Tracks built targets so unchanged ones can be skipped
+
+    Output paths are stored relative to root (default: the manifest's
+    directory). Call is_current() before building a target, record() after
+    building it, and save() when done; rebuilt and up_to_date list the keys
+    seen in this run.
+    """
+
+    FILE_NAME = "build-manifest.json"
+
+    def __init__(self, path: Union[str, Path], generator_version: str,
+                 root: Optional[Union[str, Path]] = None, force: bool = False):
+        """
+        Args:
+            path: Manifest file (created on save)
+            generator_version: Version of the generator building the targets
+            root: Directory output paths are relative to (default: the manifest's directory)
+            force: Treat every target as out of date
+        """
+        self.path = Path(path)
+        self.generator_version = generator_version
+        self.root = Path(root) if root is not None else self.path.parent
+        self.force = force
+        self.entries: Dict[str, ManifestEntry] = self._load()
+        self.rebuilt: List[str] = []
+        self.up_to_date: List[str] = []
+
+    def _load(self) -> Dict[str, ManifestEntry]:
+        """Read the manifest; a missing, unreadable or other-version manifest is empty"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("manifest_version") != MANIFEST_VERSION:
+                return {}
+            return {key: ManifestEntry(**entry) for key, entry in data["targets"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            return {}
+
+    def is_current(self, key: str, inputs_digest: str) -> bool:
+        """
+        Whether a target is up to date; up-to-date targets are added to up_to_date
+
+        Args:
+            key: Target key
+            inputs_digest: input_hash() of everything the target is built from
+        """
+        entry = self.entries.get(key)
+        current = (
+            not self.force
+            and entry is not None
+            and entry.input_hash == inputs_digest
+            and entry.generator_version == self.generator_version
+            and self._outputs_unchanged(entry)
+        )
+        if current:
+            self.up_to_date.append(key)
+        return current
+
+    def _outputs_unchanged(self, entry: ManifestEntry) -> bool:
+        """Whether every recorded output exists with its recorded content"""
+        for relative, digest in entry.outputs.items():
+            try:
+                if content_hash((self.root / relative).read_bytes()) != digest:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def outputs(self, key: str) -> List[Path]:
+        """Recorded output paths of a target"""
+        entry = self.entries.get(key)
+        return [self.root / relative for relative in entry.outputs] if entry else []
+
+    def record(self, key: str, inputs_digest: str, outputs: Iterable[Union[str, Path]]):
+        """
+        Record a freshly built target, hashing its output files
+
+        Args:
+            key: Target key
+            inputs_digest: input_hash() of everything the target was built from
+            outputs: Files the build wrote (under root)
+        """
+        hashes = {}
+        for output in outputs:
+            output = Path(output)
+            hashes[output.relative_to(self.root).as_posix()] = content_hash(output.read_bytes())
+        self.entries[key] = ManifestEntry(
+            input_hash=inputs_digest,
+            generator_version=self.generator_version,
+            outputs=hashes,
+            built_at=datetime.now().isoformat()
+        )
+        self.rebuilt.append(key)
+
+    def save(self, fsync: bool = True) -> Path:
+        """Write the manifest atomically"""
+        data = {
+            "manifest_version": MANIFEST_VERSION,
+            "targets": {key: asdict(entry) for key, entry in sorted(self.entries.items())}
+        }
+        return write_atomic(self.path, json.dumps(data, indent=2) + "\n", fsync=fsync)
+
+    def summary(self) -> str:
+        """One-line report of this run's rebuilt and up-to-date targets"""
+        return f"{len(self.rebuilt)} rebuilt, {len(self.up_to_date)} up to date"
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Feature Output POC - Sharded, Atomic Feature File Writer
+
+Writes generated feature files (and companion files such as .assert.yaml or
+.fsh) into an output directory, routing classified files into the trees used
+by examples/bdd-tests:
+
+    by-domain/<domain>/<name>
+    by-fidelity/<fidelity>/<name>
+    by-mode/<mode>/<name>
+
+Items are rendered and written in batches across worker processes. Each file
+is written to a temporary file in its destination directory and renamed into
+place, so a crash never leaves a partial file behind, and fsyncs are issued
+once per batch instead of after every file.
+
+Author: GitHub Copilot
+Date: 2025-11-09
+"""
+
+import os
+import secrets
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
+
+# Temporary files are created like open() would: mode 0666, less the umask
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+
+@dataclass
+class FeatureFile:
+    """A generated file and the classification used to route it"""
+    name: str
+    content: str
+    domain: Optional[str] = None
+    fidelity: Optional[str] = None
+    mode: Optional[str] = None
+
+
+class FeatureWriter:
+    """
+    Writes feature files atomically, in parallel, into classification trees
+
+    A file with a domain, fidelity or mode is written into the matching
+    tree(s); a file with none of them is written directly into output_dir.
+    File names should be unique within a write: when two files share a
+    destination, which one ends up on disk depends on worker scheduling.
+    """
+
+    # Tree directory -> FeatureFile attribute it is keyed by
+    TREES = {'by-domain': 'domain', 'by-fidelity': 'fidelity', 'by-mode': 'mode'}
+
+    # Files per worker task, and per fsync
+    BATCH_SIZE = 64
+
+    def __init__(self, output_dir: Union[str, Path], workers: Optional[int] = None,
+                 batch_size: Optional[int] = None, fsync: bool = True):
+        """
+        Args:
+            output_dir: Root directory for the written files
+            workers: Worker processes (default: CPU count); 0 or 1 runs in-process
+            batch_size: Files per worker task and fsync batch
+            fsync: Flush files and directories to disk before returning
+        """
+        self.output_dir = Path(output_dir)
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.batch_size = batch_size or self.BATCH_SIZE
+        self.fsync = fsync
+
+    def destinations(self, feature: FeatureFile) -> List[Path]:
+        """Paths a feature file is written to"""
+        paths = []
+        for tree, attribute in self.TREES.items():
+            value = getattr(feature, attribute)
+            if value:
+                paths.append(self.output_dir / tree / value / feature.name)
+        return paths or [self.output_dir / feature.name]
+
+    def write(self, items: Iterable[Any],
+              render: Optional[Callable[[Any], FeatureFile]] = None) -> List[Path]:
+        """
+        Render and write feature files
+
+        Items are consumed lazily in batches with at most two batches per
+        worker in flight. When render is given it is called on each item in
+        the worker process, so it must be a picklable (module-level)
+        function when running with more than one worker.
+
+        Args:
+            items: FeatureFile objects, or inputs for render
+            render: Optional function turning an item into a FeatureFile
+
+        Returns:
+            Written paths, in input order
+        """
+        items = iter(items)
+        batches = iter(lambda: list(islice(items, self.batch_size)), [])
+        paths: List[Path] = []
+
+        if self.workers <= 1:
+            for batch in batches:
+                paths.extend(_write_batch(self, render, batch))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                pending = deque()
+                for batch in batches:
+                    pending.append(executor.submit(_write_batch, self, render, batch))
+                    if len(pending) >= self.workers * 2:
+                        paths.extend(pending.popleft().result())
+                while pending:
+                    paths.extend(pending.popleft().result())
+
+        return paths
+
+    def _write_files(self, features: List[FeatureFile]) -> List[Path]:
+        """Write a batch of files via temporary files, fsyncing once for the batch"""
+        pending: List[Tuple[Path, Path]] = []
+        open_fds: List[int] = []
+        written: List[Path] = []
+        try:
+            for feature in features:
+                data = feature.content.encode('utf-8')
+                for path in self.destinations(feature):
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    temp_path = path.parent / f".{path.name}.{secrets.token_hex(8)}.tmp"
+                    fd = os.open(temp_path, _TEMP_FLAGS, 0o666)
+                    open_fds.append(fd)
+                    pending.append((temp_path, path))
+                    _write_all(fd, data)
+
+            if self.fsync:
+                for fd in open_fds:
+                    os.fsync(fd)
+            while open_fds:
+                os.close(open_fds.pop())
+            for temp_path, path in pending:
+                os.replace(temp_path, path)
+                written.append(path)
+
+            if self.fsync:
+                # Make the renames durable, once per directory
+                for directory in dict.fromkeys(path.parent for path in written):
+                    _fsync_directory(directory)
+        except BaseException:
+            for fd in open_fds:
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            for temp_path, path in pending[len(written):]:
+                try:
+                    os.unlink(temp_path)
+                except OSError:
+                    pass
+            raise
+
+        return written
+
+
+def write_atomic(path: Union[str, Path], content: str, fsync: bool = True) -> Path:
+    """Write a single file through a temporary file and rename"""
+    path = Path(path)
+    writer = FeatureWriter(path.parent, workers=1, fsync=fsync)
+    return writer.write([FeatureFile(name=path.name, content=content)])[0]
+
+
+def _write_batch(writer: FeatureWriter, render: Optional[Callable[[Any], FeatureFile]],
+                 batch: List[Any]) -> List[Path]:
+    """Render and write one batch (runs in a worker process when parallel)"""
+    features = [render(item) for item in batch] if render else batch
+    return writer._write_files(features)
+
+
+def _write_all(fd: int, data: bytes):
+    """os.write until all of data is written"""
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _fsync_directory(directory: Path):
+    """fsync a directory so renames within it survive a crash (POSIX only)"""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return
+    fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+"""
+Gherkin Parser POC - Shared Gherkin Parser with an On-Disk AST Cache
+
+Parses Gherkin feature text into a compact AST (Feature, Scenario, Step,
+Examples) in which every node records its 1-based line and the character
+offset of its keyword in the source. And/But/* steps are resolved to the
+kind (given/when/then) of the step they continue.
+
+GherkinParser can cache parsed features in a SQLite file keyed by the
+SHA-256 of the source, so re-loading an unchanged corpus is a hash and a
+cache read per file. The cache is opt-in (cache_path or GHERKIN_CACHE_PATH):
+for features the size of those in examples/bdd-tests, parsing is about as
+fast as decoding a cached AST, so it pays off only for large feature files.
+
+Supported: Feature, Background, Scenario/Example, Scenario Outline with
+Examples, tags, descriptions, data tables and doc strings. Rule: headers
+(with their tags and description) are accepted and their scenarios are
+listed with the feature's.
+
+Author: GitHub Copilot
+Date: 2025-11-09
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bump when the AST changes so cached parses from older versions are ignored
+PARSER_VERSION = 1
+
+# Parse cache used by GherkinParser() unless another path is given
+DEFAULT_CACHE_PATH = os.environ.get('GHERKIN_CACHE_PATH') or None
+
+# Step keyword -> kind; None continues the previous step's kind
+_STEP_KINDS = {'Given': 'given', 'When': 'when', 'Then': 'then', 'And': None, 'But': None, '*': None}
+
+_SCENARIO_KEYWORDS = {'Scenario', 'Example', 'Scenario Outline', 'Scenario Template'}
+_EXAMPLES_KEYWORDS = {'Examples', 'Scenarios'}
+_HEADER_KEYWORDS = {'Feature', 'Background', 'Rule'} | _SCENARIO_KEYWORDS | _EXAMPLES_KEYWORDS
+
+_DOC_STRING_DELIMITERS = ('"""', '```')
+
+
+class GherkinSyntaxError(ValueError):
+    """Raised for text that is not a valid Gherkin feature"""
+
+    def __init__(self, message: str, line: Optional[int] = None):
+        super().__init__(f"line {line}: {message}" if line else message)
+        self.line = line
+
+
+@dataclass
+class Step:
+    """A step; kind is given, when or then (And/But/* resolved)"""
+    keyword: str
+    kind: str
+    text: str
+    line: int
+    offset: int
+    table: Optional[List[List[str]]] = None
+    doc_string: Optional[str] = None
+
+
+@dataclass
+class Examples:
+    """Examples table of a Scenario Outline (first row is the header)"""
+    keyword: str
+    name: str
+    tags: List[str]
+    line: int
+    offset: int
+    description: str = ""
+    table: Optional[List[List[str]]] = None
+
+
+@dataclass
+class Scenario:
+    """A Scenario, Scenario Outline or Background"""
+    keyword: str
+    name: str
+    tags: List[str]
+    line: int
+    offset: int
+    description: str = ""
+    steps: List[Step] = field(default_factory=list)
+    examples: List[Examples] = field(default_factory=list)
+
+    def step_texts(self, kind: str) -> List[str]:
+        """Texts of the steps of one kind (given, when or then)"""
+        return [step.text for step in self.steps if step.kind == kind]
+
+    def to_data(self) -> list:
+        """Nested lists in field order, as stored in the parse cache"""
+        return [self.keyword, self.name, self.tags, self.line, self.offset, self.description,
+                [[step.keyword, step.kind, step.text, step.line, step.offset, step.table, step.doc_string]
+                 for step in self.steps],
+                [[examples.keyword, examples.name, examples.tags, examples.line, examples.offset,
+                  examples.description, examples.table]
+                 for examples in self.examples]]
+
+    @classmethod
+    def from_data(cls, data: list) -> 'Scenario':
+        keyword, name, tags, line, offset, description, steps, examples = data
+        return cls(keyword, name, tags, line, offset, description,
+                   [Step(*step) for step in steps], [Examples(*example) for example in examples])
+
+
+@dataclass
+class _Rule:
+    """A Rule header; only parsed so its description lines are accepted"""
+    name: str
+    description: str = ""
+
+
+@dataclass
+class Feature:
+    """Root of a parsed feature file"""
+    name: str
+    tags: List[str]
+    line: int
+    offset: int
+    description: str = ""
+    background: Optional[Scenario] = None
+    scenarios: List[Scenario] = field(default_factory=list)
+
+    def to_data(self) -> list:
+        """Nested lists in field order, as stored in the parse cache"""
+        return [self.name, self.tags, self.line, self.offset, self.description,
+                self.background.to_data() if self.background else None,
+                [scenario.to_data() for scenario in self.scenarios]]
+
+    @classmethod
+    def from_data(cls, data: list) -> 'Feature':
+        name, tags, line, offset, description, background, scenarios = data
+        return cls(name, tags, line, offset, description,
+                   Scenario.from_data(background) if background else None,
+                   [Scenario.from_data(scenario) for scenario in scenarios])
+
+
+def parse(text: str) -> Feature:
+    """
+    Parse Gherkin text into a Feature (no caching)
+
+    Raises:
+        GherkinSyntaxError: If the text is not a valid feature
+    """
+    feature: Optional[Feature] = None
+    tags: List[str] = []
+    scenario: Optional[Scenario] = None   # Scenario or Background receiving steps
+    described = None                      # Node receiving description lines
+    table_owner = None                    # Step or Examples receiving table rows
+    kind = None                           # Kind of the previous step
+    doc_lines: Optional[List[str]] = None
+    doc_delimiter = doc_indent = None
+    line_offset = 0
+
+    for number, raw in enumerate(text.splitlines(keepends=True), 1):
+        start = line_offset
+        line_offset += len(raw)
+        line = raw.strip()
+
+        if doc_lines is not None:
+            if line == doc_delimiter:
+                table_owner.doc_string = "\n".join(doc_lines)
+                doc_lines = None
+                table_owner = None
+            else:
+                content = raw.rstrip('\r\n')
+                indent = len(content) - len(content.lstrip())
+                doc_lines.append(content[min(indent, doc_indent):])
+            continue
+
+        if not line or line[0] == '#':
+            continue
+
+        column = len(raw) - len(raw.lstrip())
+        first = line[0]
+
+        if first == '@':
+            for token in line.split():
+                if token[0] == '#':
+                    break
+                tags.append(token)
+            continue
+
+        if first == '|':
+            if table_owner is None:
+                raise GherkinSyntaxError("table row without a step or Examples", number)
+            if table_owner.table is None:
+                table_owner.table = []
+            table_owner.table.append([cell.strip() for cell in line.strip('|').split('|')])
+            continue
+
+        if line.startswith(_DOC_STRING_DELIMITERS):
+            if not isinstance(table_owner, Step):
+                raise GherkinSyntaxError("doc string without a step", number)
+            doc_lines, doc_delimiter, doc_indent = [], line[:3], column
+            continue
+
+        word, _, rest = line.partition(' ')
+        if scenario is not None and word in _STEP_KINDS:
+            kind = _STEP_KINDS[word] or kind or 'given'
+            step = Step(word, kind, rest.strip(), number, start + column)
+            scenario.steps.append(step)
+            table_owner = step
+            described = None
+            continue
+
+        keyword, colon, name = line.partition(':')
+        if colon and keyword in _HEADER_KEYWORDS:
+            name = name.strip()
+            offset = start + column
+            table_owner = None
+            if keyword == 'Feature':
+                if feature is not None:
+                    raise GherkinSyntaxError("more than one Feature", number)
+                feature = described = Feature(name, tags, number, offset)
+            elif feature is None:
+                raise GherkinSyntaxError(f"{keyword} before Feature", number)
+            elif keyword == 'Background':
+                scenario = described = Scenario(keyword, name, [], number, offset)
+                feature.background = scenario
+            elif keyword in _SCENARIO_KEYWORDS:
+                scenario = described = Scenario(keyword, name, tags, number, offset)
+                feature.scenarios.append(scenario)
+            elif keyword in _EXAMPLES_KEYWORDS:
+                if scenario is None or scenario.keyword == 'Background':
+                    raise GherkinSyntaxError("Examples outside a Scenario Outline", number)
+                examples = described = table_owner = Examples(keyword, name, tags, number, offset)
+                scenario.examples.append(examples)
+            else:
+                # Rule: later scenarios belong to the feature
+                scenario = None
+                described = _Rule(name)
+            tags = []
+            kind = None
+            continue
+
+        if described is None:
+            raise GherkinSyntaxError(f"unexpected line: {line}", number)
+        described.description = f"{described.description}\n{line}" if described.description else line
+
+    if doc_lines is not None:
+        raise GherkinSyntaxError("unterminated doc string")
+    if feature is None:
+        raise GherkinSyntaxError("no Feature found")
+    return feature
+
+
+class ParseCache:
+    """
+    SQLite store of parsed features keyed by source hash
+
+    Entries written by another PARSER_VERSION are treated as missing.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS features (
+        digest TEXT PRIMARY KEY,
+        version INTEGER NOT NULL,
+        data TEXT NOT NULL
+    );
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def get_many(self, digests: Iterable[str]) -> Dict[str, list]:
+        """Cached AST data by digest; missing digests are omitted"""
+        digests = list(digests)
+        found = {}
+        with self._lock:
+            # Stay below SQLite's default host parameter limit
+            for i in range(0, len(digests), 500):
+                chunk = digests[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT digest, data FROM features WHERE version = ? "
+                    f"AND digest IN ({','.join('?' * len(chunk))})", [PARSER_VERSION] + chunk
+                )
+                found.update((digest, json.loads(data)) for digest, data in rows)
+        return found
+
+    def put_many(self, entries: Dict[str, list]):
+        """Store AST data by digest in a single transaction"""
+        if not entries:
+            return
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO features (digest, version, data) VALUES (?, ?, ?)",
+                [(digest, PARSER_VERSION, json.dumps(data, ensure_ascii=False, separators=(',', ':')))
+                 for digest, data in entries.items()]
+            )
+
+
+class GherkinParser:
+    """
+    Gherkin parser with an optional on-disk parse cache
+
+    Every call returns new Feature objects, so callers may modify them.
+    """
+
+    # Files read, hashed and looked up per cache query
+    BATCH_SIZE = 1000
+
+    def __init__(self, cache_path: Optional[Union[str, Path]] = DEFAULT_CACHE_PATH):
+        """
+        Args:
+            cache_path: SQLite parse cache (default: GHERKIN_CACHE_PATH);
+                None parses without caching
+        """
+        self.cache: Optional[ParseCache] = None
+        self.cache_hits = 0
+        self.cache_misses = 0
+        if cache_path is not None:
+            try:
+                self.cache = ParseCache(cache_path)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Gherkin parse cache unavailable at {cache_path}: {e}")
+
+    def parse(self, text: str) -> Feature:
+        """Parse Gherkin text, using the cache when available"""
+        return self._parse_sources([text.encode('utf-8')])[0]
+
+    def parse_file(self, path: Union[str, Path]) -> Feature:
+        """Parse a .feature file"""
+        return self.parse_files([path])[0]
+
+    def parse_files(self, paths: Iterable[Union[str, Path]]) -> List[Feature]:
+        """
+        Parse feature files, in order
+
+        Files are read and hashed in batches with one cache query per
+        batch; only files whose content is not cached are parsed.
+
+        Raises:
+            GherkinSyntaxError: Naming the first file that fails to parse
+        """
+        paths = [Path(path) for path in paths]
+        features: List[Feature] = []
+        for i in range(0, len(paths), self.BATCH_SIZE):
+            batch = paths[i:i + self.BATCH_SIZE]
+            features.extend(self._parse_sources([path.read_bytes() for path in batch], batch))
+        return features
+
+    def _parse_sources(self, sources: List[bytes], paths: Optional[List[Path]] = None) -> List[Feature]:
+        if self.cache is None:
+            self.cache_misses += len(sources)
+            return [self._parse_source(source, paths and paths[index]) for index, source in enumerate(sources)]
+
+        digests = [hashlib.sha256(source).hexdigest() for source in sources]
+        cached = self.cache.get_many(set(digests))
+
+        parsed: Dict[str, list] = {}
+        for index, (digest, source) in enumerate(zip(digests, sources)):
+            if digest not in cached and digest not in parsed:
+                parsed[digest] = self._parse_source(source, paths and paths[index]).to_data()
+
+        self.cache.put_many(parsed)
+        self.cache_misses += len(parsed)
+        self.cache_hits += len(sources) - len(parsed)
+
+        cached.update(parsed)
+        return [Feature.from_data(cached[digest]) for digest in digests]
+
+    @staticmethod
+    def _parse_source(source: bytes, path: Optional[Path] = None) -> Feature:
+        try:
+            return parse(source.decode('utf-8'))
+        except GherkinSyntaxError as e:
+            if path is None:
+                raise
+            raise GherkinSyntaxError(f"{path}: {e}") from e
@@ -10,11 +10,15 @@ Date: 2025-11-09
 """
 
 import json
+import re
 import sys
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from dataclasses import dataclass
 from pathlib import Path
 
+from feature_writer import FeatureFile, FeatureWriter, write_atomic
+
 
 @dataclass
 class ClinicalScenario:
@@ -25,6 +29,16 @@ class ClinicalScenario:
     context: str
     contraindications: Optional[List[str]] = None
     expected_outcome: Optional[str] = None
+    # Classification used to route generated files into the by-domain,
+    # by-fidelity and by-mode trees
+    domain: Optional[str] = None
+    fidelity: Optional[str] = None
+    mode: Optional[str] = None
+
+
+def _compile_template(template: str, fields: tuple) -> str:
+    """Replace named {field} placeholders with their position in fields"""
+    return re.sub(r'\{(\w+)\}', lambda match: '{%d}' % fields.index(match.group(1)), template)
 
 
 class BDDGenerator:
@@ -37,6 +51,39 @@ class BDDGenerator:
     - Clinical terminology and realistic assertions
     """
     
+    # Feature template with both scenarios. It is compiled once into a
+    # positional format string (fields numbered in FEATURE_FIELDS order), so
+    # rendering a feature is a single str.format call
+    FEATURE_TEMPLATE = (
+        "Feature: {name}\n"
+        "\n"
+        "  @positive @treatment\n"
+        "  Scenario: Patient with {condition} receives appropriate treatment\n"
+        "    Given a patient with {condition}\n"
+        "{context_steps}"
+        "{contraindication_step}"
+        "    When the {algorithm} algorithm is applied\n"
+        "    Then {action} should be initiated\n"
+        "    And {outcome}\n"
+        "\n"
+        "  @negative @treatment\n"
+        "  Scenario: Patient with {negative_condition} receives no treatment\n"
+        "    Given a patient with {negative_condition}\n"
+        "    When the {algorithm} algorithm is applied\n"
+        "    Then no treatment should be initiated\n"
+        "    And the patient should be monitored for changes"
+    )
+    FEATURE_FIELDS = ('name', 'condition', 'context_steps', 'contraindication_step',
+                      'algorithm', 'action', 'outcome', 'negative_condition')
+    
+    CONTEXT_STEP_TEMPLATE = "    And the patient is {}\n"
+    CONTRAINDICATION_STEP_TEMPLATE = "    And the patient has no contraindications for {}\n"
+    DEFAULT_OUTCOME = "the intervention should be documented in the medical record"
+    
+    _render_feature = _compile_template(FEATURE_TEMPLATE, FEATURE_FIELDS).format
+    _render_context_step = CONTEXT_STEP_TEMPLATE.format
+    _render_contraindication_step = CONTRAINDICATION_STEP_TEMPLATE.format
+    
     def __init__(self):
         self.scenarios_generated = 0
     
@@ -50,96 +97,110 @@ class BDDGenerator:
         Returns:
             str: Valid Gherkin feature text
         """
-        feature_lines = []
-        
-        # Feature header
-        feature_lines.append(f"Feature: {scenario.scenario}")
-        feature_lines.append("")
-        
-        # Positive scenario
-        positive = self._generate_positive_scenario(scenario)
-        feature_lines.extend(positive)
-        feature_lines.append("")
-        
-        # Negative scenario
-        negative = self._generate_negative_scenario(scenario)
-        feature_lines.extend(negative)
-        
+        feature = self._render(scenario)
         self.scenarios_generated += 2
         
-        return "\n".join(feature_lines)
+        return feature
     
-    def _generate_positive_scenario(self, scenario: ClinicalScenario) -> List[str]:
-        """Generate positive test case (expected behavior)"""
-        lines = []
-        
-        # Extract key terms from condition
-        condition_text = self._format_condition(scenario.condition)
-        action_text = self._format_action(scenario.action)
-        
-        lines.append("  @positive @treatment")
-        lines.append(f"  Scenario: Patient with {condition_text} receives appropriate treatment")
-        
-        # Given steps (setup)
-        lines.append(f"    Given a patient with {condition_text}")
-        
-        if scenario.context:
-            context_parts = scenario.context.split(',')
-            for part in context_parts:
-                lines.append(f"    And the patient is {part.strip()}")
-        
-        if scenario.contraindications:
-            lines.append(f"    And the patient has no contraindications for {action_text}")
-        
-        # When step (action)
-        algorithm_name = self._get_algorithm_name(scenario.scenario)
-        lines.append(f"    When the {algorithm_name} algorithm is applied")
-        
-        # Then steps (assertions)
-        lines.append(f"    Then {action_text} should be initiated")
-        
-        if scenario.expected_outcome:
-            lines.append(f"    And {scenario.expected_outcome}")
-        else:
-            lines.append("    And the intervention should be documented in the medical record")
-        
-        return lines
+    def _render(self, scenario: ClinicalScenario) -> str:
+        """Render a scenario's feature text without counting it"""
+        action = self._format_action(scenario.action)
+        
+        # Positional arguments in FEATURE_FIELDS order
+        return self._render_feature(
+            scenario.scenario,
+            self._format_condition(scenario.condition),
+            self._context_steps(scenario.context) if scenario.context else "",
+            self._render_contraindication_step(action) if scenario.contraindications else "",
+            self._get_algorithm_name(scenario.scenario),
+            action,
+            scenario.expected_outcome or self.DEFAULT_OUTCOME,
+            self._create_negative_condition(scenario.condition)
+        )
     
-    def _generate_negative_scenario(self, scenario: ClinicalScenario) -> List[str]:
-        """Generate negative test case (boundary condition)"""
-        lines = []
-        
-        # Create opposite condition
-        negative_condition = self._create_negative_condition(scenario.condition)
-        action_text = self._format_action(scenario.action)
-        
-        lines.append("  @negative @treatment")
-        lines.append(f"  Scenario: Patient with {negative_condition} receives no treatment")
-        
-        # Given steps (setup with opposite condition)
-        lines.append(f"    Given a patient with {negative_condition}")
-        
-        # When step (same algorithm)
-        algorithm_name = self._get_algorithm_name(scenario.scenario)
-        lines.append(f"    When the {algorithm_name} algorithm is applied")
+    def generate_features(self, scenarios: Iterable[Union[ClinicalScenario, Dict]],
+                          output_dir: Union[str, Path], workers: Optional[int] = None,
+                          fsync: bool = True) -> List[Path]:
+        """
+        Generate and write a feature file for each scenario
         
-        # Then steps (no action taken)
-        lines.append("    Then no treatment should be initiated")
-        lines.append("    And the patient should be monitored for changes")
+        Scenarios are rendered and written in batches across worker
+        processes by FeatureWriter, each file atomically. Files are named
+        after the scenario's algorithm name; repeated names in a batch get a
+        numeric suffix. Scenarios with a domain, fidelity or mode are written
+        into each matching by-domain/by-fidelity/by-mode tree under
+        output_dir, the rest directly into output_dir.
         
-        return lines
+        Args:
+            scenarios: ClinicalScenario objects or JSON dictionaries
+            output_dir: Root directory for the .feature files (created if missing)
+            workers: Worker processes (default: CPU count); 0 or 1 runs in-process
+            fsync: Flush the written files to disk
+            
+        Returns:
+            Paths of the written feature files in input order, one per tree
+            destination (a scenario routed into two trees has two paths)
+        """
+        writer = FeatureWriter(output_dir, workers=workers, fsync=fsync)
+        return writer.write(self._named_scenarios(scenarios), render=self._feature_file)
+    
+    def _named_scenarios(self, scenarios: Iterable[Union[ClinicalScenario, Dict]]) -> Iterator[Tuple[str, ClinicalScenario]]:
+        """Pair each scenario with a feature file name unique within the batch"""
+        used_names = set()
+        next_suffix: Dict[str, int] = {}
+        
+        for scenario in scenarios:
+            if not isinstance(scenario, ClinicalScenario):
+                scenario = self._scenario_from_json(scenario)
+            
+            # Suffixes can collide with real names ("HTN", "HTN", "HTN 2"), so
+            # check the final name rather than counting stems
+            stem = self._feature_file_stem(scenario.scenario)
+            suffix = next_suffix.get(stem, 1)
+            name = f"{stem}.feature" if suffix == 1 else f"{stem}_{suffix}.feature"
+            while name in used_names:
+                suffix += 1
+                name = f"{stem}_{suffix}.feature"
+            next_suffix[stem] = suffix + 1
+            used_names.add(name)
+            # Positive and negative scenario per feature, as in generate_feature
+            self.scenarios_generated += 2
+            yield name, scenario
+    
+    def _feature_file(self, named_scenario: Tuple[str, ClinicalScenario]) -> FeatureFile:
+        """FeatureFile for a named scenario (runs in FeatureWriter workers)"""
+        name, scenario = named_scenario
+        return FeatureFile(name=name, content=self._render(scenario), domain=scenario.domain,
+                           fidelity=scenario.fidelity, mode=scenario.mode)
     
-    def _format_condition(self, condition: str) -> str:
+    # Formatting helpers are pure functions of their text and memoized, since
+    # coverage sweeps render the same conditions and actions many times
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _context_steps(context: str) -> str:
+        """Given-steps for each comma-separated part of the context"""
+        return "".join(
+            BDDGenerator.CONTEXT_STEP_TEMPLATE.format(part.strip()) for part in context.split(',')
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _format_condition(condition: str) -> str:
         """Format condition text for readability in Gherkin"""
         # Simple formatting - replace comparison operators
         formatted = condition.replace('>=', 'of').replace('>', 'above').replace('<=', 'below')
         return formatted.lower()
     
-    def _format_action(self, action: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _format_action(action: str) -> str:
         """Format action text for Gherkin"""
         return action.lower()
     
-    def _create_negative_condition(self, condition: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _create_negative_condition(condition: str) -> str:
         """Create opposite/normal condition for negative test"""
         # Simple logic to create opposite condition
         if '>=' in condition:
@@ -159,10 +220,32 @@ class BDDGenerator:
         
         return "normal " + condition.split()[0] if condition else "normal values"
     
-    def _get_algorithm_name(self, scenario_name: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _get_algorithm_name(scenario_name: str) -> str:
         """Extract algorithm name from scenario"""
         return scenario_name.lower().replace(' ', '_')
     
+    @staticmethod
+    def _feature_file_stem(scenario_name: str) -> str:
+        """File-system safe feature file name for a scenario"""
+        return re.sub(r'[\W_]+', '_', scenario_name.lower()).strip('_') or "feature"
+    
+    @staticmethod
+    def _scenario_from_json(json_data: Dict) -> ClinicalScenario:
+        """ClinicalScenario from a JSON dictionary, with the same defaults as generate_from_json"""
+        return ClinicalScenario(
+            scenario=json_data.get('scenario', 'Clinical Scenario'),
+            condition=json_data.get('condition', ''),
+            action=json_data.get('action', ''),
+            context=json_data.get('context', ''),
+            contraindications=json_data.get('contraindications'),
+            expected_outcome=json_data.get('expected_outcome'),
+            domain=json_data.get('domain'),
+            fidelity=json_data.get('fidelity'),
+            mode=json_data.get('mode')
+        )
+    
     def generate_from_json(self, json_data: Dict) -> str:
         """
         Generate Gherkin from JSON input
@@ -173,16 +256,7 @@ class BDDGenerator:
         Returns:
             str: Generated Gherkin feature
         """
-        scenario = ClinicalScenario(
-            scenario=json_data.get('scenario', 'Clinical Scenario'),
-            condition=json_data.get('condition', ''),
-            action=json_data.get('action', ''),
-            context=json_data.get('context', ''),
-            contraindications=json_data.get('contraindications'),
-            expected_outcome=json_data.get('expected_outcome')
-        )
-        
-        return self.generate_feature(scenario)
+        return self.generate_feature(self._scenario_from_json(json_data))
     
     def generate_from_file(self, input_path: Path, output_path: Optional[Path] = None) -> str:
         """
@@ -209,8 +283,7 @@ class BDDGenerator:
         gherkin = self.generate_from_json(scenario_data)
         
         if output_path:
-            with open(output_path, 'w') as f:
-                f.write(gherkin)
+            write_atomic(output_path, gherkin)
             print(f"✓ Generated Gherkin feature saved to: {output_path}")
         
         return gherkin
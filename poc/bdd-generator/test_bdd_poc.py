@@ -192,6 +192,78 @@ class TestBDDGenerator(unittest.TestCase):
         except Exception as e:
             self.fail(f"Generator raised unexpected exception: {e}")
 
+    def test_rendered_feature_text(self):
+        """Test the compiled template renders the exact feature text"""
+        scenario = ClinicalScenario(
+            scenario="Diabetes Management",
+            condition="HbA1c >= 7.0 %",
+            action="Initiate Metformin",
+            context="adult, newly diagnosed",
+            contraindications=["renal failure"]
+        )
+
+        expected = (
+            "Feature: Diabetes Management\n"
+            "\n"
+            "  @positive @treatment\n"
+            "  Scenario: Patient with hba1c of 7.0 % receives appropriate treatment\n"
+            "    Given a patient with hba1c of 7.0 %\n"
+            "    And the patient is adult\n"
+            "    And the patient is newly diagnosed\n"
+            "    And the patient has no contraindications for initiate metformin\n"
+            "    When the diabetes_management algorithm is applied\n"
+            "    Then initiate metformin should be initiated\n"
+            "    And the intervention should be documented in the medical record\n"
+            "\n"
+            "  @negative @treatment\n"
+            "  Scenario: Patient with HbA1c of 5.6 % receives no treatment\n"
+            "    Given a patient with HbA1c of 5.6 %\n"
+            "    When the diabetes_management algorithm is applied\n"
+            "    Then no treatment should be initiated\n"
+            "    And the patient should be monitored for changes"
+        )
+        self.assertEqual(self.generator.generate_feature(scenario), expected)
+
+    def test_generate_features_batch(self):
+        """Test batch generation writes one feature file per scenario"""
+        import tempfile
+
+        scenarios = [
+            ClinicalScenario(scenario="Hypertension Management", condition="BP >= 140",
+                             action="start therapy", context=""),
+            {"scenario": "Hypertension Management", "condition": "BP >= 160", "action": "escalate"},
+            {"scenario": "Lipids / LDL", "condition": "LDL > 190", "action": "start statin",
+             "domain": "cardiology", "fidelity": "low"},
+        ]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp) / "features"
+            paths = self.generator.generate_features(iter(scenarios), root, workers=2)
+
+            self.assertEqual([p.relative_to(root).as_posix() for p in paths], [
+                "hypertension_management.feature",
+                "hypertension_management_2.feature",
+                "by-domain/cardiology/lipids_ldl.feature",
+                "by-fidelity/low/lipids_ldl.feature",
+            ])
+            self.assertEqual(paths[1].read_text(), BDDGenerator().generate_from_json(scenarios[1]))
+
+        self.assertEqual(self.generator.scenarios_generated, 6)
+
+    def test_generate_features_unique_names(self):
+        """Test numeric suffixes never collide with another scenario's name"""
+        import tempfile
+
+        scenarios = [{"scenario": name, "condition": "BP >= 140", "action": "start therapy"}
+                     for name in ["HTN", "HTN", "HTN 2", "HTN"]]
+
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = self.generator.generate_features(scenarios, tmp, workers=1, fsync=False)
+
+            self.assertEqual([p.name for p in paths],
+                             ["htn.feature", "htn_2.feature", "htn_2_2.feature", "htn_3.feature"])
+            self.assertEqual(len(list(Path(tmp).iterdir())), 4)
+
 
 def run_tests():
     """Run all tests and report results"""
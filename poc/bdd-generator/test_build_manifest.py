@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Test suite for the incremental-regeneration build manifest
+"""
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+import build_manifest
+from build_manifest import BuildManifest, input_hash, source_version
+
+
+class TestBuildManifest(unittest.TestCase):
+    """Test cases for BuildManifest"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.path = self.root / BuildManifest.FILE_NAME
+        self.digest = input_hash("clinical text", {"scenario": "AFib", "action": "start DOAC"}, "treatment")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def build(self, manifest, key="cardiology/afib", content="Feature: AFib\n"):
+        """Write a target's output and record it"""
+        output = self.root / "run" / f"{key.replace('/', '_')}.feature"
+        output.parent.mkdir(exist_ok=True)
+        output.write_text(content)
+        manifest.record(key, self.digest, [output])
+        return output
+
+    def test_unchanged_target_is_up_to_date(self):
+        """Test a recorded target is skipped by the next run and reported"""
+        first = BuildManifest(self.path, "v1")
+        self.assertFalse(first.is_current("cardiology/afib", self.digest))
+        self.build(first)
+        first.save()
+        self.assertEqual((first.rebuilt, first.summary()), (["cardiology/afib"], "1 rebuilt, 0 up to date"))
+
+        second = BuildManifest(self.path, "v1")
+        self.assertTrue(second.is_current("cardiology/afib", self.digest))
+        self.assertEqual(second.up_to_date, ["cardiology/afib"])
+        self.assertEqual(second.outputs("cardiology/afib"), [self.root / "run" / "cardiology_afib.feature"])
+
+        data = json.loads(self.path.read_text())
+        self.assertEqual(list(data["targets"]["cardiology/afib"]["outputs"]), ["run/cardiology_afib.feature"])
+
+    def test_changes_trigger_rebuild(self):
+        """Test changed inputs, generator version or outputs make a target out of date"""
+        manifest = BuildManifest(self.path, "v1")
+        output = self.build(manifest)
+        self.build(manifest, key="oncology/breast")
+        manifest.save()
+
+        self.assertFalse(BuildManifest(self.path, "v1").is_current("cardiology/afib", input_hash("changed text")))
+        self.assertFalse(BuildManifest(self.path, "v2").is_current("cardiology/afib", self.digest))
+        self.assertFalse(BuildManifest(self.path, "v1", force=True).is_current("cardiology/afib", self.digest))
+
+        output.write_text("Feature: edited by hand\n")
+        reloaded = BuildManifest(self.path, "v1")
+        self.assertFalse(reloaded.is_current("cardiology/afib", self.digest))
+        self.assertTrue(reloaded.is_current("oncology/breast", self.digest))
+
+        output.unlink()
+        self.assertFalse(BuildManifest(self.path, "v1").is_current("cardiology/afib", self.digest))
+
+    def test_unreadable_manifest_rebuilds_everything(self):
+        """Test a corrupt or other-version manifest is treated as empty"""
+        self.path.write_text("{not json")
+        self.assertEqual(BuildManifest(self.path, "v1").entries, {})
+
+        self.path.write_text(json.dumps({"manifest_version": build_manifest.MANIFEST_VERSION + 1, "targets": {}}))
+        self.assertEqual(BuildManifest(self.path, "v1").entries, {})
+
+    def test_hashes(self):
+        """Test input hashes ignore dict order and source versions follow file content"""
+        self.assertEqual(input_hash({"a": 1, "b": [2]}, "x"), input_hash({"b": [2], "a": 1}, "x"))
+        self.assertNotEqual(input_hash({"a": 1}, "x"), input_hash({"a": 2}, "x"))
+
+        source = self.root / "generator.py"
+        source.write_text("VERSION = 1\n")
+        version = source_version(source)
+        self.assertEqual(source_version(source), version)
+        source.write_text("VERSION = 2\n")
+        self.assertNotEqual(source_version(source), version)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test suite for the sharded, atomic feature file writer
+"""
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from feature_writer import FeatureFile, FeatureWriter, write_atomic
+
+
+def render_numbered(index):
+    """Render function for the tests (module-level so workers can unpickle it)"""
+    return FeatureFile(name=f"feature-{index:03d}.feature", content=f"Feature: {index}\n",
+                       domain=("cardiology", "oncology")[index % 2], fidelity="high")
+
+
+def render_failing(index):
+    """Render function that fails part way through a batch"""
+    if index == 2:
+        raise ValueError("render failed")
+    return FeatureFile(name=f"feature-{index}.feature", content="Feature: partial\n")
+
+
+class TestFeatureWriter(unittest.TestCase):
+    """Test cases for FeatureWriter"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_routes_files_into_trees(self):
+        """Test classified files go into each matching tree, others into the root"""
+        writer = FeatureWriter(self.root, workers=1)
+        paths = writer.write([
+            FeatureFile("afib.feature", "Feature: AFib\n", domain="cardiology", fidelity="high", mode="expert"),
+            FeatureFile("notes.feature", "Feature: Notes\n"),
+        ])
+
+        self.assertEqual([p.relative_to(self.root).as_posix() for p in paths], [
+            "by-domain/cardiology/afib.feature",
+            "by-fidelity/high/afib.feature",
+            "by-mode/expert/afib.feature",
+            "notes.feature",
+        ])
+        self.assertEqual(paths[2].read_text(), "Feature: AFib\n")
+        umask = os.umask(0)
+        os.umask(umask)
+        self.assertEqual(paths[0].stat().st_mode & 0o777, 0o666 & ~umask)
+
+    def test_parallel_matches_serial(self):
+        """Test worker processes write the same files, returned in input order"""
+        serial = FeatureWriter(self.root / "serial", workers=1, fsync=False).write(range(50), render_numbered)
+        parallel = FeatureWriter(self.root / "parallel", workers=3, batch_size=4).write(
+            iter(range(50)), render_numbered
+        )
+
+        self.assertEqual([p.relative_to(self.root / "serial") for p in serial],
+                         [p.relative_to(self.root / "parallel") for p in parallel])
+        self.assertEqual(len(parallel), 100)
+        self.assertTrue(all(p.read_text() == s.read_text() for p, s in zip(parallel, serial)))
+
+    def test_failed_batch_leaves_no_partial_files(self):
+        """Test a failure leaves earlier batches in place and no temporary files"""
+        writer = FeatureWriter(self.root, workers=1, batch_size=2)
+
+        with self.assertRaises(ValueError):
+            writer.write(range(4), render_failing)
+
+        self.assertEqual(sorted(p.name for p in self.root.iterdir()),
+                         ["feature-0.feature", "feature-1.feature"])
+
+    def test_write_atomic_replaces_file(self):
+        """Test write_atomic replaces existing content in one step"""
+        path = self.root / "nested" / "scenario.feature"
+        write_atomic(path, "Feature: old\n")
+        write_atomic(path, "Feature: new\n")
+
+        self.assertEqual(path.read_text(), "Feature: new\n")
+        self.assertEqual(os.listdir(path.parent), ["scenario.feature"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Test suite for the shared Gherkin parser and its parse cache
+"""
+
+import tempfile
+import unittest
+from pathlib import Path
+
+import gherkin_parser
+from gherkin_parser import GherkinParser, GherkinSyntaxError, parse
+from poc_bdd_generator import BDDGenerator, ClinicalScenario
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[2] / "examples" / "bdd-tests"
+
+FEATURE_TEXT = '''# Clinical Scenario ID: test-001
+@cardiology
+Feature: Anticoagulation
+  As a clinical decision support system
+  I want to recommend anticoagulation
+
+  Background:
+    Given a patient with atrial fibrillation
+
+  @positive
+  Scenario: High stroke risk
+    And CHA2DS2-VASc score >= 2
+    When the algorithm is applied
+    And bleeding risk is assessed
+    But no contraindication is found
+    Then recommend a DOAC
+    And document the rationale
+
+  Scenario Outline: Dosing by renal function
+    Given creatinine clearance of <crcl>
+    When apixaban is selected
+    Then the dose is <dose>
+      """
+      See label dosing
+      """
+
+    @renal
+    Examples: Common cases
+      | crcl | dose   |
+      | 60   | 5 mg   |
+      | 20   | 2.5 mg |
+'''
+
+
+class TestGherkinParser(unittest.TestCase):
+    """Test cases for parse()"""
+
+    def test_step_kinds_follow_previous_step(self):
+        """Test And/But steps take the kind of the step they continue"""
+        scenario = parse(FEATURE_TEXT).scenarios[0]
+
+        self.assertEqual([(step.keyword, step.kind) for step in scenario.steps], [
+            ("And", "given"), ("When", "when"), ("And", "when"), ("But", "when"),
+            ("Then", "then"), ("And", "then"),
+        ])
+        self.assertEqual(scenario.step_texts("when"), [
+            "the algorithm is applied", "bleeding risk is assessed", "no contraindication is found",
+        ])
+
+    def test_structure_and_source_positions(self):
+        """Test feature structure, tags and line/offset positions"""
+        feature = parse(FEATURE_TEXT)
+
+        self.assertEqual((feature.name, feature.tags, feature.line), ("Anticoagulation", ["@cardiology"], 3))
+        self.assertEqual(feature.description.splitlines()[0], "As a clinical decision support system")
+        self.assertEqual(feature.background.step_texts("given"), ["a patient with atrial fibrillation"])
+        self.assertEqual([s.tags for s in feature.scenarios], [["@positive"], []])
+
+        outline = feature.scenarios[1]
+        self.assertEqual(outline.keyword, "Scenario Outline")
+        self.assertEqual(outline.steps[-1].doc_string, "See label dosing")
+        self.assertEqual(outline.examples[0].tags, ["@renal"])
+        self.assertEqual(outline.examples[0].table, [["crcl", "dose"], ["60", "5 mg"], ["20", "2.5 mg"]])
+
+        for node in [feature, feature.background, *feature.scenarios, *outline.steps, outline.examples[0]]:
+            line = FEATURE_TEXT.splitlines()[node.line - 1]
+            self.assertEqual(FEATURE_TEXT[node.offset:].split("\n", 1)[0], line.strip())
+
+    def test_generated_features(self):
+        """Test BDDGenerator output parses into its positive and negative scenarios"""
+        gherkin = BDDGenerator().generate_feature(ClinicalScenario(
+            scenario="Hypertension Management",
+            condition="systolic BP >= 140 mmHg",
+            action="initiate ACE inhibitor therapy",
+            context="adult patient, no contraindications",
+            expected_outcome="And blood pressure is rechecked"
+        ))
+        positive, negative = parse(gherkin).scenarios
+
+        self.assertEqual(positive.tags, ["@positive", "@treatment"])
+        self.assertEqual(len(positive.step_texts("given")), 3)
+        self.assertEqual(positive.step_texts("then")[-1], "And blood pressure is rechecked")
+        self.assertEqual(negative.step_texts("when"), ["the hypertension_management algorithm is applied"])
+
+    def test_example_corpus_parses(self):
+        """Test every feature under examples/bdd-tests parses with scenarios"""
+        paths = sorted(EXAMPLES_DIR.rglob("*.feature"))
+        if not paths:
+            self.skipTest("examples/bdd-tests not found")
+
+        for path, feature in zip(paths, GherkinParser(cache_path=None).parse_files(paths)):
+            self.assertTrue(feature.scenarios, path)
+
+    def test_rules(self):
+        """Test Rule headers accept tags and descriptions, and their scenarios join the feature"""
+        feature = parse(
+            "Feature: F\n"
+            "  Rule: R\n"
+            "    Some description\n"
+            "    spanning two lines\n"
+            "\n"
+            "    Scenario: A\n"
+            "      Given x\n"
+            "\n"
+            "  @rule-tag\n"
+            "  Rule: S\n"
+            "    @scenario-tag\n"
+            "    Scenario: B\n"
+            "      Given y\n"
+            "    Scenario: C\n"
+            "      Given z\n"
+        )
+
+        self.assertEqual(feature.description, "")
+        self.assertEqual([(s.name, s.tags) for s in feature.scenarios],
+                         [("A", []), ("B", ["@scenario-tag"]), ("C", [])])
+        self.assertEqual(feature.scenarios[2].step_texts("given"), ["z"])
+
+    def test_syntax_errors(self):
+        """Test invalid text raises GherkinSyntaxError with the line number"""
+        with self.assertRaises(GherkinSyntaxError) as error:
+            parse("Feature: A\n  Scenario: B\n    Given x\n  stray text\n")
+        self.assertEqual(error.exception.line, 4)
+
+        for text in ["", "Scenario: before feature", "Feature: A\n  | a | b |\n"]:
+            with self.assertRaises(GherkinSyntaxError):
+                parse(text)
+
+
+class TestParseCache(unittest.TestCase):
+    """Test cases for the on-disk parse cache"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.cache_path = self.root / "cache" / "gherkin.sqlite"
+        self.paths = []
+        for i in range(3):
+            path = self.root / f"feature_{i}.feature"
+            path.write_text(FEATURE_TEXT if i < 2 else FEATURE_TEXT.replace("Anticoagulation", "Other"))
+            self.paths.append(path)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_reload_reads_from_cache(self):
+        """Test unchanged content is served from the cache with an identical AST"""
+        first = GherkinParser(self.cache_path)
+        features = first.parse_files(self.paths)
+        self.assertEqual((first.cache_hits, first.cache_misses), (1, 2))
+
+        second = GherkinParser(self.cache_path)
+        self.assertEqual(second.parse_files(self.paths), features)
+        self.assertEqual((second.cache_hits, second.cache_misses), (3, 0))
+        self.assertEqual(features, GherkinParser(cache_path=None).parse_files(self.paths))
+
+        # Changed content is parsed again
+        self.paths[0].write_text(FEATURE_TEXT.replace("High stroke risk", "Changed"))
+        self.assertEqual(second.parse_file(self.paths[0]).scenarios[0].name, "Changed")
+        self.assertEqual(second.cache_misses, 1)
+
+    def test_other_parser_versions_are_ignored(self):
+        """Test cached entries from another parser version are re-parsed"""
+        GherkinParser(self.cache_path).parse_files(self.paths)
+        original = gherkin_parser.PARSER_VERSION
+        gherkin_parser.PARSER_VERSION = original + 1
+        try:
+            parser = GherkinParser(self.cache_path)
+            parser.parse_files(self.paths)
+            self.assertEqual(parser.cache_hits, 1)
+        finally:
+            gherkin_parser.PARSER_VERSION = original
+
+    def test_errors_name_the_file(self):
+        """Test parse errors from files include the path"""
+        bad = self.root / "bad.feature"
+        bad.write_text("Given no feature\n")
+
+        with self.assertRaises(GherkinSyntaxError) as error:
+            GherkinParser(self.cache_path).parse_files(self.paths + [bad])
+        self.assertIn("bad.feature", str(error.exception))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -15,10 +15,15 @@ Author: GitHub Copilot
 Date: 2025-11-09
 """
 
+import argparse
 import json
+import os
 import re
 import sys
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 
@@ -30,6 +35,10 @@ class ClinicalEntity:
     entity_type: str  # condition, measurement, medication, action
     value: Optional[str] = None
     unit: Optional[str] = None
+    comparator: Optional[str] = None  # measurements only: >, >=, <, ...
+    start: Optional[int] = None  # character offsets into the source text
+    end: Optional[int] = None
+    sentence_id: Optional[int] = None  # index into the non-empty sentences
 
 
 @dataclass
@@ -46,6 +55,20 @@ class GSRLTriple:
     confidence: float = 1.0
 
 
+@dataclass
+class TokenizedDocument:
+    """
+    Result of the single tokenization pass over a clinical text
+    
+    Shared by every CIKG layer so the text is only scanned once.
+    """
+    text: str
+    tokens: List[Tuple[int, int]]  # (start, end) of every token
+    sentences: List[Tuple[int, int]]  # (start, end) of each non-empty sentence
+    entities: List[ClinicalEntity]
+    periods: int  # sentence terminators seen, including decimal points
+
+
 @dataclass
 class CIKGOutput:
     """Complete CIKG processing output"""
@@ -69,9 +92,13 @@ class CIKGProcessor:
         r'(elevated \w+|high \w+|low \w+)'
     ]
     
+    # Measurements are a name, a comparator and a value with optional unit
+    COMPARATOR_PATTERN = r'[><=]+'
+    MEASUREMENT_VALUE_PATTERN = r'\s*(\d+\.?\d*)\s*(%|mmHg|mg/dL|mmol/L)?'
+    
     MEASUREMENT_PATTERNS = [
         r'(HbA1c|blood pressure|BP|systolic|diastolic|glucose|cholesterol|creatinine)',
-        r'(\w+)\s*([><=]+)\s*(\d+\.?\d*)\s*(%|mmHg|mg/dL|mmol/L)?'
+        r'(\w+)\s*(' + COMPARATOR_PATTERN + ')' + MEASUREMENT_VALUE_PATTERN
     ]
     
     MEDICATION_PATTERNS = [
@@ -84,6 +111,48 @@ class CIKGProcessor:
         r'(should be|must be|shall be)'
     ]
     
+    # Entity types in output order, with the patterns that find them
+    _ENTITY_FAMILIES = [
+        ("condition", CONDITION_PATTERNS),
+        ("measurement", []),  # anchored on comparator tokens instead
+        ("medication", MEDICATION_PATTERNS),
+        ("action", ACTION_PATTERNS),
+    ]
+    
+    # One pass over the text: entity keywords are tried at each token start,
+    # then comparators, sentence-ending periods and any other word or
+    # punctuation run, so every non-whitespace character is in some token
+    _TOKEN_REGEX = re.compile(
+        '|'.join(
+            [f'(?P<{entity_type}_{i}>{pattern})'
+             for entity_type, patterns in _ENTITY_FAMILIES
+             for i, pattern in enumerate(patterns)] +
+            [f'(?P<comparator>{COMPARATOR_PATTERN})', r'(?P<period>\.)', r'\w+|[^\w\s.><=]+']
+        ),
+        re.IGNORECASE
+    )
+    _MEASUREMENT_VALUE_REGEX = re.compile(MEASUREMENT_VALUE_PATTERN, re.IGNORECASE)
+    
+    # Sort key of each entity group, so entities list as if each pattern ran in turn
+    _ENTITY_GROUPS = {
+        f"{entity_type}_{i}": (entity_type, (family, i))
+        for family, (entity_type, patterns) in enumerate(_ENTITY_FAMILIES)
+        for i in range(len(patterns))
+    }
+    
+    # Each entity pattern on its own, for keywords overlapping a token the
+    # combined regex consumed (e.g. "stroke" inside "high stroke")
+    _KEYWORD_REGEXES = [
+        (f"{entity_type}_{i}", re.compile(pattern, re.IGNORECASE))
+        for entity_type, patterns in _ENTITY_FAMILIES
+        for i, pattern in enumerate(patterns)
+    ]
+    _WORD_START_REGEX = re.compile(r'(?<!\w)\w')
+    _MEASUREMENT_RANK = ([entity_type for entity_type, _ in _ENTITY_FAMILIES].index("measurement"), 0)
+    
+    # Documents per worker task in streaming mode
+    STREAM_BATCH_SIZE = 32
+    
     def __init__(self):
         self.entities_extracted = 0
         self.triples_generated = 0
@@ -98,96 +167,160 @@ class CIKGProcessor:
         Returns:
             CIKGOutput with L0 and L1 representations
         """
+        document = self.tokenize(clinical_text)
+        
         # Layer 0: Store original text
-        layer0 = self._create_layer0(clinical_text)
+        layer0 = self._create_layer0(document)
         
         # Layer 1: Extract entities and generate GSRL triples
-        entities = self._extract_entities(clinical_text)
-        triples = self._generate_gsrl_triples(clinical_text, entities)
+        entities = document.entities
+        self.entities_extracted += len(entities)
+        triples = self._generate_gsrl_triples(document)
         
+        # Entity and triple fields are all scalars, so a shallow copy matches asdict
         layer1 = {
-            "entities": [asdict(e) for e in entities],
-            "triples": [asdict(t) for t in triples]
+            "entities": [dict(vars(e)) for e in entities],
+            "triples": [dict(vars(t)) for t in triples]
         }
         
         return CIKGOutput(layer0=layer0, layer1=layer1)
     
-    def _create_layer0(self, text: str) -> Dict:
+    def _create_layer0(self, document: TokenizedDocument) -> Dict:
         """Create Layer 0 representation (prose)"""
         return {
-            "text": text,
-            "length": len(text),
-            "sentences": len(text.split('.')),
+            "text": document.text,
+            "length": len(document.text),
+            "sentences": document.periods + 1,
             "source": "clinical_guideline"
         }
     
-    def _extract_entities(self, text: str) -> List[ClinicalEntity]:
-        """Extract clinical entities from text"""
-        entities = []
-        
-        # Extract conditions
-        for pattern in self.CONDITION_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                entity = ClinicalEntity(
-                    text=match.group(1),
-                    entity_type="condition"
-                )
-                entities.append(entity)
-                self.entities_extracted += 1
-        
-        # Extract measurements with values
-        measurement_pattern = r'(\w+)\s*([><=]+)\s*(\d+\.?\d*)\s*(%|mmHg|mg/dL|mmol/L)?'
-        matches = re.finditer(measurement_pattern, text, re.IGNORECASE)
-        for match in matches:
-            entity = ClinicalEntity(
-                text=match.group(1),
-                entity_type="measurement",
-                value=match.group(3),
-                unit=match.group(4) if match.lastindex >= 4 else None
-            )
-            entities.append(entity)
-            self.entities_extracted += 1
-        
-        # Extract medications
-        for pattern in self.MEDICATION_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                entity = ClinicalEntity(
-                    text=match.group(1) if match.lastindex >= 1 else match.group(0),
-                    entity_type="medication"
-                )
-                entities.append(entity)
-                self.entities_extracted += 1
-        
-        # Extract actions
-        for pattern in self.ACTION_PATTERNS:
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                entity = ClinicalEntity(
-                    text=match.group(1) if match.lastindex >= 1 else match.group(0),
-                    entity_type="action"
-                )
-                entities.append(entity)
-                self.entities_extracted += 1
-        
-        return entities
-    
-    def _generate_gsrl_triples(self, text: str, entities: List[ClinicalEntity]) -> List[GSRLTriple]:
+    def tokenize(self, text: str) -> TokenizedDocument:
+        """
+        Segment text into tokens, sentences and clinical entities in one pass
+        
+        Sentences are the non-empty, whitespace-stripped pieces between
+        periods. Condition, medication and action keywords are matched at
+        token starts; measurements are the word before a comparator and the
+        value after it. As when each pattern ran over the text in turn,
+        matches of different patterns may overlap ("high stroke" and
+        "stroke") but matches of one pattern never do.
+        """
+        tokens = []
+        sentences = []
+        ranked_entities = []
+        # End of the last match of each entity group
+        group_ends: Dict[str, int] = {}
+        sentence_start = None
+        periods = 0
+        
+        for match in self._TOKEN_REGEX.finditer(text):
+            start, end = match.span()
+            kind = match.lastgroup
+            
+            if kind == "period":
+                periods += 1
+                if sentence_start is not None:
+                    sentences.append((sentence_start, tokens[-1][1]))
+                    sentence_start = None
+                tokens.append((start, end))
+                continue
+            
+            if sentence_start is None:
+                sentence_start = start
+            sentence_id = len(sentences)
+            
+            if kind == "comparator":
+                entity = self._measurement_at(text, tokens, match, sentence_id)
+                if entity:
+                    ranked_entities.append((self._MEASUREMENT_RANK, entity))
+            elif kind is not None:
+                self._add_keyword(text, kind, start, end, sentence_id, ranked_entities, group_ends)
+                # Other patterns matching at the token's word starts
+                for word in self._WORD_START_REGEX.finditer(text, start, end):
+                    for group, regex in self._KEYWORD_REGEXES:
+                        if group == kind:
+                            continue
+                        overlap = regex.match(text, word.start())
+                        if overlap:
+                            self._add_keyword(text, group, overlap.start(), overlap.end(), sentence_id,
+                                              ranked_entities, group_ends)
+            tokens.append((start, end))
+        
+        if sentence_start is not None:
+            sentences.append((sentence_start, tokens[-1][1]))
+        
+        # Stable sort keeps text order within each pattern
+        ranked_entities.sort(key=lambda ranked: ranked[0])
+        return TokenizedDocument(
+            text=text,
+            tokens=tokens,
+            sentences=sentences,
+            entities=[entity for _, entity in ranked_entities],
+            periods=periods
+        )
+    
+    def _add_keyword(self, text: str, group: str, start: int, end: int, sentence_id: int,
+                     ranked_entities: List[Tuple[Tuple[int, int], ClinicalEntity]], group_ends: Dict[str, int]):
+        """Add a keyword entity unless it overlaps the previous match of its pattern"""
+        if start < group_ends.get(group, 0):
+            return
+        group_ends[group] = end
+        entity_type, rank = self._ENTITY_GROUPS[group]
+        ranked_entities.append((rank, ClinicalEntity(
+            text=text[start:end],
+            entity_type=entity_type,
+            start=start,
+            end=end,
+            sentence_id=sentence_id
+        )))
+    
+    def _measurement_at(self, text: str, tokens: List[Tuple[int, int]], comparator,
+                        sentence_id: int) -> Optional[ClinicalEntity]:
+        """Measurement around a comparator token, if it has a name and a value"""
+        if not tokens or not _is_word_char(text[tokens[-1][1] - 1]):
+            return None
+        value = self._MEASUREMENT_VALUE_REGEX.match(text, comparator.end())
+        if not value:
+            return None
+        # The name is the word run ending at the previous token
+        end = tokens[-1][1]
+        start = end - 1
+        while start > 0 and _is_word_char(text[start - 1]):
+            start -= 1
+        return ClinicalEntity(
+            text=text[start:end],
+            entity_type="measurement",
+            value=value.group(1),
+            unit=value.group(2),
+            comparator=comparator.group(),
+            start=start,
+            end=end,
+            sentence_id=sentence_id
+        )
+    
+    def _generate_gsrl_triples(self, document: TokenizedDocument) -> List[GSRLTriple]:
         """
-        Generate GSRL triples from text and entities
+        Generate GSRL triples from a tokenized document
         
         GSRL = Guideline-Situation-Recommendation-Logic
+        
+        Each decision sentence only sees the entities extracted from it, so
+        the work is linear in the text length.
         """
+        text = document.text
         triples = []
         
-        # Simple heuristic: Look for sentence patterns
-        sentences = [s.strip() for s in text.split('.') if s.strip()]
+        # Group entities by sentence, keeping extraction order
+        entities_by_sentence: Dict[int, List[ClinicalEntity]] = {}
+        for entity in document.entities:
+            entities_by_sentence.setdefault(entity.sentence_id, []).append(entity)
         
-        for sentence in sentences:
+        # Simple heuristic: Look for sentence patterns
+        for sentence_id, (start, end) in enumerate(document.sentences):
+            sentence = text[start:end]
             # Look for conditional patterns (if/when -> then/should)
             if self._is_decision_sentence(sentence):
-                triple = self._extract_gsrl_from_sentence(sentence, entities)
+                triple = self._extract_gsrl_from_sentence(sentence, entities_by_sentence.get(sentence_id, []))
                 if triple:
                     triples.append(triple)
                     self.triples_generated += 1
@@ -203,7 +336,7 @@ class CIKGProcessor:
         return any(keyword in sentence.lower() for keyword in decision_keywords)
     
     def _extract_gsrl_from_sentence(self, sentence: str, entities: List[ClinicalEntity]) -> Optional[GSRLTriple]:
-        """Extract GSRL triple from a single sentence"""
+        """Extract GSRL triple from a single sentence and the entities found in it"""
         # Extract guideline context
         guideline = self._extract_guideline_context(sentence)
         
@@ -241,14 +374,11 @@ class CIKGProcessor:
         conditions = []
         measurements = []
         
-        # Find relevant entities in this sentence
         for entity in entities:
-            if entity.text.lower() in sentence.lower():
-                if entity.entity_type == "condition":
-                    conditions.append(entity.text)
-                elif entity.entity_type == "measurement" and entity.value:
-                    comp = self._extract_comparison(sentence, entity.text)
-                    measurements.append(f"{entity.text} {comp} {entity.value}")
+            if entity.entity_type == "condition":
+                conditions.append(entity.text)
+            elif entity.entity_type == "measurement" and entity.value:
+                measurements.append(f"{entity.text} {entity.comparator or '>'} {entity.value}")
         
         # Combine into situation string
         parts = conditions + measurements
@@ -260,11 +390,10 @@ class CIKGProcessor:
         medications = []
         
         for entity in entities:
-            if entity.text.lower() in sentence.lower():
-                if entity.entity_type == "action":
-                    actions.append(entity.text)
-                elif entity.entity_type == "medication":
-                    medications.append(entity.text)
+            if entity.entity_type == "action":
+                actions.append(entity.text)
+            elif entity.entity_type == "medication":
+                medications.append(entity.text)
         
         # Combine action + medication
         if actions and medications:
@@ -287,15 +416,6 @@ class CIKGProcessor:
         else:
             return "clinical_judgment_required"
     
-    def _extract_comparison(self, sentence: str, measurement: str) -> str:
-        """Extract comparison operator near measurement"""
-        # Look for >= <= > < near the measurement
-        pattern = f"{measurement}\\s*([><=]+)"
-        match = re.search(pattern, sentence, re.IGNORECASE)
-        if match:
-            return match.group(1)
-        return ">"
-    
     def process_from_file(self, input_path: Path, output_path: Optional[Path] = None) -> CIKGOutput:
         """
         Process clinical text from file
@@ -328,17 +448,139 @@ class CIKGProcessor:
         
         return result
 
+    
+    def process_jsonl(self, input_path: Path, output_path: Path, workers: Optional[int] = None,
+                      batch_size: Optional[int] = None) -> Dict[str, int]:
+        """
+        Stream a JSONL file of clinical texts through the processor
+        
+        Each input line is a JSON object with a "text" field (and optionally
+        an "id") or a JSON string. One output line is written per input
+        line, in input order, with the document's "id" (its line number if
+        none is given) and its layer0/layer1 output, or an "error".
+        
+        Lines are read lazily and processed in batches across worker
+        processes with at most two batches per worker in flight, so memory
+        use does not grow with the corpus.
+        
+        Args:
+            input_path: JSONL input file
+            output_path: JSONL output file
+            workers: Worker processes (default: CPU count); 0 or 1 runs in-process
+            batch_size: Documents per worker task
+            
+        Returns:
+            Summary with document, error, entity and triple counts
+        """
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        batch_size = batch_size or self.STREAM_BATCH_SIZE
+        summary = {"documents": 0, "errors": 0, "entities": 0, "triples": 0}
+        
+        with open(input_path, 'r', encoding='utf-8') as infile, \
+                open(output_path, 'w', encoding='utf-8') as outfile:
+            lines = _iter_jsonl_lines(infile)
+            batches = iter(lambda: list(islice(lines, batch_size)), [])
+            
+            def write_batch(results: List[Tuple[str, int, int, bool]]):
+                for line, entities, triples, failed in results:
+                    outfile.write(line)
+                    outfile.write('\n')
+                    summary["documents"] += 1
+                    summary["errors"] += failed
+                    summary["entities"] += entities
+                    summary["triples"] += triples
+            
+            if workers <= 1:
+                for batch in batches:
+                    write_batch(_process_batch(batch, self))
+            else:
+                with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+                    pending = deque()
+                    for batch in batches:
+                        pending.append(executor.submit(_process_batch, batch))
+                        if len(pending) >= workers * 2:
+                            write_batch(pending.popleft().result())
+                    while pending:
+                        write_batch(pending.popleft().result())
+        
+        if workers > 1:
+            # Worker processes kept their own counters
+            self.entities_extracted += summary["entities"]
+            self.triples_generated += summary["triples"]
+        
+        return summary
+
+
+def _is_word_char(char: str) -> bool:
+    """Whether a character is matched by the regex \\w class"""
+    return char.isalnum() or char == '_'
+
+
+def _iter_jsonl_lines(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """Non-blank lines with their 1-based line numbers"""
+    for line_number, line in enumerate(lines, start=1):
+        if line.strip():
+            yield line_number, line
+
+
+# Processor used by streaming worker processes
+_worker_processor: Optional[CIKGProcessor] = None
+
+
+def _init_worker():
+    """Create the worker process's processor"""
+    global _worker_processor
+    _worker_processor = CIKGProcessor()
+
+
+def _process_batch(batch: List[Tuple[int, str]],
+                   processor: Optional[CIKGProcessor] = None) -> List[Tuple[str, int, int, bool]]:
+    """
+    Process a batch of (line_number, JSONL line)
+    
+    Returns:
+        (output JSON line, entity count, triple count, failed) per input line
+    """
+    processor = processor or _worker_processor
+    results = []
+    for line_number, line in batch:
+        record: Dict[str, Any] = {"id": line_number}
+        try:
+            data = json.loads(line)
+            if isinstance(data, dict):
+                record["id"] = data.get("id", line_number)
+                clinical_text = data.get('text', str(data))
+            else:
+                clinical_text = data if isinstance(data, str) else str(data)
+            result = processor.process_text(clinical_text)
+        except Exception as e:
+            record["error"] = str(e)
+            results.append((json.dumps(record), 0, 0, True))
+            continue
+        # layer0/layer1 are plain JSON structures already; skip asdict's deep copy
+        record["layer0"] = result.layer0
+        record["layer1"] = result.layer1
+        results.append((json.dumps(record), len(result.layer1["entities"]),
+                        len(result.layer1["triples"]), False))
+    return results
+
 
 def main():
     """Command-line interface for CIKG Processor POC"""
-    if len(sys.argv) < 2:
-        print("Usage: python poc_cikg_processor.py <input.json> [output.json]")
-        print("\nExample:")
-        print("  python poc_cikg_processor.py clinical_texts.json cikg_output.json")
-        sys.exit(1)
+    parser = argparse.ArgumentParser(
+        description="CIKG Processor POC: transform clinical text (L0) into GSRL triples (L1)",
+        epilog="Example: python poc_cikg_processor.py clinical_texts.json cikg_output.json"
+    )
+    parser.add_argument("input", type=Path, help="Input JSON file, or JSONL file of many texts")
+    parser.add_argument("output", type=Path, nargs="?", help="Output JSON/JSONL file")
+    parser.add_argument("--jsonl", action="store_true",
+                        help="Stream JSONL input (implied by a .jsonl input file)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for JSONL input (default: CPU count)")
+    args = parser.parse_args()
     
-    input_file = Path(sys.argv[1])
-    output_file = Path(sys.argv[2]) if len(sys.argv) > 2 else None
+    input_file = args.input
+    output_file = args.output
     
     if not input_file.exists():
         print(f"Error: Input file not found: {input_file}")
@@ -347,14 +589,22 @@ def main():
     processor = CIKGProcessor()
     
     try:
-        result = processor.process_from_file(input_file, output_file)
-        
-        if not output_file:
-            print("\n" + "=" * 80)
-            print("CIKG PROCESSING OUTPUT:")
-            print("=" * 80)
-            print(json.dumps(asdict(result), indent=2))
-            print("=" * 80)
+        if args.jsonl or input_file.suffix == ".jsonl":
+            if not output_file:
+                print("Error: JSONL input requires an output file")
+                sys.exit(1)
+            summary = processor.process_jsonl(input_file, output_file, workers=args.workers)
+            print(f"✓ Processed {summary['documents']} documents ({summary['errors']} errors)")
+            print(f"✓ CIKG output saved to: {output_file}")
+        else:
+            result = processor.process_from_file(input_file, output_file)
+            
+            if not output_file:
+                print("\n" + "=" * 80)
+                print("CIKG PROCESSING OUTPUT:")
+                print("=" * 80)
+                print(json.dumps(asdict(result), indent=2))
+                print("=" * 80)
         
         print(f"\n✓ Extracted {processor.entities_extracted} entities")
         print(f"✓ Generated {processor.triples_generated} GSRL triples")
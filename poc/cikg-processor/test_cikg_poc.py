@@ -9,6 +9,7 @@ proper entity extraction and GSRL triple generation.
 import unittest
 import json
 import sys
+import tempfile
 from pathlib import Path
 from poc_cikg_processor import CIKGProcessor, ClinicalEntity, GSRLTriple
 
@@ -176,6 +177,110 @@ class TestCIKGProcessor(unittest.TestCase):
         except Exception as e:
             self.fail(f"Processor raised unexpected exception: {e}")
     
+    def test_entity_offsets_and_sentences(self):
+        """Test entities carry source offsets and the sentence they were found in"""
+        text = "Hypertension requires management. If HbA1c > 7%, initiate metformin."
+        
+        result = self.processor.process_text(text)
+        
+        for entity in result.layer1["entities"]:
+            self.assertEqual(text[entity["start"]:entity["end"]], entity["text"])
+        sentence_ids = {e["text"]: e["sentence_id"] for e in result.layer1["entities"]}
+        self.assertEqual(sentence_ids["Hypertension"], 0)
+        self.assertEqual(sentence_ids["HbA1c"], 1)
+        self.assertEqual(sentence_ids["metformin"], 1)
+    
+    def test_entities_only_used_in_their_sentence(self):
+        """Test triples are not built from entities mentioned in other sentences"""
+        text = "Hypertension is common; metformin is a medication. When indicated, initiate therapy."
+        
+        result = self.processor.process_text(text)
+        triples = result.layer1["triples"]
+        
+        self.assertEqual(len(triples), 1)
+        self.assertEqual(triples[0]["situation"], "patient_condition")
+        self.assertEqual(triples[0]["recommendation"], "initiate_therapy_therapy")
+    
+    def test_measurement_comparator(self):
+        """Test the comparison operator comes from the measurement match"""
+        text = "If glucose < 70 mg/dL and BP >= 140 mmHg, administer treatment."
+        
+        result = self.processor.process_text(text)
+        
+        self.assertEqual(result.layer1["triples"][0]["situation"], "glucose < 70 AND BP >= 140")
+    
+    def test_tokenize_single_pass(self):
+        """Test one tokenization pass yields tokens, sentences and entity spans"""
+        text = "For patients with hypertension, BP >= 140 mmHg. Start an ACE inhibitor.  "
+        
+        document = self.processor.tokenize(text)
+        
+        self.assertEqual([text[s:e] for s, e in document.sentences],
+                         [s.strip() for s in text.split('.') if s.strip()])
+        self.assertEqual(document.periods + 1, len(text.split('.')))
+        # Every non-whitespace character belongs to a token
+        tokens = "".join(text[s:e] for s, e in document.tokens)
+        self.assertEqual("".join(tokens.split()), "".join(text.split()))
+        self.assertEqual(
+            [(e.text, e.entity_type, e.sentence_id) for e in document.entities],
+            [("hypertension", "condition", 0), ("BP", "measurement", 0),
+             ("ACE inhibitor", "medication", 1), ("Start", "action", 1)]
+        )
+        self.assertEqual(self.processor.process_text(text).layer0["sentences"], 3)
+    
+    def test_keywords_match_at_token_starts(self):
+        """Test keywords inside longer words are not extracted as entities"""
+        text = "Restart the workflow coverage after chemotherapy; start insulin."
+        
+        entities = [(e.text, e.entity_type) for e in self.processor.tokenize(text).entities]
+        
+        self.assertEqual(entities, [("insulin", "medication"), ("start", "action")])
+    
+    def test_overlapping_keywords_across_patterns(self):
+        """Test keywords after a condition modifier are still extracted"""
+        text = ("If patients have high stroke risk, aspirin therapy should be started. "
+                "Consider low insulin doses.")
+        
+        result = self.processor.process_text(text)
+        
+        self.assertEqual(
+            [(e["text"], e["entity_type"]) for e in result.layer1["entities"]],
+            [("stroke", "condition"), ("high stroke", "condition"), ("low insulin", "condition"),
+             ("aspirin", "medication"), ("insulin", "medication"), ("therapy", "medication"),
+             ("start", "action"), ("should be", "action")]
+        )
+        self.assertEqual(result.layer1["triples"][0]["situation"], "stroke AND high stroke")
+    
+    def test_jsonl_streaming(self):
+        """Test JSONL streaming writes one record per input line, in order"""
+        texts = [
+            "For patients with type 2 diabetes, metformin should be initiated.",
+            "When systolic BP >= 140 mmHg, initiate ACE inhibitor therapy.",
+        ] * 3
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            input_path = Path(tmp) / "texts.jsonl"
+            with open(input_path, "w") as f:
+                for i, text in enumerate(texts):
+                    f.write(json.dumps({"id": f"doc{i}", "text": text}) + "\n")
+                f.write("\n" + json.dumps(texts[0]) + "\n" + "not json\n")
+            
+            outputs = {}
+            for workers in (1, 2):
+                output_path = Path(tmp) / f"out_{workers}.jsonl"
+                summary = CIKGProcessor().process_jsonl(input_path, output_path, workers=workers, batch_size=2)
+                self.assertEqual(summary["documents"], len(texts) + 2)
+                self.assertEqual(summary["errors"], 1)
+                outputs[workers] = output_path.read_text().splitlines()
+            
+            self.assertEqual(outputs[1], outputs[2])
+            records = [json.loads(line) for line in outputs[1]]
+            self.assertEqual([r["id"] for r in records], [f"doc{i}" for i in range(len(texts))] + [8, 9])
+            expected = self.processor.process_text(texts[1])
+            self.assertEqual(records[1]["layer1"], expected.layer1)
+            self.assertEqual(records[6]["layer0"]["text"], texts[0])
+            self.assertIn("error", records[7])
+    
     def test_json_serialization(self):
         """Test that output can be serialized to JSON"""
         text = "For hypertension with BP >= 140, initiate treatment."
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Santiago Layer 0: Non-Blocking Document Loading
+
+Async facade over DocumentLoader for the MCP handlers. File reads, hashing,
+parsing and storage writes run on a dedicated thread pool, so the event loop
+keeps serving other requests while a large document is being ingested.
+hashlib and file I/O release the GIL, so loads on the pool also overlap with
+each other.
+
+Author: GitHub Copilot
+Date: November 12, 2025
+"""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Union, Iterable, TextIO, Callable
+import logging
+
+from document_loader import DocumentLoader, DocumentMetadata
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class AsyncDocumentLoader:
+    """
+    Async API over a DocumentLoader backed by a dedicated I/O executor
+
+    The executor is separate from the event loop's default executor so
+    document work cannot starve other blocking calls, and its size bounds how
+    many documents are ingested at once.
+    """
+
+    def __init__(self, loader: Optional[DocumentLoader] = None, max_workers: int = 4):
+        self.loader = loader or DocumentLoader()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="santiago-docio")
+
+    async def load_document(self, source: Union[str, Path],
+                            metadata: Dict[str, Any]) -> DocumentMetadata:
+        """Load a document (see DocumentLoader.load_document) off the event loop"""
+        return await self._run(self.loader.load_document, source, metadata)
+
+    async def load_document_stream(self, source: Union[str, Path, TextIO], metadata: Dict[str, Any],
+                                   chunk_size: Optional[int] = None) -> DocumentMetadata:
+        """Stream-load a large document (see DocumentLoader.load_document_stream) off the event loop"""
+        return await self._run(self.loader.load_document_stream, source, metadata, chunk_size)
+
+    async def get_document_content(self, doc_id: str, section_id: Optional[str] = None) -> str:
+        """Read document or section content off the event loop"""
+        return await self._run(self.loader.get_document_content, doc_id, section_id)
+
+    async def get_section_contents(self, doc_id: str, section_ids: Iterable[str]) -> Dict[str, str]:
+        """
+        Read several sections in one executor call
+
+        Returns:
+            Mapping of section ID to section content
+        """
+        def read_sections() -> Dict[str, str]:
+            return {
+                section_id: self.loader.get_document_content(doc_id, section_id)
+                for section_id in section_ids
+            }
+        return await self._run(read_sections)
+
+    async def create_anchor_references(self, anchors: List[Dict[str, Any]]) -> List[str]:
+        """Create anchors in one batch off the event loop"""
+        return await self._run(self.loader.create_anchor_references, anchors)
+
+    async def resolve_anchor_reference(self, anchor_id: str, include_document: bool = False) -> Dict[str, Any]:
+        """Resolve an anchor off the event loop"""
+        return await self._run(self.loader.resolve_anchor_reference, anchor_id, include_document)
+
+    async def search_sections(self, query: str, limit: int = 10,
+                              doc_ids: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Ranked section search (see DocumentLoader.search_sections) off the event loop"""
+        return await self._run(self.loader.search_sections, query, limit, doc_ids)
+
+    async def list_documents_page(self, **kwargs) -> Dict[str, Any]:
+        """List stored documents (see DocumentLoader.list_documents_page) off the event loop"""
+        return await self._run(self.loader.list_documents_page, **kwargs)
+
+    def close(self):
+        """Wait for in-flight document work and stop the executor"""
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func: Callable, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
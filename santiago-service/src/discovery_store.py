@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Santiago Layer 1: Relationship Discovery Store
+
+SQLite-backed storage for relationship candidates and proposals produced by
+dynamic relationship discovery. Records are stored as JSON alongside the
+columns needed to look them up (ID, entity, relationship type, review state),
+so a long-running discovery engine can keep merging new guidelines into the
+store without holding every candidate in memory, and reviewers can page
+through the review queue with indexed queries.
+
+Every write stamps the record with an increasing sequence number, which lets
+exports append only what changed since the previous export.
+
+Author: GitHub Copilot
+Date: November 12, 2025
+"""
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Union
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+class DiscoveryStore:
+    """
+    Indexed store of relationship candidates and proposals
+
+    Candidate and proposal records are the dictionaries produced by
+    RelationshipCandidate.to_dict and RelationshipProposal.to_dict.
+    Pass ``":memory:"`` for a store that lives only as long as the process.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS candidates (
+        id TEXT PRIMARY KEY,
+        source_key TEXT NOT NULL,
+        target_key TEXT NOT NULL,
+        relationship_type TEXT NOT NULL,
+        confidence_score REAL NOT NULL,
+        reviewed INTEGER NOT NULL DEFAULT 0,
+        approved INTEGER NOT NULL DEFAULT 0,
+        seq INTEGER NOT NULL,
+        data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_candidates_source ON candidates (source_key);
+    CREATE INDEX IF NOT EXISTS idx_candidates_target ON candidates (target_key);
+    CREATE INDEX IF NOT EXISTS idx_candidates_type ON candidates (relationship_type, confidence_score);
+    CREATE INDEX IF NOT EXISTS idx_candidates_review ON candidates (reviewed, confidence_score);
+    CREATE INDEX IF NOT EXISTS idx_candidates_seq ON candidates (seq);
+    CREATE TABLE IF NOT EXISTS proposals (
+        id TEXT PRIMARY KEY,
+        candidate_id TEXT NOT NULL,
+        approved INTEGER NOT NULL DEFAULT 0,
+        created_at TEXT,
+        seq INTEGER NOT NULL,
+        data TEXT NOT NULL
+    );
+    CREATE INDEX IF NOT EXISTS idx_proposals_candidate ON proposals (candidate_id);
+    CREATE INDEX IF NOT EXISTS idx_proposals_approved ON proposals (approved, created_at);
+    CREATE INDEX IF NOT EXISTS idx_proposals_seq ON proposals (seq);
+    CREATE TABLE IF NOT EXISTS export_marks (
+        kind TEXT NOT NULL,
+        target TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        PRIMARY KEY (kind, target)
+    );
+    """
+
+    # Export kind -> table
+    _TABLES = {'candidates': 'candidates', 'proposals': 'proposals'}
+
+    def __init__(self, db_path: Union[str, Path] = ":memory:"):
+        self.db_path = db_path if str(db_path) == ":memory:" else Path(db_path)
+        if isinstance(self.db_path, Path):
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    # Candidates
+
+    def put_candidates(self, records: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update candidate records in a single transaction
+
+        Returns:
+            Number of records written
+        """
+        records = list(records)
+        if not records:
+            return 0
+        with self._lock, self._conn:
+            seq = self._next_seq('candidates')
+            self._conn.executemany(
+                "INSERT INTO candidates "
+                "(id, source_key, target_key, relationship_type, confidence_score, reviewed, approved, seq, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET source_key = excluded.source_key, "
+                "target_key = excluded.target_key, relationship_type = excluded.relationship_type, "
+                "confidence_score = excluded.confidence_score, reviewed = excluded.reviewed, "
+                "approved = excluded.approved, seq = excluded.seq, data = excluded.data",
+                [
+                    (record['id'], record['source_entity'].lower(), record['target_entity'].lower(),
+                     record['relationship_type'], record['confidence_score'],
+                     int(bool(record.get('reviewed'))), int(bool(record.get('approved'))),
+                     seq + i, json.dumps(record, ensure_ascii=False))
+                    for i, record in enumerate(records)
+                ]
+            )
+        return len(records)
+
+    def get_candidate(self, candidate_id: str) -> Optional[Dict[str, Any]]:
+        """Get a candidate record by ID"""
+        return self.get_candidates([candidate_id]).get(candidate_id)
+
+    def get_candidates(self, candidate_ids: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        """Get candidate records by ID; missing IDs are omitted"""
+        candidate_ids = list(dict.fromkeys(candidate_ids))
+        found = {}
+        with self._lock:
+            # Stay below SQLite's default host parameter limit
+            for i in range(0, len(candidate_ids), 500):
+                chunk = candidate_ids[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT id, data FROM candidates WHERE id IN ({','.join('?' * len(chunk))})", chunk
+                )
+                found.update((row['id'], json.loads(row['data'])) for row in rows)
+        return found
+
+    def find_candidates(self, entity: Optional[str] = None, relationship_type: Optional[str] = None,
+                        limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Candidates involving an entity (as source or target) and/or of a type
+
+        Returns:
+            Candidate records, most confident first
+        """
+        where, params = [], []
+        if entity is not None:
+            where.append("(source_key = ? OR target_key = ?)")
+            params.extend([entity.lower(), entity.lower()])
+        if relationship_type is not None:
+            where.append("relationship_type = ?")
+            params.append(relationship_type)
+        return self._select_candidates(where, params, limit)
+
+    def review_queue(self, limit: Optional[int] = 50, relationship_type: Optional[str] = None,
+                     min_confidence: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Unreviewed candidates, most confident first"""
+        where, params = ["reviewed = 0"], []
+        if relationship_type is not None:
+            where.append("relationship_type = ?")
+            params.append(relationship_type)
+        if min_confidence is not None:
+            where.append("confidence_score >= ?")
+            params.append(min_confidence)
+        return self._select_candidates(where, params, limit)
+
+    def iter_candidates(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream all candidate records in insertion order"""
+        return self._iter_records('candidates', batch_size)
+
+    def count_candidates(self) -> int:
+        """Number of stored candidates"""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+    # Proposals
+
+    def put_proposal(self, record: Dict[str, Any]):
+        """Insert or update a proposal record"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO proposals (id, candidate_id, approved, created_at, seq, data) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (id) DO UPDATE SET candidate_id = excluded.candidate_id, "
+                "approved = excluded.approved, created_at = excluded.created_at, "
+                "seq = excluded.seq, data = excluded.data",
+                (record['id'], record['candidate']['id'], int(bool(record.get('approved'))),
+                 record.get('created_at'), self._next_seq('proposals'), json.dumps(record, ensure_ascii=False))
+            )
+
+    def get_proposal(self, proposal_id: str) -> Optional[Dict[str, Any]]:
+        """Get a proposal record by ID"""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM proposals WHERE id = ?", (proposal_id,)).fetchone()
+        return json.loads(row['data']) if row else None
+
+    def list_proposals(self, approved: Optional[bool] = None,
+                       limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Proposals in creation order, optionally filtered by approval state"""
+        query = "SELECT data FROM proposals"
+        params: List[Any] = []
+        if approved is not None:
+            query += " WHERE approved = ?"
+            params.append(int(approved))
+        query += " ORDER BY created_at, rowid"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(row['data']) for row in rows]
+
+    def iter_proposals(self, batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Stream all proposal records in insertion order"""
+        return self._iter_records('proposals', batch_size)
+
+    # Incremental export
+
+    def export_changes(self, kind: str, filepath: Union[str, Path]) -> int:
+        """
+        Append records changed since the last export to a JSONL file
+
+        The first export of a kind to a path writes every record; later
+        exports append only records written since, so a record may appear
+        more than once and the last line for an ID is current.
+
+        Args:
+            kind: 'candidates' or 'proposals'
+            filepath: JSONL file to append to
+
+        Returns:
+            Number of records appended
+        """
+        if kind not in self._TABLES:
+            raise ValueError(f"Unknown export kind: {kind}")
+        target = str(Path(filepath).resolve())
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT seq FROM export_marks WHERE kind = ? AND target = ?", (kind, target)
+            ).fetchone()
+        since = row['seq'] if row and Path(filepath).exists() else 0
+
+        exported = 0
+        last_seq = since
+        with open(filepath, 'a' if since else 'w', encoding='utf-8') as f:
+            for seq, data in self._iter_changes(self._TABLES[kind], since):
+                f.write(data)
+                f.write('\n')
+                exported += 1
+                last_seq = seq
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO export_marks (kind, target, seq) VALUES (?, ?, ?)",
+                (kind, target, last_seq)
+            )
+        logger.info(f"Exported {exported} changed {kind} to {filepath}")
+        return exported
+
+    def _iter_changes(self, table: str, since: int, batch_size: int = 1000) -> Iterator[tuple]:
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT seq, data FROM {table} WHERE seq > ? ORDER BY seq LIMIT ?", (since, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield row['seq'], row['data']
+            since = rows[-1]['seq']
+
+    def _iter_records(self, table: str, batch_size: int) -> Iterator[Dict[str, Any]]:
+        # Keyset pagination on rowid, which upserts leave unchanged
+        last = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT rowid, data FROM {table} WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            for row in rows:
+                yield json.loads(row['data'])
+            last = rows[-1]['rowid']
+
+    def _select_candidates(self, where: List[str], params: List[Any],
+                           limit: Optional[int]) -> List[Dict[str, Any]]:
+        query = "SELECT data FROM candidates"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY confidence_score DESC, id"
+        if limit is not None:
+            query += " LIMIT ?"
+            params = params + [limit]
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(row['data']) for row in rows]
+
+    def _next_seq(self, table: str) -> int:
+        """Next sequence number for a table (caller holds the lock)"""
+        return self._conn.execute(f"SELECT COALESCE(MAX(seq), 0) + 1 FROM {table}").fetchone()[0]
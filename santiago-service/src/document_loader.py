@@ -19,12 +19,22 @@ import json
 import os
 import re
 import hashlib
+from html.parser import HTMLParser
+from xml.parsers import expat
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Union, Tuple
+from urllib.parse import urlsplit
+from typing import Dict, Any, List, Optional, Union, Tuple, TextIO
 from dataclasses import dataclass, asdict
 from datetime import datetime
 import logging
 
+from http_fetcher import HTTPDocumentFetcher, FetchResult
+from section_index import SectionSearchIndex, TOKEN_PATTERN, parse_query
+from document_store import (
+    MappedContentCache, SectionOffsetTable, AnchorStore, BlobStore, DocumentCatalog, ByteOffsetTracker,
+    char_to_byte_offsets, create_temp_file, MAX_UTF8_BYTES_PER_CHAR, WRITE_BUFFER_SIZE
+)
+
 # Document processing libraries
 try:
     import PyPDF2
@@ -32,12 +42,6 @@ try:
 except ImportError:
     HAS_PDF = False
 
-try:
-    from bs4 import BeautifulSoup
-    HAS_BS4 = True
-except ImportError:
-    HAS_BS4 = False
-
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -60,19 +64,22 @@ class DocumentMetadata:
     loaded_at: str
     sections: List[Dict[str, Any]]
     toc: List[Dict[str, Any]]  # Table of contents
+    content_blob: Optional[str] = None  # Blob store key (checksum); None for plain content.txt storage
 
 @dataclass
 class DocumentSection:
     """Represents a section within a document"""
     id: str
     title: str
-    content: str
+    content: str  # Left empty by parsers; section text is read from stored content by offset
     level: int  # Heading level (1-6)
     start_position: int  # Character position in full text
     end_position: Optional[int] = None
     parent_id: Optional[str] = None
     subsections: List[str] = None
     anchors: List[Dict[str, Any]] = None  # Reference anchors within section
+    start_byte: Optional[int] = None  # UTF-8 byte offsets into stored content
+    end_byte: Optional[int] = None
 
     def __post_init__(self):
         if self.subsections is None:
@@ -91,6 +98,306 @@ class DocumentAnchor:
     anchor_type: str  # table, figure, recommendation, etc.
     metadata: Dict[str, Any]
 
+class HeadingSectionBuilder:
+    """
+    Builds nested heading sections from headings seen in document order
+
+    Each section ends where the next heading starts, and parents come from a
+    stack of open headings, so headings can be fed incrementally (e.g. chunk by
+    chunk while streaming) with absolute character and byte offsets.
+    """
+
+    def __init__(self):
+        self.sections: List[DocumentSection] = []
+        self.toc: List[Dict[str, Any]] = []
+        self._stack: List[DocumentSection] = []
+
+    def add(self, level: int, title: str, start: int, start_byte: int) -> DocumentSection:
+        """Open a section at a heading"""
+        # Previous section ends where this heading line starts
+        if self.sections:
+            self.sections[-1].end_position = start
+            self.sections[-1].end_byte = start_byte
+
+        # Pop the stack until the top is a valid parent for this level
+        while self._stack and self._stack[-1].level >= level:
+            self._stack.pop()
+        parent = self._stack[-1] if self._stack else None
+
+        section = DocumentSection(
+            id=f"section_{len(self.sections) + 1}",
+            title=title,
+            content="",
+            level=level,
+            start_position=start,
+            parent_id=parent.id if parent else None,
+            start_byte=start_byte
+        )
+        if parent:
+            parent.subsections.append(section.id)
+
+        self.sections.append(section)
+        self._stack.append(section)
+        self.toc.append({
+            'id': section.id,
+            'title': title,
+            'level': level,
+            'parent_id': section.parent_id
+        })
+        return section
+
+    def retitle(self, section: DocumentSection, title: str):
+        """Replace a section's title once it is known (e.g. from a later title element)"""
+        section.title = title
+        # Section IDs are numbered in document order, matching their TOC position
+        self.toc[int(section.id.rsplit('_', 1)[1]) - 1]['title'] = title
+
+    def finish(self, end: int, end_byte: int) -> Tuple[List[DocumentSection], List[Dict[str, Any]]]:
+        """Close the final section at the end of the content"""
+        if self.sections:
+            self.sections[-1].end_position = end
+            self.sections[-1].end_byte = end_byte
+        return self.sections, self.toc
+
+class TextStreamScanner:
+    """
+    Incremental markdown-heading scanner for chunked text
+
+    Chunks are cut back to whole lines before scanning, so a heading never
+    straddles two chunks. Each call returns the text that is ready to store.
+    """
+
+    def __init__(self, heading_pattern: "re.Pattern"):
+        self.heading_pattern = heading_pattern
+        self.builder = HeadingSectionBuilder()
+        self.char_pos = 0
+        self.byte_pos = 0
+        self._pending = ""
+
+    def feed(self, chunk: str) -> str:
+        """Scan a chunk; returns the whole lines completed so far"""
+        text = self._pending + chunk
+        cut = text.rfind('\n') + 1
+        self._pending = text[cut:]
+        return self._scan(text[:cut])
+
+    def close(self) -> str:
+        """Scan the trailing partial line"""
+        text, self._pending = self._pending, ""
+        return self._scan(text)
+
+    def sections(self) -> Tuple[List[DocumentSection], List[Dict[str, Any]]]:
+        return self.builder.finish(self.char_pos, self.byte_pos)
+
+    def _scan(self, text: str) -> str:
+        byte_offset = ByteOffsetTracker(text)
+        for match in self.heading_pattern.finditer(text):
+            start = match.start()
+            self.builder.add(len(match.group(1)), match.group(2).strip(),
+                             self.char_pos + start, self.byte_pos + byte_offset(start))
+        self.char_pos += len(text)
+        self.byte_pos += byte_offset(len(text))
+        return text
+
+class HTMLSectionParser(HTMLParser):
+    """
+    Incremental HTML text extractor that records h1-h6 sections
+
+    Markup is fed in chunks and the extracted text is returned as it becomes
+    available; no DOM is built. Sections start at their heading text and carry
+    exact character and byte offsets into the extracted text, with heading
+    levels taken from the tag.
+    """
+
+    HEADING_LEVELS = {f"h{level}": level for level in range(1, 7)}
+    SKIP_TAGS = frozenset({'script', 'style', 'template', 'noscript'})
+    # Elements that start on a new line in the extracted text
+    BLOCK_TAGS = frozenset({
+        'address', 'article', 'aside', 'blockquote', 'caption', 'dd', 'div', 'dl', 'dt',
+        'figcaption', 'figure', 'footer', 'header', 'hr', 'li', 'main', 'nav', 'ol', 'p',
+        'pre', 'section', 'table', 'td', 'th', 'title', 'tr', 'ul'
+    })
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.builder = HeadingSectionBuilder()
+        self.char_pos = 0
+        self.byte_pos = 0
+        self._output: List[str] = []
+        self._at_line_start = True
+        self._skip_depth = 0
+        self._heading: Optional[Tuple[int, int, int, List[str]]] = None
+
+    def feed(self, data: str) -> str:
+        """Parse a chunk of markup; returns the text extracted so far"""
+        super().feed(data)
+        return self._drain()
+
+    def close(self) -> str:
+        """Finish parsing; returns any remaining extracted text"""
+        super().close()
+        return self._drain()
+
+    def sections(self) -> Tuple[List[DocumentSection], List[Dict[str, Any]]]:
+        return self.builder.finish(self.char_pos, self.byte_pos)
+
+    def handle_starttag(self, tag: str, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag in self.HEADING_LEVELS:
+            self._newline()
+            self._heading = (self.HEADING_LEVELS[tag], self.char_pos, self.byte_pos, [])
+        elif tag == 'br':
+            self._emit('\n')
+        elif tag in self.BLOCK_TAGS:
+            self._newline()
+
+    def handle_startendtag(self, tag: str, attrs):
+        # Self-closing tags never contain text
+        self.handle_starttag(tag, attrs)
+        if tag in self.SKIP_TAGS:
+            self._skip_depth -= 1
+
+    def handle_endtag(self, tag: str):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif tag in self.HEADING_LEVELS and self._heading:
+            level, start, start_byte, parts = self._heading
+            self._heading = None
+            title = ' '.join(''.join(parts).split())
+            if title:
+                self.builder.add(level, title, start, start_byte)
+            self._newline()
+        elif tag in self.BLOCK_TAGS:
+            self._newline()
+
+    def handle_data(self, data: str):
+        if self._skip_depth:
+            return
+        if self._heading:
+            self._heading[3].append(data)
+        self._emit(data)
+
+    def _emit(self, text: str):
+        if not text:
+            return
+        self._output.append(text)
+        self.char_pos += len(text)
+        self.byte_pos += len(text) if text.isascii() else len(text.encode('utf-8'))
+        self._at_line_start = text.endswith('\n')
+
+    def _newline(self):
+        if not self._at_line_start:
+            self._emit('\n')
+
+    def _drain(self) -> str:
+        text = ''.join(self._output)
+        self._output.clear()
+        return text
+
+class XMLSectionParser:
+    """
+    Incremental XML section scanner built on expat
+
+    Section elements (``section``, ``sec``, ``chapter``, ...) become sections
+    whose level is their section nesting depth and whose title comes from the
+    first direct ``title``/``heading`` child (or a ``title`` attribute). Offsets
+    point at the section's start tag in the raw XML, which is stored as is.
+    Namespace prefixes are ignored when matching element names.
+    """
+
+    SECTION_TAGS = frozenset({'section', 'sec', 'chapter', 'part', 'recommendation'})
+    TITLE_TAGS = frozenset({'title', 'heading'})
+
+    def __init__(self):
+        self.builder = HeadingSectionBuilder()
+        self.char_pos = 0
+        self.byte_pos = 0
+        self._parser = expat.ParserCreate(encoding='utf-8')
+        self._parser.StartElementHandler = self._start
+        self._parser.EndElementHandler = self._end
+        self._parser.CharacterDataHandler = self._data
+        self._failed = False
+        # Fed bytes not yet converted to character offsets (events may point into earlier chunks)
+        self._buffer = bytearray()
+        self._buffer_start = 0   # Absolute byte offset of _buffer[0]
+        self._resolved = 0       # Index into _buffer up to which characters are counted
+        self._resolved_chars = 0
+        self._elements: List[Optional[DocumentSection]] = []
+        self._depth = 0
+        self._untitled: Optional[DocumentSection] = None
+        self._title: Optional[Tuple[DocumentSection, int, List[str]]] = None
+
+    def feed(self, data: str) -> str:
+        """Scan a chunk of XML; the raw chunk is returned unchanged for storage"""
+        raw = data.encode('utf-8')
+        self.char_pos += len(data)
+        self.byte_pos += len(raw)
+        if not self._failed:
+            self._buffer += raw
+            self._parse(raw, False)
+            del self._buffer[:self._resolved]
+            self._buffer_start += self._resolved
+            self._resolved = 0
+        return data
+
+    def close(self) -> str:
+        if not self._failed:
+            self._parse(b'', True)
+        return ""
+
+    def sections(self) -> Tuple[List[DocumentSection], List[Dict[str, Any]]]:
+        return self.builder.finish(self.char_pos, self.byte_pos)
+
+    def _parse(self, raw: bytes, final: bool):
+        try:
+            self._parser.Parse(raw, final)
+        except expat.ExpatError as e:
+            # Keep the sections found so far; the content is still stored verbatim
+            logger.warning(f"XML structure parsing stopped: {e}")
+            self._failed = True
+            self._buffer.clear()
+
+    def _char_offset(self, byte_offset: int) -> int:
+        end = byte_offset - self._buffer_start
+        self._resolved_chars += len(bytes(self._buffer[self._resolved:end]).decode('utf-8'))
+        self._resolved = end
+        return self._resolved_chars
+
+    def _start(self, name: str, attrs: Dict[str, str]):
+        local = name.rsplit(':', 1)[-1].lower()
+        parent = self._elements[-1] if self._elements else None
+        if local in self.SECTION_TAGS:
+            self._depth += 1
+            start_byte = self._parser.CurrentByteIndex
+            title = attrs.get('title') or f"{local.capitalize()} {len(self.builder.sections) + 1}"
+            section = self.builder.add(self._depth, title, self._char_offset(start_byte), start_byte)
+            self._untitled = None if 'title' in attrs else section
+            self._elements.append(section)
+            return
+
+        self._elements.append(None)
+        if local in self.TITLE_TAGS and self._title is None and parent is not None and parent is self._untitled:
+            self._title = (parent, len(self._elements), [])
+
+    def _end(self, name: str):
+        if self._title and len(self._elements) == self._title[1]:
+            section, _, parts = self._title
+            self._title = None
+            title = ' '.join(''.join(parts).split())
+            if title:
+                self.builder.retitle(section, title)
+                self._untitled = None
+        element = self._elements.pop()
+        if element is not None:
+            self._depth -= 1
+            if element is self._untitled:
+                self._untitled = None
+
+    def _data(self, data: str):
+        if self._title:
+            self._title[2].append(data)
+
 class DocumentLoader:
     """
     Layer 0 Document Loader for Santiago
@@ -99,10 +406,30 @@ class DocumentLoader:
     capabilities for traceability throughout the knowledge graph.
     """
 
-    def __init__(self, storage_path: Optional[str] = None):
+    # Markdown-style headings ("## Title"), matched anywhere at a line start
+    HEADING_PATTERN = re.compile(r'^[ \t]*(#+)[ \t]+(\S[^\r\n]*?)[ \t]*\r?$', re.MULTILINE)
+    # Numbered recommendations in PDF text (e.g., "9.1", "9.2")
+    RECOMMENDATION_PATTERN = re.compile(r'^(\d+\.\d+)\s*(.*)')
+    # Characters read per chunk by streaming ingestion
+    STREAM_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, storage_path: Optional[str] = None, max_open_maps: int = 32,
+                 compress_content: bool = True, http_fetcher: Optional[HTTPDocumentFetcher] = None):
         self.storage_path = Path(storage_path) if storage_path else Path("data/documents")
         self.storage_path.mkdir(parents=True, exist_ok=True)
         self.loaded_documents: Dict[str, DocumentMetadata] = {}
+        self.content_cache = MappedContentCache(max_open=max_open_maps)
+        self.compress_content = compress_content
+        self.blob_store = BlobStore(self.storage_path / "blobs", content_cache=self.content_cache)
+        self._section_tables: Dict[str, SectionOffsetTable] = {}
+        self.anchor_store = AnchorStore(self.storage_path / "anchors.db")
+        self.anchor_store.migrate_json_anchors(self.storage_path)
+        # Documents stored before the catalog existed are backfilled on first listing
+        self.catalog = DocumentCatalog(self.storage_path / "catalog.db")
+        self._catalog_backfilled = False
+        # Created on first URL load unless injected
+        self._http_fetcher = http_fetcher
+        self.search_index = SectionSearchIndex(self.storage_path / "search.db")
 
     def load_document(self, source: Union[str, Path],
                      metadata: Dict[str, Any]) -> DocumentMetadata:
@@ -119,7 +446,7 @@ class DocumentLoader:
         logger.info(f"Loading document: {metadata.get('title', 'Unknown')}")
 
         # Determine document type and load content
-        if isinstance(source, (str, Path)) and Path(source).exists():
+        if self._is_file_source(source):
             content, format_type = self._load_from_file(source)
         elif isinstance(source, str) and source.startswith(('http://', 'https://')):
             content, format_type = self._load_from_url(source)
@@ -127,34 +454,22 @@ class DocumentLoader:
             content = str(source)
             format_type = 'text'
 
+        # Parse document structure; HTML is stored as the text extracted in the same pass
+        if format_type == 'html':
+            content, sections, toc = self._extract_html(content)
+        else:
+            sections, toc = self._parse_document_structure(content, format_type)
+
         # Generate document ID and checksum
         doc_id = self._generate_document_id(metadata, content)
         checksum = self._calculate_checksum(content)
 
-        # Parse document structure
-        sections, toc = self._parse_document_structure(content, format_type)
-
         # Create document metadata
-        doc_metadata = DocumentMetadata(
-            id=doc_id,
-            title=metadata.get('title', 'Unknown'),
-            source=metadata.get('source', 'Unknown'),
-            version=metadata.get('version', '1.0'),
-            publication_date=metadata.get('publication_date'),
-            authors=metadata.get('authors', []),
-            organization=metadata.get('organization'),
-            document_type=metadata.get('document_type', 'guideline'),
-            format=format_type,
-            file_path=str(source) if isinstance(source, (str, Path)) else None,
-            url=str(source) if isinstance(source, str) and source.startswith(('http://', 'https://')) else None,
-            checksum=checksum,
-            loaded_at=datetime.now().isoformat(),
-            sections=[asdict(section) for section in sections],
-            toc=toc
-        )
+        doc_metadata = self._build_metadata(doc_id, metadata, source, format_type, checksum, sections, toc)
 
         # Store document content and metadata
         self._store_document(doc_id, content, doc_metadata)
+        self._index_document(doc_metadata, content)
 
         # Cache in memory
         self.loaded_documents[doc_id] = doc_metadata
@@ -162,6 +477,85 @@ class DocumentLoader:
         logger.info(f"Successfully loaded document {doc_id} with {len(sections)} sections")
         return doc_metadata
 
+    def load_document_stream(self, source: Union[str, Path, TextIO], metadata: Dict[str, Any],
+                             chunk_size: Optional[int] = None) -> DocumentMetadata:
+        """
+        Load a large text document without holding it in memory
+
+        The source is read in chunks of whole lines. Each chunk is hashed,
+        scanned for headings and written straight to storage, so peak memory is
+        a small multiple of the chunk size and metadata keeps only section
+        offsets. The resulting ID, checksum and sections match load_document
+        for the same content.
+
+        Args:
+            source: Path to a text, markdown, HTML or XML file, or an open text stream
+            metadata: Document metadata
+            chunk_size: Characters read per chunk
+
+        Returns:
+            DocumentMetadata with full document structure
+        """
+        logger.info(f"Streaming document: {metadata.get('title', 'Unknown')}")
+        chunk_size = chunk_size or self.STREAM_CHUNK_SIZE
+
+        if isinstance(source, (str, Path)):
+            file_path = Path(source)
+            format_type = self._stream_format(file_path)
+            stream = open(file_path, 'r', encoding='utf-8')
+        else:
+            file_path, format_type, stream = None, 'text', source
+
+        sha256 = hashlib.sha256()
+        md5 = hashlib.md5()
+        scanner = self._structure_scanner(format_type)
+        if self.compress_content:
+            sink = self.blob_store.writer()
+        else:
+            tmp_path, sink = self._open_temp(self.storage_path, 'wb')
+
+        try:
+            while True:
+                chunk = stream.read(chunk_size)
+                # The scanner returns the text to store (extracted text for HTML)
+                text = scanner.feed(chunk) if chunk else scanner.close()
+                if text:
+                    data = text.encode('utf-8')
+                    sha256.update(data)
+                    md5.update(data)
+                    sink.write(data)
+                if not chunk:
+                    break
+        except BaseException:
+            if self.compress_content:
+                sink.abort()
+            else:
+                sink.close()
+                os.unlink(tmp_path)
+            raise
+        finally:
+            if file_path is not None:
+                stream.close()
+
+        sections, toc = scanner.sections()
+        doc_id = self._generate_document_id(metadata, content_hash=md5.hexdigest())
+        (self.storage_path / doc_id).mkdir(exist_ok=True)
+
+        doc_metadata = self._build_metadata(doc_id, metadata, file_path, format_type,
+                                            sha256.hexdigest(), sections, toc)
+        if self.compress_content:
+            doc_metadata.content_blob = sink.close()
+        else:
+            sink.close()
+            self._publish_content_file(doc_id, tmp_path)
+        self._store_metadata(doc_metadata)
+        self.loaded_documents[doc_id] = doc_metadata
+        # Sections are read back from storage one at a time, keeping memory bounded
+        self._index_document(doc_metadata)
+
+        logger.info(f"Successfully streamed document {doc_id} with {len(sections)} sections")
+        return doc_metadata
+
     def get_document_content(self, doc_id: str, section_id: Optional[str] = None) -> str:
         """
         Retrieve document content, optionally for a specific section
@@ -173,29 +567,56 @@ class DocumentLoader:
         Returns:
             Document content or section content
         """
-        if doc_id not in self.loaded_documents:
-            self._load_document_from_storage(doc_id)
+        if section_id:
+            return str(self.get_section_view(doc_id, section_id), 'utf-8')
 
-        doc_metadata = self.loaded_documents[doc_id]
-        content_path = self.storage_path / doc_id / "content.txt"
+        return str(self._read_content(doc_id), 'utf-8')
 
-        if not content_path.exists():
-            raise FileNotFoundError(f"Document content not found: {content_path}")
+    def get_section_view(self, doc_id: str, section_id: str) -> memoryview:
+        """
+        View of a section's UTF-8 bytes in the stored content
 
-        with open(content_path, 'r', encoding='utf-8') as f:
-            full_content = f.read()
+        Zero-copy for plain memory-mapped content; for compressed blobs only
+        the frames overlapping the section are decompressed.
 
-        if section_id:
-            # Find section boundaries
-            section_data = next((s for s in doc_metadata.sections if s['id'] == section_id), None)
-            if section_data:
-                start_pos = section_data['start_position']
-                end_pos = section_data['end_position']
-                return full_content[start_pos:end_pos]
-            else:
-                raise ValueError(f"Section {section_id} not found in document {doc_id}")
+        Args:
+            doc_id: Document identifier
+            section_id: Section identifier
+
+        Returns:
+            memoryview over the section's bytes
+        """
+        section_data = self._get_section_table(doc_id).get(section_id)
+        if not section_data:
+            raise ValueError(f"Section {section_id} not found in document {doc_id}")
+
+        return self._read_content(doc_id, section_data['start_byte'], section_data['end_byte'])
+
+    def get_content_window(self, doc_id: str, position: int, context_size: int = 200) -> str:
+        """
+        Get text around a character position without decoding the whole document
+
+        Decoding starts at the nearest section boundary before the window, so
+        the work is bounded by the size of the enclosing section.
 
-        return full_content
+        Args:
+            doc_id: Document identifier
+            position: Character position in the document
+            context_size: Total window size in characters
+
+        Returns:
+            Text surrounding the position
+        """
+        window_start = max(0, position - context_size // 2)
+        window_end = position + context_size // 2
+        base_char, base_byte = self._get_section_table(doc_id).locate(window_start)
+
+        view = self._read_content(
+            doc_id, base_byte, base_byte + (window_end - base_char) * MAX_UTF8_BYTES_PER_CHAR
+        )
+        # Only the tail of the slice can split a multi-byte character
+        text = str(view, 'utf-8', 'ignore')
+        return text[window_start - base_char:window_end - base_char]
 
     def create_anchor_reference(self, doc_id: str, section_id: str,
                               anchor_text: str, anchor_type: str,
@@ -214,33 +635,60 @@ class DocumentLoader:
         Returns:
             Anchor reference ID
         """
-        anchor_id = f"{doc_id}_{section_id}_anchor_{hashlib.md5(anchor_text.encode()).hexdigest()[:8]}"
-
-        anchor = DocumentAnchor(
-            id=anchor_id,
-            text=anchor_text,
-            section_id=section_id,
-            position=position,
-            context=context,
-            anchor_type=anchor_type,
-            metadata={
-                'doc_id': doc_id,
-                'created_at': datetime.now().isoformat(),
-                'anchor_type': anchor_type
-            }
-        )
+        return self.create_anchor_references([{
+            'doc_id': doc_id,
+            'section_id': section_id,
+            'anchor_text': anchor_text,
+            'anchor_type': anchor_type,
+            'position': position,
+            'context': context
+        }])[0]
+
+    def create_anchor_references(self, anchors: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create many anchor references in a single batched write
+
+        Args:
+            anchors: Dictionaries with doc_id, section_id, anchor_text,
+                anchor_type, position and context
+
+        Returns:
+            Anchor reference IDs, in input order
+        """
+        created_at = datetime.now().isoformat()
+        built = []
+        for anchor_data in anchors:
+            doc_id = anchor_data['doc_id']
+            section_id = anchor_data['section_id']
+            anchor_text = anchor_data['anchor_text']
+            anchor_type = anchor_data['anchor_type']
+
+            built.append(DocumentAnchor(
+                id=f"{doc_id}_{section_id}_anchor_{hashlib.md5(anchor_text.encode()).hexdigest()[:8]}",
+                text=anchor_text,
+                section_id=section_id,
+                position=anchor_data['position'],
+                context=anchor_data['context'],
+                anchor_type=anchor_type,
+                metadata={
+                    'doc_id': doc_id,
+                    'created_at': created_at,
+                    'anchor_type': anchor_type
+                }
+            ))
 
-        # Store anchor reference
-        self._store_anchor(anchor)
+        # Store anchor references
+        self._store_anchors(built)
 
-        return anchor_id
+        return [anchor.id for anchor in built]
 
-    def resolve_anchor_reference(self, anchor_id: str) -> Dict[str, Any]:
+    def resolve_anchor_reference(self, anchor_id: str, include_document: bool = False) -> Dict[str, Any]:
         """
         Resolve an anchor reference to get full context and content
 
         Args:
             anchor_id: Anchor reference identifier
+            include_document: Also return the full document content
 
         Returns:
             Anchor details with content and context
@@ -252,26 +700,23 @@ class DocumentLoader:
         doc_id = anchor_id.split('_section_')[0]
 
         # Load anchor from storage
-        anchor_path = self.storage_path / doc_id / "anchors" / f"{anchor_id}.json"
+        anchor_data = self.anchor_store.get(anchor_id)
 
-        if not anchor_path.exists():
+        if anchor_data is None:
             raise FileNotFoundError(f"Anchor not found: {anchor_id}")
 
-        with open(anchor_path, 'r', encoding='utf-8') as f:
-            anchor_data = json.load(f)
-
-        # Get document and section content
+        # Get section content and context from the memory-mapped store
         section_id = anchor_data['section_id']
 
-        doc_content = self.get_document_content(doc_id)
-        section_content = self.get_document_content(doc_id, section_id)
-
-        return {
+        resolved = {
             'anchor': anchor_data,
-            'document_content': doc_content,
-            'section_content': section_content,
-            'full_context': self._get_anchor_context(doc_content, anchor_data['position'], 500)
+            'section_content': self.get_document_content(doc_id, section_id),
+            'full_context': self.get_content_window(doc_id, anchor_data['position'], 500)
         }
+        if include_document:
+            resolved['document_content'] = self.get_document_content(doc_id)
+
+        return resolved
 
     def _load_from_file(self, file_path: Union[str, Path]) -> Tuple[str, str]:
         """Load content from a file"""
@@ -282,8 +727,6 @@ class DocumentLoader:
                 raise ImportError("PyPDF2 required for PDF processing")
             return self._load_pdf(file_path), 'pdf'
         elif file_path.suffix.lower() in ['.html', '.htm']:
-            if not HAS_BS4:
-                raise ImportError("BeautifulSoup required for HTML processing")
             return self._load_html(file_path), 'html'
         elif file_path.suffix.lower() == '.xml':
             return self._load_xml(file_path), 'xml'
@@ -292,10 +735,58 @@ class DocumentLoader:
             with open(file_path, 'r', encoding='utf-8') as f:
                 return f.read(), 'text'
 
+    def _stream_format(self, file_path: Path) -> str:
+        """Format of a file for streaming ingestion (text-based formats only)"""
+        suffix = file_path.suffix.lower()
+        if suffix == '.pdf':
+            raise ValueError("Streaming ingestion does not support PDF files; use load_document")
+        if suffix in ['.html', '.htm']:
+            return 'html'
+        return 'xml' if suffix == '.xml' else 'text'
+
+    @property
+    def http_fetcher(self) -> HTTPDocumentFetcher:
+        """Pooled HTTP client with an on-disk conditional-GET cache"""
+        if self._http_fetcher is None:
+            self._http_fetcher = HTTPDocumentFetcher(self.storage_path / "http_cache")
+        return self._http_fetcher
+
+    def prefetch_urls(self, urls: List[str], max_workers: int = 8) -> Dict[str, Any]:
+        """
+        Download or revalidate many URLs concurrently ahead of load_document
+
+        Returns:
+            Mapping of URL to FetchResult, or the DocumentFetchError it raised
+        """
+        return self.http_fetcher.prefetch(urls, max_workers=max_workers)
+
     def _load_from_url(self, url: str) -> Tuple[str, str]:
-        """Load content from a URL"""
-        # Placeholder - would implement HTTP requests
-        raise NotImplementedError("URL loading not yet implemented")
+        """Load content from a URL (cached; unchanged documents cost one 304)"""
+        fetched = self.http_fetcher.fetch(url)
+        format_type = self._url_format(fetched)
+
+        if format_type == 'pdf':
+            if not HAS_PDF:
+                raise ImportError("PyPDF2 required for PDF processing")
+            return self._load_pdf(fetched.path), 'pdf'
+        return fetched.read_text(), format_type
+
+    def _url_format(self, fetched: FetchResult) -> str:
+        """Document format from the Content-Type header, falling back to the URL suffix"""
+        media_type = (fetched.content_type or "").split(';')[0].strip().lower()
+        if media_type == 'application/pdf':
+            return 'pdf'
+        if media_type in ('text/html', 'application/xhtml+xml'):
+            return 'html'
+        if media_type.endswith('/xml') or media_type.endswith('+xml'):
+            return 'xml'
+
+        suffix = Path(urlsplit(fetched.url).path).suffix.lower()
+        if suffix == '.pdf':
+            return 'pdf'
+        if suffix in ['.html', '.htm']:
+            return 'html'
+        return 'xml' if suffix == '.xml' else 'text'
 
     def _load_pdf(self, file_path: Path) -> str:
         """Extract text from PDF file"""
@@ -307,13 +798,9 @@ class DocumentLoader:
         return text
 
     def _load_html(self, file_path: Path) -> str:
-        """Extract text from HTML file"""
+        """Load HTML markup (text is extracted while parsing its structure)"""
         with open(file_path, 'r', encoding='utf-8') as f:
-            soup = BeautifulSoup(f.read(), 'html.parser')
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.extract()
-            return soup.get_text()
+            return f.read()
 
     def _load_xml(self, file_path: Path) -> str:
         """Load XML content"""
@@ -337,180 +824,116 @@ class DocumentLoader:
         return sections, toc
 
     def _parse_text_structure(self, content: str) -> Tuple[List[DocumentSection], List[Dict[str, Any]]]:
-        """Parse plain text structure using heading patterns"""
-        sections = []
-        toc = []
-        current_pos = 0
-
-        # Split into lines and identify headings
-        lines = content.split('\n')
-        current_section = None
-        section_stack = []
-
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-
-            # Check for heading patterns
-            heading_match = re.match(r'^(#+\s+)(.+)$', line)
-            if heading_match:
-                # Save previous section if exists
-                if current_section:
-                    current_section.end_position = current_pos
-                    sections.append(current_section)
-
-                # Create new section
-                level = len(heading_match.group(1).strip())
-                title = heading_match.group(2).strip()
-
-                # Determine parent
-                parent_id = None
-                if section_stack and level > section_stack[-1][1]:
-                    parent_id = section_stack[-1][0]
-                elif section_stack and level <= section_stack[-1][1]:
-                    # Pop stack until we find the right parent level
-                    while section_stack and section_stack[-1][1] >= level:
-                        section_stack.pop()
-                    if section_stack:
-                        parent_id = section_stack[-1][0]
-
-                section_id = f"section_{len(sections) + 1}"
-                current_section = DocumentSection(
-                    id=section_id,
-                    title=title,
-                    content="",
-                    level=level,
-                    start_position=current_pos,
-                    parent_id=parent_id
-                )
-
-                # Update parent subsections
-                if parent_id:
-                    parent_section = next((s for s in sections if s.id == parent_id), None)
-                    if parent_section:
-                        parent_section.subsections.append(section_id)
-
-                section_stack.append((section_id, level))
-
-                # Add to TOC
-                toc.append({
-                    'id': section_id,
-                    'title': title,
-                    'level': level,
-                    'parent_id': parent_id
-                })
-            else:
-                # Add content to current section
-                if current_section:
-                    current_section.content += line + "\n"
-
-            current_pos += len(line) + 1
+        """
+        Parse plain text structure using heading patterns
 
-        # Save final section
-        if current_section:
-            current_section.end_position = current_pos
-            sections.append(current_section)
+        Single pass over heading matches: sections record exact character and
+        byte offsets into the content (not copies of it), and parents come from
+        a stack of open headings.
+        """
+        scanner = TextStreamScanner(self.HEADING_PATTERN)
+        scanner.feed(content)
+        scanner.close()
+        return scanner.sections()
+
+    def _structure_scanner(self, format_type: str):
+        """Incremental structure scanner for a streamable format"""
+        if format_type == 'html':
+            return HTMLSectionParser()
+        if format_type == 'xml':
+            return XMLSectionParser()
+        return TextStreamScanner(self.HEADING_PATTERN)
+
+    def _close_section(self, section: DocumentSection, end: int, byte_offset: ByteOffsetTracker):
+        """Record a section's end offsets"""
+        section.end_position = end
+        section.end_byte = byte_offset(end)
 
+    def _parse_html_structure(self, content: str) -> Tuple[List[DocumentSection], List[Dict[str, Any]]]:
+        """Parse HTML structure using h1-h6 tags (offsets refer to the extracted text)"""
+        _, sections, toc = self._extract_html(content)
         return sections, toc
 
-    def _parse_html_structure(self, content: str) -> Tuple[List[DocumentSection], List[Dict[str, Any]]]:
-        """Parse HTML structure using heading tags"""
-        # Placeholder - would implement HTML parsing
-        return self._parse_text_structure(content)  # Fallback to text parsing
+    def _extract_html(self, markup: str) -> Tuple[str, List[DocumentSection], List[Dict[str, Any]]]:
+        """Extract text and heading sections from HTML markup in one pass"""
+        parser = HTMLSectionParser()
+        text = parser.feed(markup) + parser.close()
+        sections, toc = parser.sections()
+        return text, sections, toc
 
     def _parse_pdf_structure(self, content: str) -> Tuple[List[DocumentSection], List[Dict[str, Any]]]:
         """Parse PDF structure using clinical document patterns"""
         sections = []
         toc = []
-
-        # For PDFs, we'll create sections based on numbered recommendations and major headers
-        lines = content.split('\n')
-        current_section = None
-        section_start_pos = 0
-        current_pos = 0
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                current_pos += 1
-                continue
-
-            # Look for numbered recommendations (e.g., "9.1", "9.2")
-            rec_match = re.match(r'^(\d+\.\d+)\s*(.*)', line)
-            if rec_match:
-                # Save previous section if exists
-                if current_section:
-                    current_section.end_position = current_pos
-                    sections.append(current_section)
-
-                # Create new recommendation section
-                rec_num = rec_match.group(1)
-                rec_title = rec_match.group(2).strip() if rec_match.group(2).strip() else f"Recommendation {rec_num}"
-
-                section_id = f"recommendation_{rec_num.replace('.', '_')}"
-                current_section = DocumentSection(
-                    id=section_id,
-                    title=rec_title,
-                    content="",
-                    level=3,  # Recommendation level
-                    start_position=current_pos,
-                    parent_id="main_content"
-                )
-
-                toc.append({
-                    'id': section_id,
-                    'title': rec_title,
-                    'level': 3,
-                    'parent_id': "main_content"
-                })
-
-            # Look for major section headers (ALL CAPS, typically clinical sections)
-            elif line.isupper() and len(line) > 10 and not line.startswith('http'):
-                # Save previous section if exists
-                if current_section:
-                    current_section.end_position = current_pos
-                    sections.append(current_section)
-
-                # Create new major section
-                section_id = f"section_{len(sections) + 1}"
-                current_section = DocumentSection(
-                    id=section_id,
-                    title=line,
-                    content="",
-                    level=2,  # Major section level
-                    start_position=current_pos,
-                    parent_id="main_content"
-                )
-
+        byte_offset = ByteOffsetTracker(content)
+
+        # For PDFs, we'll create sections based on numbered recommendations and major headers.
+        # Lines are scanned in place so offsets are exact positions in the content.
+        line_start = 0
+        content_length = len(content)
+        while line_start < content_length:
+            line_end = content.find('\n', line_start)
+            if line_end == -1:
+                line_end = content_length
+            line = content[line_start:line_end].strip()
+            section = None
+
+            if line:
+                rec_match = self.RECOMMENDATION_PATTERN.match(line)
+                if rec_match:
+                    # Create new recommendation section
+                    rec_num = rec_match.group(1)
+                    rec_title = rec_match.group(2).strip() or f"Recommendation {rec_num}"
+                    section = DocumentSection(
+                        id=f"recommendation_{rec_num.replace('.', '_')}",
+                        title=rec_title,
+                        content="",
+                        level=3,  # Recommendation level
+                        start_position=line_start,
+                        parent_id="main_content"
+                    )
+
+                # Look for major section headers (ALL CAPS, typically clinical sections)
+                elif line.isupper() and len(line) > 10 and not line.startswith('http'):
+                    section = DocumentSection(
+                        id=f"section_{len(sections) + 1}",
+                        title=line,
+                        content="",
+                        level=2,  # Major section level
+                        start_position=line_start,
+                        parent_id="main_content"
+                    )
+
+            if section:
+                # Previous section ends where this one starts
+                if sections:
+                    self._close_section(sections[-1], line_start, byte_offset)
+                section.start_byte = byte_offset(line_start)
+                sections.append(section)
                 toc.append({
-                    'id': section_id,
-                    'title': line,
-                    'level': 2,
-                    'parent_id': "main_content"
+                    'id': section.id,
+                    'title': section.title,
+                    'level': section.level,
+                    'parent_id': section.parent_id
                 })
 
-            else:
-                # Add content to current section
-                if current_section:
-                    current_section.content += line + "\n"
-
-            current_pos += len(line) + 1
+            line_start = line_end + 1
 
         # Save final section
-        if current_section:
-            current_section.end_position = current_pos
-            sections.append(current_section)
+        if sections:
+            self._close_section(sections[-1], content_length, byte_offset)
 
         # If no sections were found, create a single main section
         if not sections:
             sections.append(DocumentSection(
                 id="main_content",
                 title="Main Content",
-                content=content,
+                content="",
                 level=1,
                 start_position=0,
-                end_position=len(content)
+                end_position=content_length,
+                start_byte=0,
+                end_byte=byte_offset(content_length)
             ))
             toc.append({
                 'id': "main_content",
@@ -522,12 +945,22 @@ class DocumentLoader:
         return sections, toc
 
     def _parse_xml_structure(self, content: str) -> Tuple[List[DocumentSection], List[Dict[str, Any]]]:
-        """Parse XML structure"""
-        # Placeholder - would implement XML parsing
-        return self._parse_text_structure(content)  # Fallback to text parsing
+        """Parse XML structure using section elements (offsets refer to the raw XML)"""
+        parser = XMLSectionParser()
+        parser.feed(content)
+        parser.close()
+        return parser.sections()
+
+    def _generate_document_id(self, metadata: Dict[str, Any], content: Optional[str] = None,
+                              content_hash: Optional[str] = None) -> str:
+        """
+        Generate unique document identifier
 
-    def _generate_document_id(self, metadata: Dict[str, Any], content: str) -> str:
-        """Generate unique document identifier"""
+        Args:
+            metadata: Document metadata
+            content: Document content (hashed for uniqueness)
+            content_hash: Precomputed MD5 hex digest of the content, e.g. from streaming ingestion
+        """
         # Use title, source, and version to create ID
         id_components = [
             metadata.get('title', 'unknown').lower().replace(' ', '_').replace('/', '_'),
@@ -536,8 +969,32 @@ class DocumentLoader:
         ]
         base_id = '_'.join(id_components)
         # Add hash of content for uniqueness
-        content_hash = hashlib.md5(content.encode()).hexdigest()[:8]
-        return f"{base_id}_{content_hash}"
+        if content_hash is None:
+            content_hash = hashlib.md5(content.encode()).hexdigest()
+        return f"{base_id}_{content_hash[:8]}"
+
+    def _build_metadata(self, doc_id: str, metadata: Dict[str, Any], source: Any, format_type: str,
+                        checksum: str, sections: List[DocumentSection],
+                        toc: List[Dict[str, Any]]) -> DocumentMetadata:
+        """Create the stored metadata record for a parsed document"""
+        return DocumentMetadata(
+            id=doc_id,
+            title=metadata.get('title', 'Unknown'),
+            source=metadata.get('source', 'Unknown'),
+            version=metadata.get('version', '1.0'),
+            publication_date=metadata.get('publication_date'),
+            authors=metadata.get('authors', []),
+            organization=metadata.get('organization'),
+            document_type=metadata.get('document_type', 'guideline'),
+            format=format_type,
+            file_path=str(source) if isinstance(source, (str, Path)) else None,
+            url=str(source) if isinstance(source, str) and source.startswith(('http://', 'https://')) else None,
+            checksum=checksum,
+            loaded_at=datetime.now().isoformat(),
+            # Sections hold only offsets and plain fields, so a shallow copy suffices
+            sections=[dict(vars(section)) for section in sections],
+            toc=toc
+        )
 
     def _calculate_checksum(self, content: str) -> str:
         """Calculate SHA256 checksum of content"""
@@ -548,30 +1005,62 @@ class DocumentLoader:
         doc_dir = self.storage_path / doc_id
         doc_dir.mkdir(exist_ok=True)
 
-        # Store content
-        content_path = doc_dir / "content.txt"
-        with open(content_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if self.compress_content:
+            # Content-addressed: identical content is shared across documents
+            metadata.content_blob = self.blob_store.put(content)
+        else:
+            # Store content via rename so open memory maps keep a consistent view
+            tmp_path, f = self._open_temp(doc_dir, 'w')
+            with f:
+                f.write(content)
+            self._publish_content_file(doc_id, tmp_path)
 
-        # Store metadata
-        metadata_path = doc_dir / "metadata.json"
-        with open(metadata_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(metadata), f, indent=2, ensure_ascii=False)
+        self._store_metadata(metadata)
 
-        # Create anchors directory
-        (doc_dir / "anchors").mkdir(exist_ok=True)
+    @staticmethod
+    def _open_temp(directory: Path, mode: str) -> Tuple[Path, Any]:
+        """
+        Open a uniquely named, buffered temp file for a write-then-rename
+
+        Unique names keep concurrent writers (e.g. from the async loader's
+        thread pool) from clobbering each other's partial files; the file is
+        created with the umask-derived mode open() would use.
+        """
+        tmp_path, fd = create_temp_file(directory)
+        if 'b' in mode:
+            return tmp_path, os.fdopen(fd, mode, buffering=WRITE_BUFFER_SIZE)
+        return tmp_path, os.fdopen(fd, mode, buffering=WRITE_BUFFER_SIZE, encoding='utf-8', newline='')
+
+    def _publish_content_file(self, doc_id: str, tmp_path: Path):
+        """Move a fully written plain content file into place"""
+        content_path = self._content_path(doc_id)
+        self.content_cache.invalidate(content_path)
+        os.replace(tmp_path, content_path)
+
+    def _store_metadata(self, metadata: DocumentMetadata):
+        """Store document metadata and publish it in the catalog"""
+        doc_dir = self.storage_path / metadata.id
+        self._section_tables[metadata.id] = SectionOffsetTable.from_sections(metadata.sections)
+
+        # Fields are already JSON-ready; avoid asdict's deep copy of every section
+        metadata_dict = dict(vars(metadata))
+        metadata_path = doc_dir / "metadata.json"
+        tmp_path, f = self._open_temp(doc_dir, 'w')
+        with f:
+            # Compact output keeps the C encoder path (indent falls back to pure Python)
+            json.dump(metadata_dict, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, metadata_path)
+        self.catalog.upsert(metadata_dict)
 
-        logger.info(f"Stored document {doc_id} in {doc_dir}")
+        logger.info(f"Stored document {metadata.id} in {doc_dir}")
 
     def _store_anchor(self, anchor: DocumentAnchor):
         """Store anchor reference"""
-        doc_id = anchor.metadata['doc_id']
-        anchor_dir = self.storage_path / doc_id / "anchors"
-        anchor_dir.mkdir(exist_ok=True)
+        self._store_anchors([anchor])
 
-        anchor_path = anchor_dir / f"{anchor.id}.json"
-        with open(anchor_path, 'w', encoding='utf-8') as f:
-            json.dump(asdict(anchor), f, indent=2, ensure_ascii=False)
+    def _store_anchors(self, anchors: List[DocumentAnchor]):
+        """Store anchor references in one transaction"""
+        self.anchor_store.put_many(asdict(anchor) for anchor in anchors)
 
     def _load_document_from_storage(self, doc_id: str):
         """Load document metadata from storage"""
@@ -586,23 +1075,188 @@ class DocumentLoader:
         metadata = DocumentMetadata(**metadata_dict)
         self.loaded_documents[doc_id] = metadata
 
-    def _get_anchor_context(self, content: str, position: int, context_size: int = 200) -> str:
-        """Get context around a position in the content"""
-        start = max(0, position - context_size // 2)
-        end = min(len(content), position + context_size // 2)
-        return content[start:end]
-
-    def list_documents(self) -> List[Dict[str, Any]]:
-        """List all loaded documents"""
-        documents = []
-        for doc_id in self.loaded_documents:
-            doc = self.loaded_documents[doc_id]
-            documents.append({
-                'id': doc.id,
-                'title': doc.title,
-                'source': doc.source,
-                'version': doc.version,
-                'sections_count': len(doc.sections),
-                'loaded_at': doc.loaded_at
-            })
-        return documents
\ No newline at end of file
+    @staticmethod
+    def _is_file_source(source: Union[str, Path]) -> bool:
+        """Whether a source refers to an existing file (raw content strings are not paths)"""
+        if isinstance(source, Path):
+            return source.exists()
+        if not isinstance(source, str) or '\n' in source:
+            return False
+        try:
+            return Path(source).exists()
+        except OSError:
+            # e.g. content longer than the filesystem's name limit
+            return False
+
+    def _content_path(self, doc_id: str) -> Path:
+        """Path of a document's plain stored content"""
+        return self.storage_path / doc_id / "content.txt"
+
+    def _read_content(self, doc_id: str, start_byte: int = 0, end_byte: Optional[int] = None) -> memoryview:
+        """Read a byte range of a document's content from its blob or plain content file"""
+        if doc_id not in self.loaded_documents:
+            self._load_document_from_storage(doc_id)
+
+        content_blob = self.loaded_documents[doc_id].content_blob
+        if content_blob:
+            return self.blob_store.read(content_blob, start_byte, end_byte)
+        return self.content_cache.slice(self._content_path(doc_id), start_byte, end_byte)
+
+    def _get_section_table(self, doc_id: str) -> SectionOffsetTable:
+        """Get (building on first use) the section offset table for a document"""
+        table = self._section_tables.get(doc_id)
+        if table is not None:
+            return table
+
+        if doc_id not in self.loaded_documents:
+            self._load_document_from_storage(doc_id)
+        sections = self.loaded_documents[doc_id].sections
+
+        if any(section.get('start_byte') is None for section in sections):
+            # Documents stored before byte offsets were recorded
+            content = self.get_document_content(doc_id)
+            self._assign_byte_offsets(content, sections)
+
+        table = SectionOffsetTable.from_sections(sections)
+        self._section_tables[doc_id] = table
+        return table
+
+    def _assign_byte_offsets(self, content: str, sections: List[Union[DocumentSection, Dict[str, Any]]]):
+        """Record UTF-8 byte offsets for section boundaries (sections may be dataclasses or dicts)"""
+        records = [section if isinstance(section, dict) else section.__dict__ for section in sections]
+        bounds = [
+            (min(record['start_position'], len(content)),
+             len(content) if record['end_position'] is None else min(record['end_position'], len(content)))
+            for record in records
+        ]
+
+        if content.isascii():
+            # Byte offsets equal character offsets
+            offsets = None
+        else:
+            offsets = char_to_byte_offsets(content, [position for bound in bounds for position in bound])
+
+        for record, (start, end) in zip(records, bounds):
+            record['start_byte'] = offsets[start] if offsets else start
+            record['end_byte'] = offsets[end] if offsets else end
+
+    def search_sections(self, query: str, limit: int = 10, doc_ids: Optional[List[str]] = None,
+                        include_matches: bool = True) -> List[Dict[str, Any]]:
+        """
+        BM25-ranked search over indexed document sections
+
+        Args:
+            query: Free-text query; "quoted phrases" must match exactly
+            limit: Maximum sections to return
+            doc_ids: Restrict results to these documents
+            include_matches: Add document character positions of matched terms/phrases
+
+        Returns:
+            Hits with doc_id, section_id, title, score and (optionally) matches,
+            whose positions can be passed straight to create_anchor_reference
+        """
+        hits = self.search_index.search(query, limit=limit, doc_ids=doc_ids)
+        if include_matches:
+            terms, phrases = parse_query(query)
+            for hit in hits:
+                hit['matches'] = self._find_matches(hit['doc_id'], hit['section_id'], terms, phrases)
+        return hits
+
+    def rebuild_search_index(self) -> int:
+        """
+        Index every stored document (e.g. documents stored before indexing existed)
+
+        Returns:
+            Number of documents indexed
+        """
+        indexed = 0
+        cursor = None
+        while True:
+            page = self.list_documents_page(limit=100, cursor=cursor)
+            for document in page['documents']:
+                if document['id'] not in self.loaded_documents:
+                    self._load_document_from_storage(document['id'])
+                self._index_document(self.loaded_documents[document['id']])
+                indexed += 1
+            cursor = page['next_cursor']
+            if not cursor:
+                return indexed
+
+    def _index_document(self, metadata: DocumentMetadata, content: Optional[str] = None):
+        """Add a document's sections to the search index"""
+        def section_texts():
+            for section in metadata.sections:
+                if content is not None:
+                    text = content[section['start_position']:section['end_position']]
+                else:
+                    text = self.get_document_content(metadata.id, section['id'])
+                yield section['id'], section['title'], text
+
+        self.search_index.add_document(metadata.id, section_texts())
+
+    def _find_matches(self, doc_id: str, section_id: str, terms: List[str],
+                      phrases: List[List[str]]) -> List[Dict[str, Any]]:
+        """Document character positions of query terms and phrases within a section"""
+        section = self._get_section_table(doc_id).get(section_id)
+        text = self.get_document_content(doc_id, section_id)
+        tokens = [(match.group().lower(), match.start(), match.end()) for match in TOKEN_PATTERN.finditer(text)]
+        base = section['start_position']
+
+        matches = []
+        phrase_terms = {term for phrase in phrases for term in phrase}
+        for index, (token, start, end) in enumerate(tokens):
+            for phrase in phrases:
+                window = tokens[index:index + len(phrase)]
+                if [t[0] for t in window] == phrase:
+                    matches.append({'text': text[start:window[-1][2]], 'position': base + start, 'phrase': True})
+            if token in terms and token not in phrase_terms:
+                matches.append({'text': text[start:end], 'position': base + start, 'phrase': False})
+        return matches
+
+    def list_documents(self, source: Optional[str] = None, organization: Optional[str] = None,
+                       document_type: Optional[str] = None, limit: Optional[int] = None,
+                       cursor: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        List stored documents from the catalog
+
+        Args:
+            source: Only documents from this source
+            organization: Only documents from this organization
+            document_type: Only documents of this type
+            limit: Maximum documents to return
+            cursor: Continue after this document ID (see list_documents_page)
+
+        Returns:
+            Catalog entries ordered by document ID
+        """
+        return self.list_documents_page(source, organization, document_type, limit, cursor)['documents']
+
+    def list_documents_page(self, source: Optional[str] = None, organization: Optional[str] = None,
+                            document_type: Optional[str] = None, limit: Optional[int] = 100,
+                            cursor: Optional[str] = None) -> Dict[str, Any]:
+        """
+        One page of stored documents with the cursor for the next page
+
+        Returns:
+            Dictionary with documents, next_cursor (None on the last page) and total
+        """
+        self._ensure_catalog()
+        filters = {'source': source, 'organization': organization, 'document_type': document_type}
+        documents, next_cursor = self.catalog.list(limit=limit, cursor=cursor, **filters)
+        return {
+            'documents': documents,
+            'next_cursor': next_cursor,
+            'total': self.catalog.count(**filters)
+        }
+
+    def count_documents(self, source: Optional[str] = None, organization: Optional[str] = None,
+                        document_type: Optional[str] = None) -> int:
+        """Count stored documents matching the filters"""
+        self._ensure_catalog()
+        return self.catalog.count(source=source, organization=organization, document_type=document_type)
+
+    def _ensure_catalog(self):
+        """Backfill the catalog from stored metadata once per store"""
+        if not self._catalog_backfilled:
+            self.catalog.backfill_from_storage(self.storage_path)
+            self._catalog_backfilled = True
\ No newline at end of file
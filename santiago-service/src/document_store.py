@@ -0,0 +1,805 @@
+#!/usr/bin/env python3
+"""
+Santiago Layer 0: Memory-Mapped Document Content Store
+
+Serves stored document content through read-only memory maps so that section
+and anchor reads only touch the bytes they need. A small LRU keeps the most
+recently used maps open, and each document has a section offset table giving
+O(1) section lookup by ID and byte offsets for zero-copy section slices.
+
+Anchors for all documents live in a single SQLite store, so an ingestion that
+creates thousands of anchors writes them in one transaction instead of one
+JSON file each. A companion SQLite catalog lists stored documents with
+indexed filters and cursor pagination.
+
+Document content is stored in a content-addressed blob store keyed by the
+SHA-256 checksum, so identical content loaded under different titles or
+versions is stored once. Blobs are split into independently compressed frames
+with a trailing seek table (the zstd seekable format), so a section slice only
+decompresses the frames it overlaps.
+
+Author: GitHub Copilot
+Date: November 12, 2025
+"""
+
+import os
+import mmap
+import bisect
+import json
+import struct
+import sqlite3
+import hashlib
+import threading
+import uuid
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Union
+import logging
+
+# Optional zstd compression for content blobs (falls back to zlib)
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Worst-case UTF-8 bytes per character, used to bound partial decodes
+MAX_UTF8_BYTES_PER_CHAR = 4
+
+# Buffer size for content and metadata writes (fewer, larger write syscalls)
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+def create_temp_file(directory: Union[str, Path]) -> Tuple[Path, int]:
+    """
+    Create a uniquely named temp file in a directory for a write-then-rename
+
+    Unlike tempfile.mkstemp, which always creates 0600 files, the file is
+    created with mode 0666 so the kernel applies the process umask, and files
+    renamed into place get the same permissions as files created with open().
+
+    Returns:
+        Temp file path and an open write-only descriptor
+    """
+    path = Path(directory) / f".{uuid.uuid4().hex}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    return path, os.open(path, flags, 0o666)
+
+class ByteOffsetTracker:
+    """
+    Converts non-decreasing character offsets into UTF-8 byte offsets
+
+    Each call only encodes the text since the previous offset, so converting
+    every boundary of a document costs one pass over its content.
+    """
+
+    def __init__(self, content: str):
+        self.content = content
+        self.ascii = content.isascii()
+        self._char_pos = 0
+        self._byte_pos = 0
+
+    def __call__(self, char_position: int) -> int:
+        if self.ascii:
+            return char_position
+        if char_position < self._char_pos:
+            raise ValueError("Character offsets must be non-decreasing")
+        self._byte_pos += len(self.content[self._char_pos:char_position].encode('utf-8'))
+        self._char_pos = char_position
+        return self._byte_pos
+
+def char_to_byte_offsets(content: str, positions: Iterable[int]) -> Dict[int, int]:
+    """
+    Map character offsets in content to UTF-8 byte offsets in one linear pass
+
+    Args:
+        content: Decoded document content
+        positions: Character offsets to convert
+
+    Returns:
+        Mapping of character offset to byte offset
+    """
+    tracker = ByteOffsetTracker(content)
+    return {position: tracker(position)
+            for position in sorted({min(max(p, 0), len(content)) for p in positions})}
+
+@dataclass
+class SectionOffsetTable:
+    """Per-document section index with character and byte offsets"""
+    sections: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    char_starts: List[int] = field(default_factory=list)
+    byte_starts: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_sections(cls, sections: List[Dict[str, Any]]) -> "SectionOffsetTable":
+        """Build a table from section dictionaries carrying start_byte/end_byte"""
+        table = cls(sections={section['id']: section for section in sections})
+        for char_start, byte_start in sorted({(s['start_position'], s['start_byte']) for s in sections}):
+            table.char_starts.append(char_start)
+            table.byte_starts.append(byte_start)
+        return table
+
+    def get(self, section_id: str) -> Optional[Dict[str, Any]]:
+        """O(1) section lookup by ID"""
+        return self.sections.get(section_id)
+
+    def locate(self, char_position: int) -> Tuple[int, int]:
+        """
+        Find the nearest known (char, byte) offset pair at or before a character position
+
+        Partial decodes can start from the returned byte offset because
+        section starts always fall on character boundaries.
+        """
+        index = bisect.bisect_right(self.char_starts, char_position) - 1
+        if index < 0:
+            return 0, 0
+        return self.char_starts[index], self.byte_starts[index]
+
+class MappedContentCache:
+    """
+    LRU of open, read-only memory maps over document content files
+
+    Slices are returned as memoryviews over the map, so section reads do not
+    copy the document. Maps are reopened transparently after eviction; a map
+    evicted or invalidated while views of it are alive stays open until the
+    last view is released.
+    """
+
+    def __init__(self, max_open: int = 32):
+        self.max_open = max_open
+        self._maps: "OrderedDict[Path, Optional[mmap.mmap]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def view(self, path: Union[str, Path]) -> memoryview:
+        """Zero-copy view of a whole content file"""
+        path = Path(path)
+        with self._lock:
+            if path in self._maps:
+                self._maps.move_to_end(path)
+                mapped = self._maps[path]
+            else:
+                mapped = self._open(path)
+                self._maps[path] = mapped
+                self._evict()
+            # Export the view while holding the lock, so a concurrent eviction
+            # or invalidation cannot close the map before the view pins it
+            return memoryview(mapped) if mapped is not None else memoryview(b"")
+
+    def slice(self, path: Union[str, Path], start: int, end: Optional[int] = None) -> memoryview:
+        """Zero-copy view of a byte range of a content file"""
+        view = self.view(path)
+        return view[start:end if end is not None else len(view)]
+
+    def size(self, path: Union[str, Path]) -> int:
+        """Size of a content file in bytes"""
+        return len(self.view(path))
+
+    def invalidate(self, path: Union[str, Path]):
+        """Close the map for a file that is about to be rewritten"""
+        with self._lock:
+            mapped = self._maps.pop(Path(path), None)
+        self._close(mapped)
+
+    def close(self):
+        """Close all open maps"""
+        with self._lock:
+            maps = list(self._maps.values())
+            self._maps.clear()
+        for mapped in maps:
+            self._close(mapped)
+
+    def _open(self, path: Path) -> Optional[mmap.mmap]:
+        if not path.exists():
+            raise FileNotFoundError(f"Document content not found: {path}")
+        if not path.stat().st_size:
+            # Zero-length files cannot be mapped
+            return None
+        # The map keeps its own duplicate of the descriptor, so the file can be closed
+        with open(path, 'rb') as handle:
+            return mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _evict(self):
+        while len(self._maps) > self.max_open:
+            _, mapped = self._maps.popitem(last=False)
+            self._close(mapped)
+
+    @staticmethod
+    def _close(mapped: Optional[mmap.mmap]):
+        if mapped is None:
+            return
+        try:
+            mapped.close()
+        except BufferError:
+            # A caller still holds a view; the map is released with it
+            pass
+
+class AnchorStore:
+    """
+    SQLite-backed storage for document anchors
+
+    Replaces the one-JSON-file-per-anchor layout under ``<doc>/anchors/``.
+    Anchors are written in batches inside a single transaction and resolved
+    through the primary key index.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS anchors (
+        id TEXT PRIMARY KEY,
+        doc_id TEXT NOT NULL,
+        section_id TEXT NOT NULL,
+        text TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        context TEXT,
+        anchor_type TEXT,
+        metadata TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_anchors_doc_section ON anchors (doc_id, section_id);
+    CREATE TABLE IF NOT EXISTS migrations (
+        name TEXT PRIMARY KEY,
+        applied_at TEXT NOT NULL
+    );
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL with NORMAL sync: one fsync per checkpoint instead of per write
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def put_many(self, anchors: Iterable[Dict[str, Any]]) -> int:
+        """
+        Store anchors in a single transaction
+
+        Args:
+            anchors: Anchor dictionaries (DocumentAnchor fields)
+
+        Returns:
+            Number of anchors written
+        """
+        rows = [(
+            anchor['id'],
+            anchor['metadata']['doc_id'],
+            anchor['section_id'],
+            anchor['text'],
+            anchor['position'],
+            anchor.get('context'),
+            anchor.get('anchor_type'),
+            json.dumps(anchor.get('metadata', {}), ensure_ascii=False)
+        ) for anchor in anchors]
+
+        if rows:
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO anchors "
+                    "(id, doc_id, section_id, text, position, context, anchor_type, metadata) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows
+                )
+        return len(rows)
+
+    def get(self, anchor_id: str) -> Optional[Dict[str, Any]]:
+        """Get an anchor by ID"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM anchors WHERE id = ?", (anchor_id,)).fetchone()
+        return self._row_to_anchor(row) if row else None
+
+    def list_for_document(self, doc_id: str, section_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """List anchors of a document, optionally restricted to one section"""
+        query = "SELECT * FROM anchors WHERE doc_id = ?"
+        params: Tuple[str, ...] = (doc_id,)
+        if section_id:
+            query += " AND section_id = ?"
+            params += (section_id,)
+        with self._lock:
+            rows = self._conn.execute(query + " ORDER BY position", params).fetchall()
+        return [self._row_to_anchor(row) for row in rows]
+
+    def migrate_json_anchors(self, storage_path: Union[str, Path]) -> int:
+        """
+        One-time import of legacy ``<doc>/anchors/*.json`` files
+
+        The JSON files are left in place; the migration is recorded so later
+        startups skip the directory walk.
+
+        Returns:
+            Number of anchors imported (0 if already migrated)
+        """
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT 1 FROM migrations WHERE name = 'json_anchors'"
+            ).fetchone()
+        if done:
+            return 0
+
+        imported = 0
+        batch = []
+        for anchor_path in Path(storage_path).glob("*/anchors/*.json"):
+            try:
+                with open(anchor_path, 'r', encoding='utf-8') as f:
+                    anchor = json.load(f)
+                anchor.setdefault('metadata', {}).setdefault('doc_id', anchor_path.parent.parent.name)
+                batch.append(anchor)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable anchor file {anchor_path}: {e}")
+                continue
+            if len(batch) >= 1000:
+                imported += self.put_many(batch)
+                batch = []
+        imported += self.put_many(batch)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO migrations (name, applied_at) VALUES ('json_anchors', datetime('now'))"
+            )
+        if imported:
+            logger.info(f"Migrated {imported} JSON anchors into {self.db_path}")
+        return imported
+
+    @staticmethod
+    def _row_to_anchor(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            'id': row['id'],
+            'text': row['text'],
+            'section_id': row['section_id'],
+            'position': row['position'],
+            'context': row['context'],
+            'anchor_type': row['anchor_type'],
+            'metadata': json.loads(row['metadata']) if row['metadata'] else {}
+        }
+
+
+class DocumentCatalog:
+    """
+    SQLite-backed catalog of stored documents
+
+    One row per document with the fields needed for listing and filtering, so
+    listing the store is an indexed query rather than a directory walk that
+    parses every ``metadata.json``. Pages are keyset-paginated on document ID;
+    the cursor is the last ID of the previous page.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS documents (
+        id TEXT PRIMARY KEY,
+        title TEXT,
+        source TEXT,
+        version TEXT,
+        organization TEXT,
+        document_type TEXT,
+        format TEXT,
+        checksum TEXT,
+        sections_count INTEGER NOT NULL DEFAULT 0,
+        loaded_at TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_documents_source ON documents (source, id);
+    CREATE INDEX IF NOT EXISTS idx_documents_organization ON documents (organization, id);
+    CREATE INDEX IF NOT EXISTS idx_documents_type ON documents (document_type, id);
+    CREATE TABLE IF NOT EXISTS migrations (
+        name TEXT PRIMARY KEY,
+        applied_at TEXT NOT NULL
+    );
+    """
+
+    _COLUMNS = ('id', 'title', 'source', 'version', 'organization', 'document_type',
+                'format', 'checksum', 'sections_count', 'loaded_at')
+
+    # Filter name -> column
+    _FILTERS = {'source': 'source', 'organization': 'organization', 'document_type': 'document_type'}
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def upsert_many(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """
+        Insert or update catalog entries in a single transaction
+
+        Args:
+            documents: DocumentMetadata dictionaries (``sections`` or ``sections_count``)
+
+        Returns:
+            Number of entries written
+        """
+        rows = [self._to_row(document) for document in documents]
+        if rows:
+            placeholders = ", ".join("?" * len(self._COLUMNS))
+            with self._lock, self._conn:
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO documents ({', '.join(self._COLUMNS)}) VALUES ({placeholders})",
+                    rows
+                )
+        return len(rows)
+
+    def upsert(self, document: Dict[str, Any]):
+        """Insert or update a single catalog entry"""
+        self.upsert_many([document])
+
+    def remove(self, doc_id: str):
+        """Remove a document from the catalog"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM documents WHERE id = ?", (doc_id,))
+
+    def get(self, doc_id: str) -> Optional[Dict[str, Any]]:
+        """Get a catalog entry by document ID"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM documents WHERE id = ?", (doc_id,)).fetchone()
+        return dict(row) if row else None
+
+    def list(self, limit: Optional[int] = None, cursor: Optional[str] = None,
+             **filters: Optional[str]) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        List catalog entries ordered by document ID
+
+        Args:
+            limit: Maximum entries to return (all if None)
+            cursor: Return entries after this document ID
+            **filters: source, organization and/or document_type to match exactly
+
+        Returns:
+            Tuple of (entries, next_cursor); next_cursor is None on the last page
+        """
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be positive")
+        where, params = self._where(filters)
+        if cursor is not None:
+            where.append("id > ?")
+            params.append(cursor)
+
+        query = "SELECT * FROM documents"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY id"
+        if limit is not None:
+            # Fetch one extra row to know whether another page exists
+            query += " LIMIT ?"
+            params.append(limit + 1)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+
+        next_cursor = None
+        if limit is not None and len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = rows[-1]['id']
+        return [dict(row) for row in rows], next_cursor
+
+    def count(self, **filters: Optional[str]) -> int:
+        """Count catalog entries matching the filters"""
+        where, params = self._where(filters)
+        query = "SELECT COUNT(*) FROM documents"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        with self._lock:
+            return self._conn.execute(query, params).fetchone()[0]
+
+    def backfill_from_storage(self, storage_path: Union[str, Path]) -> int:
+        """
+        One-time import of documents stored before the catalog existed
+
+        Returns:
+            Number of documents imported (0 if already backfilled)
+        """
+        with self._lock:
+            done = self._conn.execute(
+                "SELECT 1 FROM migrations WHERE name = 'metadata_backfill'"
+            ).fetchone()
+        if done:
+            return 0
+
+        imported = 0
+        batch = []
+        for metadata_path in Path(storage_path).glob("*/metadata.json"):
+            try:
+                with open(metadata_path, 'r', encoding='utf-8') as f:
+                    batch.append(json.load(f))
+            except (OSError, ValueError) as e:
+                logger.warning(f"Skipping unreadable document metadata {metadata_path}: {e}")
+                continue
+            if len(batch) >= 1000:
+                imported += self.upsert_many(batch)
+                batch = []
+        imported += self.upsert_many(batch)
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO migrations (name, applied_at) VALUES ('metadata_backfill', datetime('now'))"
+            )
+        if imported:
+            logger.info(f"Catalogued {imported} stored documents into {self.db_path}")
+        return imported
+
+    def _where(self, filters: Dict[str, Optional[str]]) -> Tuple[List[str], List[Any]]:
+        where, params = [], []
+        for name, value in filters.items():
+            if name not in self._FILTERS:
+                raise ValueError(f"Unknown catalog filter: {name}")
+            if value is not None:
+                where.append(f"{self._FILTERS[name]} = ?")
+                params.append(value)
+        return where, params
+
+    @staticmethod
+    def _to_row(document: Dict[str, Any]) -> Tuple[Any, ...]:
+        sections_count = document.get('sections_count')
+        if sections_count is None:
+            sections_count = len(document.get('sections') or [])
+        return (
+            document['id'],
+            document.get('title'),
+            document.get('source'),
+            document.get('version'),
+            document.get('organization'),
+            document.get('document_type'),
+            document.get('format'),
+            document.get('checksum'),
+            sections_count,
+            document.get('loaded_at')
+        )
+
+
+# zstd seekable format constants (https://github.com/facebook/zstd/tree/dev/contrib/seekable_format)
+_SKIPPABLE_MAGIC = 0x184D2A5E
+_SEEKABLE_MAGIC = 0x8F92EAB1
+_SEEK_FOOTER = struct.Struct('<IBI')  # Number_Of_Frames, Seek_Table_Descriptor, Seekable_Magic_Number
+_SEEK_ENTRY = struct.Struct('<II')    # Compressed_Size, Decompressed_Size
+
+# File extension per codec; blobs written with either codec remain readable
+_CODEC_EXTENSIONS = {'zstd': '.zst', 'zlib': '.zz'}
+
+class BlobWriter:
+    """
+    Streaming writer for a single content blob
+
+    Content is hashed and compressed frame by frame as it is written, so the
+    writer holds at most one frame of uncompressed data. The blob is moved to
+    its content address on close, or discarded if that content already exists.
+    """
+
+    def __init__(self, store: "BlobStore"):
+        self.store = store
+        self._hash = hashlib.sha256()
+        self._buffer = bytearray()
+        self._entries: List[Tuple[int, int]] = []
+        self.size = 0
+        self._tmp_path, fd = create_temp_file(store.root)
+        self._file = os.fdopen(fd, 'wb', buffering=WRITE_BUFFER_SIZE)
+        self._compressor = store._new_compressor()
+
+    def write(self, data: Union[bytes, str]):
+        """Append content (str is encoded as UTF-8)"""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        self._hash.update(data)
+        self.size += len(data)
+        self._buffer += data
+        frame_size = self.store.frame_size
+        while len(self._buffer) >= frame_size:
+            self._write_frame(bytes(self._buffer[:frame_size]))
+            del self._buffer[:frame_size]
+
+    def close(self) -> str:
+        """
+        Finish the blob and move it to its content address
+
+        Returns:
+            SHA-256 checksum of the content (the blob key)
+        """
+        if self._buffer:
+            self._write_frame(bytes(self._buffer))
+            self._buffer.clear()
+
+        seek_table = b''.join(_SEEK_ENTRY.pack(c, d) for c, d in self._entries)
+        seek_table += _SEEK_FOOTER.pack(len(self._entries), 0, _SEEKABLE_MAGIC)
+        self._file.write(struct.pack('<II', _SKIPPABLE_MAGIC, len(seek_table)) + seek_table)
+        self._file.close()
+
+        checksum = self._hash.hexdigest()
+        if self.store.exists(checksum):
+            # Deduplicated: identical content is already stored
+            self._tmp_path.unlink()
+        else:
+            final_path = self.store._path_for(checksum, self.store.codec)
+            final_path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp_path, final_path)
+        return checksum
+
+    def abort(self):
+        """Discard a partially written blob"""
+        self._file.close()
+        if self._tmp_path.exists():
+            self._tmp_path.unlink()
+
+    def _write_frame(self, frame: bytes):
+        compressed = self._compressor(frame)
+        self._file.write(compressed)
+        self._entries.append((len(compressed), len(frame)))
+
+@dataclass
+class _SeekableBlob:
+    """Frame table of an opened blob"""
+    path: Path
+    codec: str
+    compressed_starts: List[int]
+    decompressed_starts: List[int]
+    size: int
+
+class BlobStore:
+    """
+    Content-addressed, frame-compressed storage for document content
+
+    Blobs live at ``<root>/<checksum[:2]>/<checksum>.<ext>``. Blob files are
+    read through the shared memory-map cache, and recently decompressed frames
+    are kept in a small LRU.
+    """
+
+    def __init__(self, root: Union[str, Path], content_cache: Optional[MappedContentCache] = None,
+                 frame_size: int = 64 * 1024, codec: Optional[str] = None,
+                 compression_level: int = 6, max_cached_frames: int = 64):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.content_cache = content_cache or MappedContentCache()
+        self.frame_size = frame_size
+        self.codec = codec or ('zstd' if HAS_ZSTD else 'zlib')
+        if self.codec == 'zstd' and not HAS_ZSTD:
+            raise ImportError("zstandard required for zstd blob compression")
+        self.compression_level = compression_level
+        self.max_cached_frames = max_cached_frames
+        self._blobs: Dict[str, _SeekableBlob] = {}
+        self._frames: "OrderedDict[Tuple[str, int], bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def writer(self) -> BlobWriter:
+        """Start a streaming blob write"""
+        return BlobWriter(self)
+
+    def put(self, content: Union[bytes, str]) -> str:
+        """
+        Store content, deduplicating by checksum
+
+        Returns:
+            SHA-256 checksum of the content (the blob key)
+        """
+        writer = self.writer()
+        try:
+            writer.write(content)
+        except Exception:
+            writer.abort()
+            raise
+        return writer.close()
+
+    def exists(self, checksum: str) -> bool:
+        """Whether a blob with this checksum is stored"""
+        return self._find(checksum) is not None
+
+    def size(self, checksum: str) -> int:
+        """Uncompressed size of a blob in bytes"""
+        return self._open(checksum).size
+
+    def read(self, checksum: str, start: int = 0, end: Optional[int] = None) -> memoryview:
+        """
+        Read an uncompressed byte range, decompressing only the frames it overlaps
+
+        Args:
+            checksum: Blob key
+            start: Start byte offset (inclusive)
+            end: End byte offset (exclusive), defaults to the end of the blob
+
+        Returns:
+            memoryview over the requested bytes
+        """
+        blob = self._open(checksum)
+        end = blob.size if end is None else min(end, blob.size)
+        start = max(0, start)
+        if start >= end:
+            return memoryview(b"")
+
+        first = bisect.bisect_right(blob.decompressed_starts, start) - 1
+        last = bisect.bisect_right(blob.decompressed_starts, end - 1) - 1
+        if first == last:
+            frame_start = blob.decompressed_starts[first]
+            return memoryview(self._frame(checksum, blob, first))[start - frame_start:end - frame_start]
+
+        parts = bytearray()
+        for index in range(first, last + 1):
+            frame_start = blob.decompressed_starts[index]
+            frame = self._frame(checksum, blob, index)
+            parts += frame[max(start - frame_start, 0):end - frame_start]
+        return memoryview(bytes(parts))
+
+    def _path_for(self, checksum: str, codec: str) -> Path:
+        return self.root / checksum[:2] / f"{checksum}{_CODEC_EXTENSIONS[codec]}"
+
+    def _find(self, checksum: str) -> Optional[Tuple[Path, str]]:
+        for codec in _CODEC_EXTENSIONS:
+            path = self._path_for(checksum, codec)
+            if path.exists():
+                return path, codec
+        return None
+
+    def _open(self, checksum: str) -> _SeekableBlob:
+        with self._lock:
+            blob = self._blobs.get(checksum)
+        if blob is not None:
+            return blob
+
+        found = self._find(checksum)
+        if found is None:
+            raise FileNotFoundError(f"Content blob not found: {checksum}")
+        path, codec = found
+
+        view = self.content_cache.view(path)
+        frame_count, _, magic = _SEEK_FOOTER.unpack(view[-_SEEK_FOOTER.size:])
+        if magic != _SEEKABLE_MAGIC:
+            raise ValueError(f"Corrupt content blob (missing seek table): {path}")
+        table_start = len(view) - _SEEK_FOOTER.size - frame_count * _SEEK_ENTRY.size
+
+        compressed_starts, decompressed_starts = [], []
+        compressed_pos = decompressed_pos = 0
+        for index in range(frame_count):
+            compressed_size, decompressed_size = _SEEK_ENTRY.unpack_from(view, table_start + index * _SEEK_ENTRY.size)
+            compressed_starts.append(compressed_pos)
+            decompressed_starts.append(decompressed_pos)
+            compressed_pos += compressed_size
+            decompressed_pos += decompressed_size
+        compressed_starts.append(compressed_pos)
+
+        blob = _SeekableBlob(path, codec, compressed_starts, decompressed_starts, decompressed_pos)
+        with self._lock:
+            self._blobs[checksum] = blob
+        return blob
+
+    def _frame(self, checksum: str, blob: _SeekableBlob, index: int) -> bytes:
+        key = (checksum, index)
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is not None:
+                self._frames.move_to_end(key)
+                return frame
+
+        compressed = self.content_cache.view(blob.path)[
+            blob.compressed_starts[index]:blob.compressed_starts[index + 1]
+        ]
+        if blob.codec == 'zstd':
+            frame = zstandard.ZstdDecompressor().decompress(compressed)
+        else:
+            frame = zlib.decompress(compressed)
+
+        with self._lock:
+            self._frames[key] = frame
+            while len(self._frames) > self.max_cached_frames:
+                self._frames.popitem(last=False)
+        return frame
+
+    def _new_compressor(self):
+        if self.codec == 'zstd':
+            # Content size in the frame header lets decompress() size its output
+            compressor = zstandard.ZstdCompressor(level=self.compression_level, write_content_size=True)
+            return compressor.compress
+        return lambda frame: zlib.compress(frame, self.compression_level)
@@ -18,15 +18,30 @@ Author: GitHub Copilot
 Date: November 10, 2025
 """
 
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Dict, List, Any, Optional, Tuple, Set, Iterable, Iterator, Sequence
 from dataclasses import dataclass, asdict
 from enum import Enum
+from bisect import bisect_left
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+import hashlib
+import os
 import re
 import logging
 from datetime import datetime
 import json
 
 from semantic_relationships import SemanticRelationships, RelationshipType
+from discovery_store import DiscoveryStore
+
+# Vectorized batch scoring (falls back to per-candidate scoring)
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -63,6 +78,33 @@ class RelationshipCandidate:
     discovered_at: datetime
     reviewed: bool = False
     approved: bool = False
+    occurrences: int = 1
+
+    @staticmethod
+    def make_id(source_entity: str, target_entity: str, relationship_type: str) -> str:
+        """Stable candidate ID derived from the (source, target, type) merge key"""
+        key = f"{source_entity.lower()}\x1f{target_entity.lower()}\x1f{relationship_type}"
+        return f"candidate_{hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]}"
+
+    def merge(self, other: 'RelationshipCandidate'):
+        """
+        Fold another sighting of the same (source, target, type) into this one
+
+        Evidence sources are unioned, confidence becomes the mean over all
+        sightings, and the context of the most confident sighting is kept.
+        """
+        for source in other.evidence_sources:
+            if source not in self.evidence_sources:
+                self.evidence_sources.append(source)
+        total = self.occurrences + other.occurrences
+        if other.confidence_score > self.confidence_score:
+            self.context = other.context
+            self.clinical_validity = other.clinical_validity
+        self.confidence_score = (
+            self.confidence_score * self.occurrences + other.confidence_score * other.occurrences
+        ) / total
+        self.occurrences = total
+        self.discovered_at = min(self.discovered_at, other.discovered_at)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization"""
@@ -72,6 +114,17 @@ class RelationshipCandidate:
         data['similar_existing_rels'] = [(rel.value, score) for rel, score in self.similar_existing_rels]
         return data
 
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RelationshipCandidate':
+        """Rebuild a candidate from its to_dict form"""
+        data = dict(data)
+        data['discovered_at'] = datetime.fromisoformat(data['discovered_at'])
+        data['clinical_validity'] = ClinicalValidity(data['clinical_validity'])
+        data['similar_existing_rels'] = [
+            (RelationshipType(rel), score) for rel, score in data['similar_existing_rels']
+        ]
+        return cls(**data)
+
 @dataclass
 class RelationshipProposal:
     """Formal proposal for adding a new relationship to the ontology"""
@@ -90,11 +143,75 @@ class RelationshipProposal:
     approved: bool = False
     approved_at: Optional[datetime] = None
 
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for serialization"""
+        data = asdict(self)
+        data['candidate'] = self.candidate.to_dict()
+        data['created_at'] = self.created_at.isoformat()
+        if self.approved_at:
+            data['approved_at'] = self.approved_at.isoformat()
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RelationshipProposal':
+        """Rebuild a proposal from its to_dict form"""
+        data = dict(data)
+        data['candidate'] = RelationshipCandidate.from_dict(data['candidate'])
+        data['created_at'] = datetime.fromisoformat(data['created_at'])
+        if data.get('approved_at'):
+            data['approved_at'] = datetime.fromisoformat(data['approved_at'])
+        return cls(**data)
+
+@dataclass
+class ContextBatchAnalysis:
+    """
+    Scores for a batch of candidate contexts, one entry per candidate
+
+    Numeric scores are NumPy arrays when NumPy is available, lists otherwise.
+    """
+    domain: List[str]
+    evidence_strength: Sequence[float]
+    clinical_relevance: Sequence[float]
+    consistency_score: Sequence[float]
+    confidence_score: Sequence[float]
+    clinical_validity: List[ClinicalValidity]
+
+    def __len__(self) -> int:
+        return len(self.domain)
+
+    def above(self, threshold: float) -> List[int]:
+        """Indices of candidates whose confidence meets the threshold"""
+        if HAS_NUMPY:
+            return np.flatnonzero(np.asarray(self.confidence_score) >= threshold).tolist()
+        return [i for i, score in enumerate(self.confidence_score) if score >= threshold]
+
+    def analysis(self, index: int) -> Dict[str, Any]:
+        """Per-candidate analysis dictionary, as returned by analyze_context"""
+        return {
+            'domain': self.domain[index],
+            'evidence_strength': float(self.evidence_strength[index]),
+            'clinical_relevance': float(self.clinical_relevance[index]),
+            'consistency_score': float(self.consistency_score[index]),
+            'confidence_score': float(self.confidence_score[index]),
+            'clinical_validity': self.clinical_validity[index],
+            'supporting_factors': [],
+            'concerning_factors': []
+        }
+
 class EntityPairExtractor:
     """
     Extracts potential entity pairs from clinical text that may represent relationships
+
+    Entities are sorted by offset and paired within a sliding window, and the
+    relationship indicators are compiled into one alternation that is run
+    once over the text, so extraction is near-linear in text length.
     """
 
+    # Maximum distance between paired entity start offsets
+    PAIR_WINDOW = 200
+    # Characters of surrounding text kept on each side of a pair's context
+    CONTEXT_MARGIN = 50
+
     def __init__(self):
         # Clinical entity patterns
         self.condition_patterns = [
@@ -138,6 +255,30 @@ class EntityPairExtractor:
             ]
         }
 
+        self._compile_patterns()
+
+    def _compile_patterns(self):
+        """Compile entity patterns and the combined indicator alternation"""
+        self._entity_patterns = [
+            (re.compile(pattern, re.IGNORECASE), entity_type)
+            for patterns, entity_type in (
+                (self.condition_patterns, "condition"),
+                (self.medication_patterns, "medication"),
+                (self.procedure_patterns, "procedure"),
+            )
+            for pattern in patterns
+        ]
+        # One named group per relationship type, in precedence order. The
+        # alternation sits in a lookahead so overlapping indicators (such as
+        # "treat" inside "used to treat") are all reported.
+        self._indicator_pattern = re.compile(
+            '(?=' + '|'.join(
+                f"(?P<{rel_type}>{'|'.join(patterns)})"
+                for rel_type, patterns in self.relationship_indicators.items()
+            ) + ')',
+            re.IGNORECASE
+        )
+
     def extract_entity_pairs(self, text: str) -> List[Tuple[str, str, str, str]]:
         """
         Extract potential entity pairs from clinical text
@@ -147,57 +288,73 @@ class EntityPairExtractor:
         """
         pairs = []
 
-        # Find all clinical entities
-        conditions = self._find_entities(text, self.condition_patterns, "condition")
-        medications = self._find_entities(text, self.medication_patterns, "medication")
-        procedures = self._find_entities(text, self.procedure_patterns, "procedure")
-
-        all_entities = conditions + medications + procedures
-
-        # Look for relationships between entities
-        for i, (entity1, type1, pos1) in enumerate(all_entities):
-            for j, (entity2, type2, pos2) in enumerate(all_entities):
-                if i >= j:  # Avoid duplicate pairs and self-pairs
-                    continue
-
-                # Check if entities are close enough in text (within 200 characters)
-                if abs(pos1 - pos2) > 200:
-                    continue
-
-                # Extract context between entities
-                start_pos = min(pos1, pos2)
-                end_pos = max(pos1 + len(entity1), pos2 + len(entity2))
-                context = text[max(0, start_pos - 50):min(len(text), end_pos + 50)]
+        # Find all clinical entities, in text order
+        entities = []
+        for pattern, entity_type in self._entity_patterns:
+            entities.extend((match.group(), entity_type, match.start()) for match in pattern.finditer(text))
+        entities.sort(key=lambda entity: entity[2])
+
+        # Find all relationship indicators once, per relationship type
+        indicators = self._find_indicators(text)
+
+        # Pair each entity with the entities that follow it within the window
+        for i, (entity1, type1, pos1) in enumerate(entities):
+            end1 = pos1 + len(entity1)
+            for j in range(i + 1, len(entities)):
+                entity2, type2, pos2 = entities[j]
+                if pos2 - pos1 > self.PAIR_WINDOW:
+                    break
+
+                # Extract context around both entities
+                end_pos = max(end1, pos2 + len(entity2))
+                context_start = max(0, pos1 - self.CONTEXT_MARGIN)
+                context_end = min(len(text), end_pos + self.CONTEXT_MARGIN)
 
                 # Check for relationship indicators
-                relationship_type = self._identify_relationship_type(context)
+                relationship_type = self._indicator_in_range(indicators, context_start, context_end)
 
                 if relationship_type:
+                    context = text[context_start:context_end]
                     # Determine which entity is source vs target based on relationship
                     source, target = self._determine_direction(entity1, entity2, type1, type2, relationship_type, context)
                     pairs.append((source, target, relationship_type, context))
 
         return pairs
 
-    def _find_entities(self, text: str, patterns: List[str], entity_type: str) -> List[Tuple[str, str, int]]:
-        """Find entities matching given patterns"""
-        entities = []
-        for pattern in patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                entities.append((match.group(), entity_type, match.start()))
-        return entities
-
-    def _identify_relationship_type(self, context: str) -> Optional[str]:
-        """Identify the type of relationship from context"""
-        context_lower = context.lower()
+    def _find_indicators(self, text: str) -> List[Tuple[str, List[int], List[int]]]:
+        """
+        Locate relationship indicators in one pass over the text
 
-        for rel_type, patterns in self.relationship_indicators.items():
-            for pattern in patterns:
-                if re.search(pattern, context_lower):
+        Returns:
+            (relationship_type, starts, ends) per type in precedence order,
+            with starts ascending
+        """
+        spans = {rel_type: ([], []) for rel_type in self.relationship_indicators}
+        for match in self._indicator_pattern.finditer(text):
+            rel_type = match.lastgroup
+            starts, ends = spans[rel_type]
+            starts.append(match.start(rel_type))
+            ends.append(match.end(rel_type))
+        return [(rel_type, starts, ends) for rel_type, (starts, ends) in spans.items() if starts]
+
+    @staticmethod
+    def _indicator_in_range(indicators: List[Tuple[str, List[int], List[int]]],
+                            start: int, end: int) -> Optional[str]:
+        """First relationship type (by precedence) with an indicator inside [start, end)"""
+        for rel_type, starts, ends in indicators:
+            # Overlapping indicators can end out of order; scan the few
+            # that start inside the range
+            for k in range(bisect_left(starts, start), len(starts)):
+                if starts[k] >= end:
+                    break
+                if ends[k] <= end:
                     return rel_type
-
         return None
 
+    def _identify_relationship_type(self, context: str) -> Optional[str]:
+        """Identify the type of relationship from context"""
+        return self._indicator_in_range(self._find_indicators(context), 0, len(context))
+
     def _determine_direction(self, entity1: str, entity2: str, type1: str, type2: str,
                            rel_type: str, context: str) -> Tuple[str, str]:
         """Determine which entity is the source and which is the target"""
@@ -235,6 +392,34 @@ class ContextAnalyzer:
             'moderate': ['cohort study', 'case-control', 'level B evidence', 'prospective study'],
             'weak': ['case report', 'expert opinion', 'level C evidence', 'anecdotal']
         }
+        self.evidence_strength_scores = {'strong': 0.9, 'moderate': 0.7, 'weak': 0.3}
+
+        self.clinical_indicators = [
+            'patient', 'treatment', 'diagnosis', 'prevention', 'management',
+            'clinical', 'medical', 'therapy', 'intervention', 'outcome'
+        ]
+
+        self._compile_vocabulary()
+
+    def _compile_vocabulary(self):
+        """Index every vocabulary phrase as a column of the batch feature matrices"""
+        phrases = set(self.clinical_indicators)
+        for keywords in self.clinical_domains.values():
+            phrases.update(keywords)
+        for indicators in self.evidence_strength_indicators.values():
+            phrases.update(indicators)
+        self._vocabulary = sorted(phrases)
+        self._vocabulary_index = {phrase: i for i, phrase in enumerate(self._vocabulary)}
+
+        def columns(phrase_list):
+            return [self._vocabulary_index[phrase] for phrase in phrase_list]
+
+        self._domain_columns = [(domain, columns(keywords)) for domain, keywords in self.clinical_domains.items()]
+        self._evidence_columns = [
+            (self.evidence_strength_scores[strength], columns(indicators))
+            for strength, indicators in self.evidence_strength_indicators.items()
+        ]
+        self._relevance_columns = columns(self.clinical_indicators)
 
     def analyze_context(self, source_entity: str, target_entity: str,
                        relationship_type: str, context: str) -> Dict[str, Any]:
@@ -276,6 +461,126 @@ class ContextAnalyzer:
 
         return analysis
 
+    def analyze_batch(self, candidates: Sequence[Tuple[str, str, str, str]]) -> ContextBatchAnalysis:
+        """
+        Score many candidate contexts at once
+
+        All (source, target, relationship_type, context) tuples are lower-cased
+        once into a shared buffer, which is scanned per vocabulary phrase to
+        build phrase-presence matrices; evidence, relevance, consistency,
+        confidence and validity are then computed as array operations.
+        Results equal analyze_context per candidate.
+        """
+        if not HAS_NUMPY:
+            analyses = [self.analyze_context(*candidate) for candidate in candidates]
+            return ContextBatchAnalysis(
+                domain=[analysis['domain'] for analysis in analyses],
+                evidence_strength=[analysis['evidence_strength'] for analysis in analyses],
+                clinical_relevance=[analysis['clinical_relevance'] for analysis in analyses],
+                consistency_score=[analysis['consistency_score'] for analysis in analyses],
+                confidence_score=[analysis['confidence_score'] for analysis in analyses],
+                clinical_validity=[analysis['clinical_validity'] for analysis in analyses]
+            )
+
+        count = len(candidates)
+        # One normalization pass: every "source target context" is
+        # lower-cased into a single NUL-separated buffer; phrases never
+        # contain NUL, so no hit spans two candidates
+        segments = []
+        row_starts = np.zeros(count, dtype=np.int64)
+        context_starts = np.zeros(count, dtype=np.int64)
+        entity_flags = {}
+        flags = []
+        rel_types = []
+        offset = 0
+
+        for row, (source, target, rel_type, context) in enumerate(candidates):
+            prefix = f"{source} {target} ".lower()
+            segment = prefix + context.lower()
+            segments.append(segment)
+            row_starts[row] = offset
+            context_starts[row] = offset + len(prefix)
+            offset += len(segment) + 1
+
+            for entity in (source, target):
+                if entity not in entity_flags:
+                    entity_flags[entity] = self._entity_flags(entity)
+            source_flags, target_flags = entity_flags[source], entity_flags[target]
+            # Columns: source is medication/procedure, source is procedure,
+            # source is condition, target is medication/procedure, target is condition
+            flags.append((source_flags[0], source_flags[1], source_flags[2], target_flags[0], target_flags[2]))
+            rel_types.append(rel_type)
+
+        buffer = "\0".join(segments)
+
+        # Phrase-presence matrices: domain keywords count anywhere in the
+        # segment, evidence and relevance phrases only within the context
+        context_hits = np.zeros((count, len(self._vocabulary)), dtype=bool)
+        domain_hits = np.zeros((count, len(self._vocabulary)), dtype=bool)
+        for column, phrase in enumerate(self._vocabulary):
+            positions = []
+            position = buffer.find(phrase)
+            while position != -1:
+                positions.append(position)
+                position = buffer.find(phrase, position + 1)
+            if not positions:
+                continue
+            positions = np.array(positions, dtype=np.int64)
+            rows = np.searchsorted(row_starts, positions, side='right') - 1
+            domain_hits[rows, column] = True
+            context_hits[rows[positions >= context_starts[rows]], column] = True
+
+        # First domain (in declaration order) with a keyword hit
+        domain_matrix = np.stack(
+            [domain_hits[:, columns].any(axis=1) for _, columns in self._domain_columns], axis=1
+        )
+        domain_names = np.array([domain for domain, _ in self._domain_columns] + ["general"], dtype=object)
+        domain_index = np.where(domain_matrix.any(axis=1), domain_matrix.argmax(axis=1), len(self._domain_columns))
+
+        evidence = np.select(
+            [context_hits[:, columns].any(axis=1) for _, columns in self._evidence_columns],
+            [score for score, _ in self._evidence_columns],
+            default=0.5
+        )
+        relevance = np.minimum(0.9, 0.3 + context_hits[:, self._relevance_columns].sum(axis=1) * 0.1)
+
+        rel_types = np.array(rel_types, dtype=object)
+        is_treatment = rel_types == 'treatment'
+        source_mp, source_procedure, source_condition, target_mp, target_condition = (
+            np.array(flags, dtype=bool).reshape(count, 5).T
+        )
+        consistency = np.select(
+            [is_treatment & source_mp & target_condition,
+             is_treatment & source_condition & target_mp,
+             (rel_types == 'causation') & source_condition & target_condition,
+             (rel_types == 'diagnosis') & source_procedure & target_condition],
+            [0.9, 0.8, 0.8, 0.9],
+            default=0.5
+        )
+
+        confidence = (evidence * 0.3 + relevance * 0.3 + consistency * 0.4) / 3
+        validity_index = np.select(
+            [confidence >= 0.8, confidence >= 0.6, confidence >= 0.3], [0, 1, 2], default=3
+        )
+        validity_levels = (ClinicalValidity.ESTABLISHED, ClinicalValidity.PROBABLE,
+                           ClinicalValidity.QUESTIONABLE, ClinicalValidity.INVALID)
+
+        return ContextBatchAnalysis(
+            domain=domain_names[domain_index].tolist(),
+            evidence_strength=evidence,
+            clinical_relevance=relevance,
+            consistency_score=consistency,
+            confidence_score=confidence,
+            clinical_validity=[validity_levels[i] for i in validity_index]
+        )
+
+    @staticmethod
+    def _entity_flags(entity: str) -> Tuple[bool, bool, bool]:
+        """(medication or procedure, procedure, condition) mentions in an entity name"""
+        entity_lower = entity.lower()
+        procedure = 'procedure' in entity_lower
+        return ('medication' in entity_lower or procedure, procedure, 'condition' in entity_lower)
+
     def _identify_domain(self, source: str, target: str, context: str) -> str:
         """Identify the clinical domain of the relationship"""
         text_to_check = f"{source} {target} {context}".lower()
@@ -293,12 +598,7 @@ class ContextAnalyzer:
 
         for strength, indicators in self.evidence_strength_indicators.items():
             if any(indicator in context_lower for indicator in indicators):
-                if strength == 'strong':
-                    score = 0.9
-                elif strength == 'moderate':
-                    score = 0.7
-                elif strength == 'weak':
-                    score = 0.3
+                score = self.evidence_strength_scores[strength]
                 break
 
         return score
@@ -306,13 +606,8 @@ class ContextAnalyzer:
     def _assess_clinical_relevance(self, rel_type: str, context: str) -> float:
         """Assess clinical relevance of the relationship"""
         # Check for clinical keywords and context
-        clinical_indicators = [
-            'patient', 'treatment', 'diagnosis', 'prevention', 'management',
-            'clinical', 'medical', 'therapy', 'intervention', 'outcome'
-        ]
-
         context_lower = context.lower()
-        indicator_count = sum(1 for indicator in clinical_indicators if indicator in context_lower)
+        indicator_count = sum(1 for indicator in self.clinical_indicators if indicator in context_lower)
 
         # Higher relevance if more clinical indicators present
         relevance = min(0.9, 0.3 + (indicator_count * 0.1))
@@ -346,14 +641,52 @@ class ContextAnalyzer:
 class DynamicRelationshipDiscovery:
     """
     Main engine for dynamic relationship discovery and evaluation
+
+    Candidates are merged by (source, target, type) under stable,
+    content-derived IDs, so rediscovering a relationship adds evidence to the
+    existing candidate instead of creating a duplicate. Candidates and
+    proposals live in a DiscoveryStore; with a store path the engine can run
+    continuously over incoming guidelines and pick up where it left off.
     """
 
-    def __init__(self):
+    # Texts sent to a worker process per task in discover_corpus
+    CORPUS_BATCH_SIZE = 16
+
+    def __init__(self, confidence_threshold: float = 0.3, store_path: Optional[str] = None):
         self.extractor = EntityPairExtractor()
         self.analyzer = ContextAnalyzer()
         self.semantic_relationships = SemanticRelationships()
-        self.discovered_candidates: List[RelationshipCandidate] = []
-        self.proposals: List[RelationshipProposal] = []
+        # Minimum confidence for a pair to become a candidate
+        self.confidence_threshold = confidence_threshold
+        # Candidates and proposals (in memory unless a path is given)
+        self.store = DiscoveryStore(store_path or ":memory:")
+
+    @property
+    def discovered_candidates(self) -> List[RelationshipCandidate]:
+        """Merged candidates discovered so far, in discovery order"""
+        return [RelationshipCandidate.from_dict(record) for record in self.store.iter_candidates()]
+
+    @property
+    def proposals(self) -> List[RelationshipProposal]:
+        """Proposals generated so far, in creation order"""
+        return [RelationshipProposal.from_dict(record) for record in self.store.list_proposals()]
+
+    def get_candidate(self, candidate_id: str) -> Optional[RelationshipCandidate]:
+        """Look up a candidate by ID"""
+        record = self.store.get_candidate(candidate_id)
+        return RelationshipCandidate.from_dict(record) if record else None
+
+    def find_candidates(self, entity: Optional[str] = None, relationship_type: Optional[str] = None,
+                        limit: Optional[int] = None) -> List[RelationshipCandidate]:
+        """Candidates involving an entity and/or of a relationship type, most confident first"""
+        return [RelationshipCandidate.from_dict(record)
+                for record in self.store.find_candidates(entity, relationship_type, limit)]
+
+    def review_queue(self, limit: Optional[int] = 50, relationship_type: Optional[str] = None,
+                     min_confidence: Optional[float] = None) -> List[RelationshipCandidate]:
+        """Unreviewed candidates, most confident first"""
+        return [RelationshipCandidate.from_dict(record)
+                for record in self.store.review_queue(limit, relationship_type, min_confidence)]
 
     def discover_relationships(self, clinical_text: str, source_id: str = "unknown") -> List[RelationshipCandidate]:
         """
@@ -364,51 +697,135 @@ class DynamicRelationshipDiscovery:
             source_id: Identifier for the source of the text
 
         Returns:
-            List of relationship candidates discovered
+            List of relationship candidates discovered in this text, merged
+            into (and returned as) the engine's accumulated candidates
         """
         logger.info(f"Analyzing clinical text from source: {source_id}")
 
-        # Extract entity pairs
-        entity_pairs = self.extractor.extract_entity_pairs(clinical_text)
-        logger.info(f"Found {len(entity_pairs)} potential entity pairs")
+        candidates = self._analyze_text(clinical_text, source_id)
+        merged = self._merge_candidates(candidates)
+        logger.info(f"Generated {len(merged)} relationship candidates")
+
+        return merged
+
+    def discover_corpus(self, documents: Iterable[Tuple[str, str]], output_path: Optional[str] = None,
+                        workers: Optional[int] = None, batch_size: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Discover relationships across a corpus using a process pool
+
+        Texts are read lazily and sharded across worker processes in batches;
+        at most two batches per worker are in flight, so the corpus is never
+        held in memory. Results are merged in submission order, which keeps
+        merged evidence and IDs independent of worker scheduling.
+
+        Args:
+            documents: Iterable of (source_id, clinical_text)
+            output_path: Optional JSONL path to export merged candidates to
+            workers: Worker processes (default: CPU count); 0 or 1 runs in-process
+            batch_size: Texts per worker task
 
-        candidates = []
+        Returns:
+            Summary with document and candidate counts
+        """
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        batch_size = batch_size or self.CORPUS_BATCH_SIZE
+        documents = iter(documents)
+        batches = iter(lambda: list(islice(documents, batch_size)), [])
+        document_count = 0
+        sightings = 0
+
+        def merge_batch(results: List[List[RelationshipCandidate]]):
+            nonlocal document_count, sightings
+            batch_candidates = []
+            for candidates in results:
+                document_count += 1
+                sightings += len(candidates)
+                batch_candidates.extend(candidates)
+            self._merge_candidates(batch_candidates)
+
+        if workers <= 1:
+            for batch in batches:
+                merge_batch(_discover_batch(batch, self))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(self.confidence_threshold,)) as executor:
+                pending = deque()
+                for batch in batches:
+                    pending.append(executor.submit(_discover_batch, batch))
+                    if len(pending) >= workers * 2:
+                        merge_batch(pending.popleft().result())
+                while pending:
+                    merge_batch(pending.popleft().result())
+
+        candidate_count = self.store.count_candidates()
+        logger.info(f"Discovered {sightings} relationship sightings in {document_count} documents, "
+                    f"merged into {candidate_count} candidates")
+        if output_path:
+            self.export_candidates(output_path)
+
+        return {
+            "documents": document_count,
+            "sightings": sightings,
+            "candidates": candidate_count
+        }
 
-        for source_entity, target_entity, rel_type, context in entity_pairs:
-            # Analyze context
-            analysis = self.analyzer.analyze_context(
-                source_entity, target_entity, rel_type, context
+    def _analyze_text(self, clinical_text: str, source_id: str) -> List[RelationshipCandidate]:
+        """Candidates found in one text, merged within the text only"""
+        entity_pairs = self.extractor.extract_entity_pairs(clinical_text)
+        logger.debug(f"Found {len(entity_pairs)} potential entity pairs in {source_id}")
+
+        # Score all pairs at once and keep those with sufficient confidence
+        scores = self.analyzer.analyze_batch(entity_pairs)
+        selected = scores.above(self.confidence_threshold)
+        logger.debug(f"{len(selected)} of {len(entity_pairs)} pairs in {source_id} meet the confidence threshold")
+
+        candidates: Dict[str, RelationshipCandidate] = {}
+
+        for index in selected:
+            source_entity, target_entity, rel_type, context = entity_pairs[index]
+            analysis = scores.analysis(index)
+
+            candidate_id = RelationshipCandidate.make_id(source_entity, target_entity, rel_type)
+            candidate = RelationshipCandidate(
+                id=candidate_id,
+                source_entity=source_entity,
+                target_entity=target_entity,
+                relationship_type=rel_type,
+                confidence_score=analysis['confidence_score'],
+                clinical_validity=analysis['clinical_validity'],
+                context=context,
+                evidence_sources=[source_id],
+                similar_existing_rels=self._find_similar_relationships(source_entity, target_entity, rel_type),
+                proposed_properties=self._generate_proposed_properties(rel_type, analysis),
+                clinical_examples=self._generate_examples(source_entity, target_entity, rel_type),
+                discovered_at=datetime.now()
             )
+            if candidate_id in candidates:
+                candidates[candidate_id].merge(candidate)
+            else:
+                candidates[candidate_id] = candidate
+
+        return list(candidates.values())
+
+    def _merge_candidates(self, candidates: List[RelationshipCandidate]) -> List[RelationshipCandidate]:
+        """
+        Merge candidates into the store in one transaction
 
-            # Debug: Show analysis results
-            print(f"  Analysis for {source_entity} → {target_entity}: confidence={analysis['confidence_score']:.2f}, validity={analysis['clinical_validity'].value}")
-
-            # Check similarity with existing relationships
-            similar_rels = self._find_similar_relationships(source_entity, target_entity, rel_type)
-
-            # Create candidate if confidence is sufficient
-            if analysis['confidence_score'] >= 0.3:  # Minimum threshold
-                candidate = RelationshipCandidate(
-                    id=f"candidate_{len(self.discovered_candidates) + len(candidates) + 1}",
-                    source_entity=source_entity,
-                    target_entity=target_entity,
-                    relationship_type=rel_type,
-                    confidence_score=analysis['confidence_score'],
-                    clinical_validity=analysis['clinical_validity'],
-                    context=context,
-                    evidence_sources=[source_id],
-                    similar_existing_rels=similar_rels,
-                    proposed_properties=self._generate_proposed_properties(rel_type, analysis),
-                    clinical_examples=self._generate_examples(source_entity, target_entity, rel_type),
-                    discovered_at=datetime.now()
-                )
-                candidates.append(candidate)
-
-        # Add to discovered candidates
-        self.discovered_candidates.extend(candidates)
-        logger.info(f"Generated {len(candidates)} relationship candidates")
-
-        return candidates
+        Returns:
+            The merged candidates, one per distinct ID, in first-seen order
+        """
+        merged: Dict[str, RelationshipCandidate] = {}
+        stored = self.store.get_candidates(candidate.id for candidate in candidates)
+        for candidate in candidates:
+            existing = merged.get(candidate.id)
+            if existing is None and candidate.id in stored:
+                existing = merged[candidate.id] = RelationshipCandidate.from_dict(stored[candidate.id])
+            if existing is None:
+                merged[candidate.id] = candidate
+            else:
+                existing.merge(candidate)
+        self.store.put_candidates(candidate.to_dict() for candidate in merged.values())
+        return list(merged.values())
 
     def _find_similar_relationships(self, source: str, target: str, rel_type: str) -> List[Tuple[RelationshipType, float]]:
         """Find existing relationships similar to the candidate"""
@@ -504,7 +921,7 @@ class DynamicRelationshipDiscovery:
             created_at=datetime.now()
         )
 
-        self.proposals.append(proposal)
+        self.store.put_proposal(proposal.to_dict())
         return proposal
 
     def _generate_relationship_name(self, candidate: RelationshipCandidate) -> str:
@@ -598,15 +1015,23 @@ class DynamicRelationshipDiscovery:
         Returns:
             True if successfully integrated, False otherwise
         """
-        proposal = next((p for p in self.proposals if p.id == proposal_id), None)
-        if not proposal:
+        record = self.store.get_proposal(proposal_id)
+        if not record:
             logger.error(f"Proposal {proposal_id} not found")
             return False
+        proposal = RelationshipProposal.from_dict(record)
 
-        # Mark as approved
+        # Mark as approved; the candidate leaves the review queue
         proposal.approved = True
         proposal.approved_at = datetime.now()
         proposal.reviewed_by = reviewer
+        self.store.put_proposal(proposal.to_dict())
+
+        candidate = self.get_candidate(proposal.candidate.id)
+        if candidate:
+            candidate.reviewed = True
+            candidate.approved = True
+            self.store.put_candidates([candidate.to_dict()])
 
         # TODO: Integrate into semantic relationships ontology
         # This would involve updating the SemanticRelationships class
@@ -614,27 +1039,55 @@ class DynamicRelationshipDiscovery:
 
         return True
 
-    def export_candidates(self, filepath: str):
-        """Export discovered candidates to JSON file"""
-        data = [candidate.to_dict() for candidate in self.discovered_candidates]
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        logger.info(f"Exported {len(data)} candidates to {filepath}")
-
-    def export_proposals(self, filepath: str):
-        """Export proposals to JSON file"""
-        data = []
-        for proposal in self.proposals:
-            proposal_dict = asdict(proposal)
-            proposal_dict['candidate'] = proposal.candidate.to_dict()
-            proposal_dict['created_at'] = proposal.created_at.isoformat()
-            if proposal.approved_at:
-                proposal_dict['approved_at'] = proposal.approved_at.isoformat()
-            data.append(proposal_dict)
+    def export_candidates(self, filepath: str, incremental: bool = False):
+        """
+        Export discovered candidates to a file
 
+        A .jsonl path is written one candidate per line, streamed from the
+        store; any other path gets the original indented JSON array. With
+        incremental=True (JSONL only), only candidates changed since the last
+        export to the same path are appended.
+        """
+        if incremental:
+            self.store.export_changes('candidates', filepath)
+            return
+        self._export_records(self.store.iter_candidates(), filepath, 'candidates')
+
+    def export_proposals(self, filepath: str, incremental: bool = False):
+        """Export proposals to a file (see export_candidates for formats)"""
+        if incremental:
+            self.store.export_changes('proposals', filepath)
+            return
+        self._export_records(self.store.iter_proposals(), filepath, 'proposals')
+
+    @staticmethod
+    def _export_records(records: Iterator[Dict[str, Any]], filepath: str, kind: str):
+        count = 0
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
-        logger.info(f"Exported {len(data)} proposals to {filepath}")
+            if Path(filepath).suffix == '.jsonl':
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False))
+                    f.write('\n')
+                    count += 1
+            else:
+                data = list(records)
+                count = len(data)
+                json.dump(data, f, indent=2, ensure_ascii=False)
+        logger.info(f"Exported {count} {kind} to {filepath}")
+
+# Per-process engine used by discover_corpus workers
+_worker_engine: Optional[DynamicRelationshipDiscovery] = None
+
+def _init_worker(confidence_threshold: float):
+    """Create the worker process's engine with the parent's settings"""
+    global _worker_engine
+    _worker_engine = DynamicRelationshipDiscovery(confidence_threshold=confidence_threshold)
+
+def _discover_batch(batch: List[Tuple[str, str]],
+                    engine: Optional[DynamicRelationshipDiscovery] = None) -> List[List[RelationshipCandidate]]:
+    """Analyze a batch of (source_id, text) without accumulating state"""
+    engine = engine or _worker_engine
+    return [engine._analyze_text(text, source_id) for source_id, text in batch]
 
 # Global instance for easy access
 drde_engine = DynamicRelationshipDiscovery()
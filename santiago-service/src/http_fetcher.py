@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+"""
+Santiago Layer 0: Pooled HTTP Document Fetching
+
+Fetches guideline documents over HTTP(S) for the document loader. Connections
+are kept alive and pooled per host, a per-host limit bounds how many requests
+hit one publisher at a time, and responses are cached on disk with their
+ETag/Last-Modified validators so re-fetching an unchanged document is a single
+conditional GET answered with 304 Not Modified.
+
+Built on the standard library (http.client) so URL ingestion has no extra
+dependencies.
+
+Author: GitHub Copilot
+Date: November 12, 2025
+"""
+
+import os
+import ssl
+import json
+import time
+import hashlib
+import threading
+import http.client
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Union
+from urllib.parse import urlsplit, urljoin
+import logging
+
+from document_store import create_temp_file
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+# Statuses publishers use for rate limiting; retried after Retry-After
+RETRY_STATUSES = frozenset({429, 503})
+# Errors from a keep-alive connection the server already closed
+_STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+class DocumentFetchError(IOError):
+    """Raised when a document cannot be fetched"""
+
+@dataclass
+class FetchResult:
+    """A fetched document, stored in the on-disk HTTP cache"""
+    url: str
+    status: int  # 200, or 304 when served from the cache after revalidation
+    path: Path  # Cached response body
+    content_type: Optional[str]
+    etag: Optional[str]
+    last_modified: Optional[str]
+    from_cache: bool
+
+    @property
+    def charset(self) -> str:
+        """Charset declared in the Content-Type header (UTF-8 if absent)"""
+        for parameter in (self.content_type or "").split(';')[1:]:
+            name, _, value = parameter.strip().partition('=')
+            if name.lower() == 'charset' and value:
+                return value.strip('"\'')
+        return 'utf-8'
+
+    def read_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
+    def read_text(self) -> str:
+        """Decode the body using the declared charset"""
+        try:
+            return self.read_bytes().decode(self.charset, errors='replace')
+        except LookupError:
+            return self.read_bytes().decode('utf-8', errors='replace')
+
+class _HostPool:
+    """Keep-alive connections and a concurrency limit for one (scheme, host, port)"""
+
+    def __init__(self, scheme: str, host: str, port: Optional[int], max_connections: int,
+                 timeout: float, ssl_context: Optional[ssl.SSLContext]):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.ssl_context = ssl_context
+        self.max_connections = max_connections
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._idle: List[http.client.HTTPConnection] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the host's concurrent request slots"""
+        with self._slots:
+            yield
+
+    def checkout(self) -> Tuple[http.client.HTTPConnection, bool]:
+        """Get an idle connection (reused=True) or open a new one"""
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        if self.scheme == 'https':
+            connection = http.client.HTTPSConnection(
+                self.host, self.port, timeout=self.timeout, context=self.ssl_context
+            )
+        else:
+            connection = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        return connection, False
+
+    def checkin(self, connection: http.client.HTTPConnection, reusable: bool):
+        """Return a connection to the pool, or close it"""
+        if reusable:
+            with self._lock:
+                if len(self._idle) < self.max_connections:
+                    self._idle.append(connection)
+                    return
+        connection.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+class HTTPDocumentFetcher:
+    """
+    Pooled, rate-limited HTTP client with a conditional-GET disk cache
+
+    Cache entries live at ``<cache_dir>/<key[:2]>/<key>.body`` with a JSON
+    sidecar holding the validators, where key is the SHA-256 of the URL.
+    """
+
+    def __init__(self, cache_dir: Union[str, Path], max_per_host: int = 4, timeout: float = 30.0,
+                 max_redirects: int = 5, max_retries: int = 2, max_retry_delay: float = 30.0,
+                 user_agent: str = "Santiago-DocumentLoader/1.0"):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.max_redirects = max_redirects
+        self.max_retries = max_retries
+        self.max_retry_delay = max_retry_delay
+        self.user_agent = user_agent
+        self._ssl_context = ssl.create_default_context()
+        self._pools: Dict[Tuple[str, str, Optional[int]], _HostPool] = {}
+        self._lock = threading.Lock()
+
+    def fetch(self, url: str) -> FetchResult:
+        """
+        Fetch a URL, revalidating any cached copy
+
+        Args:
+            url: http(s) URL
+
+        Returns:
+            FetchResult pointing at the cached body
+        """
+        body_path, meta_path = self._cache_paths(url)
+        cached = self._read_cache_entry(meta_path) if body_path.exists() else None
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        current_url = url
+        for _ in range(self.max_redirects + 1):
+            status, response_headers, tmp_path = self._request(current_url, headers)
+            if status not in REDIRECT_STATUSES:
+                break
+            location = response_headers.get('Location')
+            if not location:
+                raise DocumentFetchError(f"HTTP {status} without Location fetching {current_url}")
+            current_url = urljoin(current_url, location)
+        else:
+            raise DocumentFetchError(f"Too many redirects fetching {url}")
+
+        if status == 304 and cached:
+            logger.info(f"Not modified, using cached copy: {url}")
+            return FetchResult(
+                url=url, status=304, path=body_path,
+                content_type=cached.get('content_type'),
+                etag=response_headers.get('ETag') or cached.get('etag'),
+                last_modified=response_headers.get('Last-Modified') or cached.get('last_modified'),
+                from_cache=True
+            )
+        if status != 200:
+            raise DocumentFetchError(f"HTTP {status} fetching {url}")
+
+        entry = {
+            'url': url,
+            'final_url': current_url,
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+            'content_type': response_headers.get('Content-Type'),
+            'fetched_at': datetime.now().isoformat()
+        }
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(tmp_path, body_path)
+        self._write_cache_entry(meta_path, entry)
+
+        logger.info(f"Fetched {url} ({body_path.stat().st_size} bytes)")
+        return FetchResult(
+            url=url, status=200, path=body_path, content_type=entry['content_type'],
+            etag=entry['etag'], last_modified=entry['last_modified'], from_cache=False
+        )
+
+    def prefetch(self, urls: Iterable[str], max_workers: int = 8) -> Dict[str, Union[FetchResult, DocumentFetchError]]:
+        """
+        Fetch many URLs concurrently (each host still limited to max_per_host)
+
+        Returns:
+            Mapping of URL to its FetchResult, or the DocumentFetchError it raised
+        """
+        urls = list(dict.fromkeys(urls))
+        results: Dict[str, Union[FetchResult, DocumentFetchError]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="santiago-fetch") as executor:
+            futures = {executor.submit(self.fetch, url): url for url in urls}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    results[url] = future.result()
+                except DocumentFetchError as e:
+                    logger.warning(f"Prefetch failed for {url}: {e}")
+                    results[url] = e
+        return results
+
+    def close(self):
+        """Close all pooled connections"""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+
+    def _request(self, url: str, headers: Dict[str, str]) -> Tuple[int, http.client.HTTPMessage, Optional[Path]]:
+        """
+        Issue one GET on a pooled connection
+
+        A 200 body is streamed to a temp file in the cache directory; other
+        bodies are drained so the connection can be reused.
+        """
+        parsed = urlsplit(url)
+        if parsed.scheme not in ('http', 'https') or not parsed.hostname:
+            raise DocumentFetchError(f"Unsupported URL: {url}")
+        pool = self._pool_for(parsed.scheme, parsed.hostname, parsed.port)
+        target = (parsed.path or '/') + (f"?{parsed.query}" if parsed.query else '')
+        request_headers = {'User-Agent': self.user_agent, 'Accept-Encoding': 'identity', **headers}
+
+        retries = 0
+        with pool.slot():
+            while True:
+                connection, reused = pool.checkout()
+                try:
+                    connection.request('GET', target, headers=request_headers)
+                    response = connection.getresponse()
+                    tmp_path = self._receive_body(response) if response.status == 200 else None
+                    if tmp_path is None:
+                        response.read()
+                except _STALE_CONNECTION_ERRORS as e:
+                    connection.close()
+                    if reused:
+                        # The server closed an idle keep-alive connection; retry on another
+                        continue
+                    raise DocumentFetchError(f"Connection failed fetching {url}: {e}") from e
+                except (OSError, http.client.HTTPException) as e:
+                    connection.close()
+                    raise DocumentFetchError(f"Error fetching {url}: {e}") from e
+
+                pool.checkin(connection, reusable=not response.will_close)
+
+                if response.status in RETRY_STATUSES and retries < self.max_retries:
+                    retries += 1
+                    # Keep the host slot while waiting so other requests to it back off too
+                    time.sleep(self._retry_delay(response.getheader('Retry-After'), retries))
+                    continue
+                return response.status, response.headers, tmp_path
+
+    def _receive_body(self, response: http.client.HTTPResponse) -> Path:
+        tmp_path, fd = create_temp_file(self.cache_dir)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                while True:
+                    chunk = response.read(_READ_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return tmp_path
+
+    def _retry_delay(self, retry_after: Optional[str], attempt: int) -> float:
+        delay = 0.5 * 2 ** attempt
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    pass
+        return min(max(delay, 0.0), self.max_retry_delay)
+
+    def _pool_for(self, scheme: str, host: str, port: Optional[int]) -> _HostPool:
+        key = (scheme, host.lower(), port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = _HostPool(scheme, host, port, self.max_per_host, self.timeout, self._ssl_context)
+                self._pools[key] = pool
+        return pool
+
+    def _cache_paths(self, url: str) -> Tuple[Path, Path]:
+        key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+        directory = self.cache_dir / key[:2]
+        return directory / f"{key}.body", directory / f"{key}.json"
+
+    @staticmethod
+    def _read_cache_entry(meta_path: Path) -> Optional[Dict[str, Any]]:
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_cache_entry(self, meta_path: Path, entry: Dict[str, Any]):
+        tmp_path, fd = create_temp_file(meta_path.parent)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        os.replace(tmp_path, meta_path)
@@ -24,7 +24,10 @@ from enum import Enum
 import logging
 
 from document_loader import DocumentLoader, DocumentMetadata
+from async_document_loader import AsyncDocumentLoader
 from semantic_relationships import SemanticRelationships, RelationshipType
+from workflow_engine import WorkflowCompiler, WorkflowExecutor, WorkflowExecutionResult
+from traceability_index import TraceabilityIndex
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -98,7 +101,11 @@ class SantiagoService:
         self.initialized = False
         self.knowledge_graph: Dict[str, GraphNode] = {}
         self.document_loader = DocumentLoader()  # Initialize document loader for Layer 0
+        self.async_document_loader = AsyncDocumentLoader(self.document_loader)  # Keeps document I/O off the event loop
+        self.traceability_index = TraceabilityIndex(self.document_loader.storage_path / "traceability.db")
         self.semantic_relationships = SemanticRelationships()  # Initialize semantic relationships for Layer 1
+        self.workflow_compiler = WorkflowCompiler()  # Compiles Layer 3 rules into Layer 4 DAGs
+        self.workflow_executor = WorkflowExecutor()  # Concurrent executor for Layer 4 workflows
         self.layer_processors = {
             SantiagoLayer.RAW_TEXT: self._process_raw_text,
             SantiagoLayer.STRUCTURED_KNOWLEDGE: self._process_structured_knowledge,
@@ -227,22 +234,107 @@ class SantiagoService:
 
         # Store reference to higher-level asset for bidirectional linking
         if higher_level_asset_id:
-            # TODO: Store bidirectional link in knowledge graph
+            self.traceability_index.add_link({
+                "id": anchor_id,
+                "doc_id": doc_id,
+                "section_id": section_id,
+                "anchor_type": anchor_type,
+                "text": anchor_text,
+                "position": position
+            }, higher_level_asset_id)
             logger.info(f"Created anchor {anchor_id} linking to asset {higher_level_asset_id}")
 
         return anchor_id
 
-    def resolve_anchor_reference(self, anchor_id: str) -> Dict[str, Any]:
+    def create_anchor_references(self, anchors: List[Dict[str, Any]]) -> List[str]:
+        """
+        Create many anchor references and index their asset links in one batch
+
+        Args:
+            anchors: Dictionaries with the create_anchor_reference arguments
+
+        Returns:
+            Anchor reference IDs, in input order
+        """
+        anchor_ids = self.document_loader.create_anchor_references(anchors)
+        links = []
+        for anchor_id, anchor in zip(anchor_ids, anchors):
+            if anchor.get("higher_level_asset_id"):
+                links.append({
+                    "id": anchor_id,
+                    "doc_id": anchor["doc_id"],
+                    "section_id": anchor["section_id"],
+                    "anchor_type": anchor["anchor_type"],
+                    "text": anchor["anchor_text"],
+                    "position": anchor["position"],
+                    "asset_id": anchor["higher_level_asset_id"]
+                })
+
+        self.traceability_index.add_links(links)
+        return anchor_ids
+
+    def get_anchors_for_asset(self, asset_id: str) -> List[Dict[str, Any]]:
+        """Get the source anchors supporting a higher-level asset"""
+        return self.traceability_index.get_anchors_for_asset(asset_id)
+
+    def get_assets_for_anchor(self, anchor_id: str) -> List[Dict[str, Any]]:
+        """Get the higher-level assets derived from an anchor"""
+        return self.traceability_index.get_assets_for_anchor(anchor_id)
+
+    def trace_workflow(self, workflow_id: str) -> Dict[str, Any]:
+        """
+        Trace a workflow and every asset it was derived from back to source text
+
+        Walks the workflow's lineage in the knowledge graph (compiled_from /
+        derived_from relationships plus asset IDs referenced by its rules) and
+        resolves the anchors for all of them in a single batched index read.
+
+        Args:
+            workflow_id: ID of a Layer 4 workflow node
+
+        Returns:
+            Lineage asset IDs and anchors keyed by asset ID
+        """
+        lineage = []
+        pending = [workflow_id]
+        seen = set()
+        while pending:
+            asset_id = pending.pop()
+            if asset_id in seen:
+                continue
+            seen.add(asset_id)
+            lineage.append(asset_id)
+
+            node = self.knowledge_graph.get(asset_id)
+            if node is None:
+                continue
+            for relationship in node.relationships:
+                if relationship.get("type") in ("compiled_from", "derived_from"):
+                    pending.append(relationship["target"])
+            for step in node.content.get("workflow_dag", {}).get("nodes", {}).values():
+                if step.get("rule", {}).get("asset_id"):
+                    pending.append(step["rule"]["asset_id"])
+
+        anchors = self.traceability_index.trace_assets(lineage)
+        return {
+            "workflow_id": workflow_id,
+            "lineage": lineage,
+            "anchors": anchors,
+            "anchor_count": sum(len(a) for a in anchors.values())
+        }
+
+    def resolve_anchor_reference(self, anchor_id: str, include_document: bool = False) -> Dict[str, Any]:
         """
         Resolve an anchor reference to get full context and traceability
 
         Args:
             anchor_id: Anchor reference identifier
+            include_document: Also return the full document content
 
         Returns:
             Full anchor context with document and section information
         """
-        return self.document_loader.resolve_anchor_reference(anchor_id)
+        return self.document_loader.resolve_anchor_reference(anchor_id, include_document)
 
     def get_document_content(self, doc_id: str, section_id: Optional[str] = None) -> str:
         """
@@ -267,8 +359,11 @@ class SantiagoService:
         """
         logger.info(f"Processing Layer 0 for guideline: {metadata.get('title', 'Unknown')}")
 
-        # Load document using document loader
-        doc_metadata = self.document_loader.load_document(content, metadata)
+        # Load document using document loader (blocking I/O and hashing run on the I/O executor)
+        doc_metadata = await self.async_document_loader.load_document(content, metadata)
+        section_contents = await self.async_document_loader.get_section_contents(
+            doc_metadata.id, [section_data["id"] for section_data in doc_metadata.sections]
+        )
 
         # Create Layer 0 nodes for each section
         nodes = []
@@ -298,6 +393,7 @@ class SantiagoService:
 
         # Create section nodes with deep linking capabilities
         for section_data in doc_metadata.sections:
+            section_content = section_contents[section_data["id"]]
             section_node = GraphNode(
                 id=f"{doc_metadata.id}_section_{section_data['id']}",
                 layer=SantiagoLayer.RAW_TEXT,
@@ -305,7 +401,7 @@ class SantiagoService:
                 content={
                     "section_id": section_data["id"],
                     "title": section_data["title"],
-                    "content": section_data["content"][:2000] + "..." if len(section_data["content"]) > 2000 else section_data["content"],
+                    "content": section_content[:2000] + "..." if len(section_content) > 2000 else section_content,
                     "level": section_data["level"],
                     "document_id": doc_metadata.id,
                     "full_content_available": True
@@ -432,6 +528,7 @@ class SantiagoService:
                     "logic_expressions": {}  # Placeholder for CQL/ELM
                 },
                 metadata={**metadata, "processing_layer": "computable_logic"},
+                relationships=[{"type": "derived_from", "source": f"{node.id}_logic", "target": node.id}],
                 symbolic_logic={
                     "execution_engine": "fhir-cpg",
                     "logic_type": "conditional_rules"
@@ -444,31 +541,48 @@ class SantiagoService:
 
     async def _process_executable_workflows(self, input_nodes: List[GraphNode],
                                           metadata: Dict[str, Any]) -> List[GraphNode]:
-        """Compile executable workflows from logic nodes"""
-        # TODO: Implement workflow compilation
-        # - DAG construction from clinical pathways
-        # - Workflow execution logic
-        # - Integration with Gremlin traversal patterns
+        """
+        Compile executable workflows from logic nodes
 
+        Each Layer 3 node's rules are compiled into a DAG whose independent
+        branches can be executed concurrently by the workflow executor.
+        """
         nodes = []
         for node in input_nodes:
+            workflow_id = f"{node.id}_workflow"
+            compiled = self.workflow_compiler.compile(workflow_id, node.content.get("rules", []))
+
             workflow_node = GraphNode(
-                id=f"{node.id}_workflow",
+                id=workflow_id,
                 layer=SantiagoLayer.EXECUTABLE_WORKFLOWS,
                 node_type=KnowledgeRepresentation.WORKFLOW,
-                content={
-                    "workflow_dag": {},  # Placeholder for DAG structure
-                    "execution_paths": [],  # Placeholder for traversal paths
-                    "entry_points": [],  # Placeholder for workflow starts
-                    "exit_points": []  # Placeholder for workflow ends
-                },
-                metadata={**metadata, "processing_layer": "executable_workflows"}
+                content=compiled,
+                metadata={**metadata, "processing_layer": "executable_workflows"},
+                relationships=[{"type": "compiled_from", "source": workflow_id, "target": node.id}]
             )
             nodes.append(workflow_node)
 
         logger.info(f"Created {len(nodes)} executable workflow nodes")
         return nodes
 
+    async def execute_workflow(self, workflow_id: str,
+                               patient_context: Dict[str, Any]) -> WorkflowExecutionResult:
+        """
+        Execute a stored Layer 4 workflow for a patient context
+
+        Args:
+            workflow_id: ID of a Layer 4 workflow node in the knowledge graph
+            patient_context: Patient data evaluated by the workflow rules
+
+        Returns:
+            WorkflowExecutionResult with per-step outcomes and latencies
+        """
+        node = self.knowledge_graph.get(workflow_id)
+        if node is None or node.layer != SantiagoLayer.EXECUTABLE_WORKFLOWS:
+            raise ValueError(f"Workflow {workflow_id} not found in knowledge graph")
+
+        return await self.workflow_executor.execute(node.content, patient_context)
+
     def _extract_clinical_knowledge(self, text: str, section_title: str,
                                   document_id: str) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """
@@ -1021,6 +1135,18 @@ class SantiagoService:
                             "required": ["source", "metadata"]
                         }
                     },
+                    "search_documents": {
+                        "description": "Search loaded document sections for evidence (BM25, \"quoted phrases\")",
+                        "inputSchema": {
+                            "type": "object",
+                            "properties": {
+                                "query": {"type": "string"},
+                                "limit": {"type": "integer"},
+                                "doc_ids": {"type": "array", "items": {"type": "string"}}
+                            },
+                            "required": ["query"]
+                        }
+                    },
                     "create_anchor": {
                         "description": "Create deep link reference from higher-level assets to source text",
                         "inputSchema": {
@@ -1078,7 +1204,7 @@ class SantiagoService:
     async def handle_load_document(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle document loading request"""
         try:
-            doc_metadata = self.document_loader.load_document(
+            doc_metadata = await self.async_document_loader.load_document(
                 params["source"],
                 params.get("metadata", {})
             )
@@ -1087,6 +1213,19 @@ class SantiagoService:
             logger.error(f"Error loading document: {e}")
             return {"error": str(e)}
 
+    async def handle_search_documents(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle document search request"""
+        try:
+            hits = await self.async_document_loader.search_sections(
+                params["query"],
+                params.get("limit", 10),
+                params.get("doc_ids")
+            )
+            return {"result": {"hits": hits}}
+        except Exception as e:
+            logger.error(f"Error searching documents: {e}")
+            return {"error": str(e)}
+
     async def handle_create_anchor(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle anchor creation request"""
         try:
@@ -1132,6 +1271,8 @@ async def main():
                     response = await service.handle_answer_question(message["params"].get("arguments", {}))
                 elif message.get("method") == "tools/call" and message.get("params", {}).get("name") == "load_document":
                     response = await service.handle_load_document(message["params"].get("arguments", {}))
+                elif message.get("method") == "tools/call" and message.get("params", {}).get("name") == "search_documents":
+                    response = await service.handle_search_documents(message["params"].get("arguments", {}))
                 elif message.get("method") == "tools/call" and message.get("params", {}).get("name") == "create_anchor":
                     response = await service.handle_create_anchor(message["params"].get("arguments", {}))
                 else:
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Santiago Layer 0: Positional Inverted Index over Document Sections
+
+Full-text search over loaded guideline sections for evidence lookup, built
+on SQLite FTS5 next to the document store. FTS5 keeps a positional inverted
+index (detail=full), so:
+
+- ranked retrieval scores only the sections containing a query term (BM25),
+- quoted phrases are matched by token adjacency without rescanning text,
+- documents are added, replaced or removed incrementally in one transaction.
+
+Author: GitHub Copilot
+Date: November 12, 2025
+"""
+
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Tuple, Iterable, Union
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Alphanumeric runs, matching the FTS5 unicode61 tokenizer's word boundaries
+TOKEN_PATTERN = re.compile(r"[^\W_]+")
+PHRASE_PATTERN = re.compile(r'"([^"]+)"')
+
+# SQLite's default host parameter limit is 999; stay well below it per query
+_QUERY_CHUNK_SIZE = 500
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased word tokens"""
+    return [match.group().lower() for match in TOKEN_PATTERN.finditer(text)]
+
+def parse_query(query: str) -> Tuple[List[str], List[List[str]]]:
+    """
+    Split a query into free terms and quoted phrases
+
+    Returns:
+        Tuple of (terms, phrases); phrase terms are also included in terms
+    """
+    phrases = [tokenize(phrase) for phrase in PHRASE_PATTERN.findall(query)]
+    phrases = [phrase for phrase in phrases if phrase]
+    terms = tokenize(PHRASE_PATTERN.sub(" ", query))
+    for phrase in phrases:
+        terms.extend(phrase)
+    return list(dict.fromkeys(terms)), phrases
+
+def to_match_expression(query: str) -> Optional[str]:
+    """
+    Translate a user query into an FTS5 MATCH expression
+
+    Free terms are OR'ed; every quoted phrase is required. Phrases are also
+    OR'ed in with the free terms so that, when both are present, free terms
+    stay optional but still contribute to the BM25 score.
+    """
+    terms, phrases = parse_query(query)
+    phrase_terms = {term for phrase in phrases for term in phrase}
+    quoted_phrases = ['"' + ' '.join(phrase) + '"' for phrase in phrases]
+    free_terms = [f'"{term}"' for term in terms if term not in phrase_terms]
+
+    if not quoted_phrases:
+        return ' OR '.join(free_terms) or None
+    required = ' AND '.join(quoted_phrases)
+    if not free_terms:
+        return required
+    return f"{required} AND ({' OR '.join(free_terms + quoted_phrases)})"
+
+class SectionSearchIndex:
+    """
+    SQLite FTS5 positional index over document sections with BM25 ranking
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS sections (
+        id INTEGER PRIMARY KEY,
+        doc_id TEXT NOT NULL,
+        section_id TEXT NOT NULL,
+        title TEXT,
+        UNIQUE (doc_id, section_id)
+    );
+    CREATE VIRTUAL TABLE IF NOT EXISTS section_text USING fts5(
+        title, body, tokenize = 'unicode61 remove_diacritics 0', detail = full
+    );
+    CREATE VIRTUAL TABLE IF NOT EXISTS section_terms USING fts5vocab(section_text, 'row');
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(self._SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def add_document(self, doc_id: str, sections: Iterable[Tuple[str, str, str]]) -> int:
+        """
+        Index (or re-index) a document's sections in one transaction
+
+        Args:
+            doc_id: Document identifier
+            sections: (section_id, title, text) tuples
+
+        Returns:
+            Number of sections indexed
+        """
+        with self._lock, self._conn:
+            self._remove_document(doc_id)
+            indexed = 0
+            for section_id, title, text in sections:
+                cursor = self._conn.execute(
+                    "INSERT INTO sections (doc_id, section_id, title) VALUES (?, ?, ?)",
+                    (doc_id, section_id, title)
+                )
+                self._conn.execute(
+                    "INSERT INTO section_text (rowid, title, body) VALUES (?, ?, ?)",
+                    (cursor.lastrowid, title, text)
+                )
+                indexed += 1
+
+        logger.info(f"Indexed {indexed} sections of document {doc_id}")
+        return indexed
+
+    def remove_document(self, doc_id: str):
+        """Remove a document's sections from the index"""
+        with self._lock, self._conn:
+            self._remove_document(doc_id)
+
+    def search(self, query: str, limit: int = 10,
+               doc_ids: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        BM25-ranked section search; quoted phrases must match exactly
+
+        Args:
+            query: Free-text query, optionally with "quoted phrases"
+            limit: Maximum sections to return
+            doc_ids: Restrict results to these documents
+
+        Returns:
+            Hits with doc_id, section_id, title and score, best first
+        """
+        expression = to_match_expression(query)
+        if expression is None:
+            return []
+        if doc_ids is not None:
+            doc_ids = list(dict.fromkeys(doc_ids))
+            if not doc_ids:
+                return []
+
+        sql = (
+            "SELECT s.doc_id, s.section_id, s.title, bm25(section_text) AS rank "
+            "FROM section_text JOIN sections s ON s.id = section_text.rowid "
+            "WHERE section_text MATCH ?"
+        )
+        params: List[Any] = [expression]
+        if doc_ids is not None:
+            if len(doc_ids) > _QUERY_CHUNK_SIZE:
+                # Large filters are applied after ranking
+                sql_filter = set(doc_ids)
+            else:
+                sql += f" AND s.doc_id IN ({','.join('?' * len(doc_ids))})"
+                params.extend(doc_ids)
+                sql_filter = None
+        else:
+            sql_filter = None
+        sql += " ORDER BY rank"
+        if sql_filter is None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params)
+            hits = []
+            for row in rows:
+                if sql_filter is not None and row['doc_id'] not in sql_filter:
+                    continue
+                # FTS5 reports BM25 negated (lower is better)
+                hits.append({
+                    'doc_id': row['doc_id'],
+                    'section_id': row['section_id'],
+                    'title': row['title'],
+                    'score': round(-row['rank'], 6)
+                })
+                if len(hits) >= limit:
+                    break
+        return hits
+
+    def stats(self) -> Dict[str, Any]:
+        """Section, term and document counts"""
+        with self._lock:
+            sections, documents = self._conn.execute(
+                "SELECT COUNT(*), COUNT(DISTINCT doc_id) FROM sections"
+            ).fetchone()
+            terms = self._conn.execute("SELECT COUNT(*) FROM section_terms").fetchone()[0]
+        return {"documents": documents, "sections": sections, "terms": terms}
+
+    def _remove_document(self, doc_id: str):
+        section_rows = [row[0] for row in self._conn.execute(
+            "SELECT id FROM sections WHERE doc_id = ?", (doc_id,)
+        )]
+        for i in range(0, len(section_rows), _QUERY_CHUNK_SIZE):
+            chunk = section_rows[i:i + _QUERY_CHUNK_SIZE]
+            placeholders = ",".join("?" * len(chunk))
+            self._conn.execute(f"DELETE FROM section_text WHERE rowid IN ({placeholders})", chunk)
+        self._conn.execute("DELETE FROM sections WHERE doc_id = ?", (doc_id,))
@@ -17,8 +17,10 @@ Date: November 10, 2025
 """
 
 from enum import Enum
-from typing import Dict, List, Any, Optional, Set, Tuple
-from dataclasses import dataclass, asdict
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Set, Tuple, Mapping, Sequence
+from dataclasses import dataclass, fields, replace
+import functools
 import json
 import logging
 
@@ -92,7 +94,7 @@ class RelationshipType(Enum):
     ACTIVITY_DEFINED_BY_DEFINITION = "activity_defined_by_definition" # Activity defined by ActivityDefinition
     PATIENT_ENROLLED_IN_PATHWAY = "patient_enrolled_in_pathway" # Patient enrolled in clinical pathway
 
-@dataclass
+@dataclass(frozen=True)
 class RelationshipDefinition:
     """Definition of a semantic relationship with properties and constraints"""
 
@@ -104,35 +106,161 @@ class RelationshipDefinition:
     inverse: Optional[RelationshipType] = None
     symmetric: bool = False
     transitive: bool = False
-    properties: Dict[str, Any] = None
-    examples: List[Dict[str, str]] = None
-    validation_rules: List[str] = None
+    properties: Mapping[str, Any] = None
+    examples: Sequence[Mapping[str, str]] = None
+    validation_rules: Sequence[str] = None
 
     def __post_init__(self):
+        # Frozen: defaults are filled in through object.__setattr__
         if self.properties is None:
-            self.properties = {}
+            object.__setattr__(self, 'properties', {})
         if self.examples is None:
-            self.examples = []
+            object.__setattr__(self, 'examples', [])
         if self.validation_rules is None:
-            self.validation_rules = []
+            object.__setattr__(self, 'validation_rules', [])
+
+# Relationship categories, mirroring the groups in RelationshipType
+RELATIONSHIP_CATEGORIES: Dict[str, Tuple[RelationshipType, ...]] = {
+    "treatment": (RelationshipType.TREATS, RelationshipType.PREVENTS,
+                  RelationshipType.MITIGATES, RelationshipType.MANAGES),
+    "diagnostic": (RelationshipType.INVESTIGATES, RelationshipType.DIAGNOSES,
+                   RelationshipType.SCREENS_FOR, RelationshipType.MONITORS),
+    "pathophysiology": (RelationshipType.COMPLICATES, RelationshipType.CAUSES,
+                        RelationshipType.PREDISPOSES, RelationshipType.CO_OCCURS_WITH),
+    "risk": (RelationshipType.RISK_FACTOR, RelationshipType.PROTECTS_AGAINST,
+             RelationshipType.INCREASES_RISK, RelationshipType.DECREASES_RISK),
+    "anatomical": (RelationshipType.AFFECTS, RelationshipType.LOCATED_IN,
+                   RelationshipType.SPREADS_TO),
+    "pharmacological": (RelationshipType.INTERACTS_WITH, RelationshipType.CONTRAINDICATED_IN,
+                        RelationshipType.METABOLIZED_BY, RelationshipType.INHIBITS),
+    "clinical_presentation": (RelationshipType.PRESENTS_WITH, RelationshipType.INDICATES,
+                              RelationshipType.MANIFESTS_AS),
+    "temporal": (RelationshipType.PRECEDES, RelationshipType.FOLLOWS),
+    "snomed_ct": (RelationshipType.FINDING_SITE, RelationshipType.CAUSATIVE_AGENT,
+                  RelationshipType.SEVERITY, RelationshipType.METHOD,
+                  RelationshipType.PROCEDURE_SITE, RelationshipType.CHARACTERIZES),
+    "fhir_cpg": (RelationshipType.CASE_INFORMS_PLAN, RelationshipType.PLAN_INSTANTIATES_CAREPLAN,
+                 RelationshipType.RECOMMENDATION_GENERATES_PROPOSAL,
+                 RelationshipType.PROPOSAL_GENERATES_REQUEST,
+                 RelationshipType.REQUEST_FULFILLED_BY_EVENT,
+                 RelationshipType.STRATEGY_CONTAINS_RECOMMENDATION,
+                 RelationshipType.PATHWAY_CONTAINS_STRATEGY,
+                 RelationshipType.ACTIVITY_DEFINED_BY_DEFINITION,
+                 RelationshipType.PATIENT_ENROLLED_IN_PATHWAY),
+}
+
+def _freeze(value: Any) -> Any:
+    """Read-only copy of nested dicts and lists (mapping proxies and tuples)"""
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+def _thaw(value: Any) -> Any:
+    """Plain dict/list copy of a value frozen by _freeze"""
+    if isinstance(value, Mapping):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+# Declared property types checked by validate_relationship
+_PROPERTY_TYPE_CHECKS = {
+    "float": ((int, float), "must be numeric"),
+    "int": ((int,), "must be integer"),
+}
+
+class OntologySnapshot:
+    """
+    Immutable, indexed view of a set of relationship definitions
+
+    Domain, range and category lookups are precomputed, and each definition's
+    typed properties are compiled into (name, accepted types, error) checks so
+    validating a triple touches only the properties that can fail. Snapshots
+    are never modified; changes produce a new snapshot. Definitions are
+    stored with their properties, examples and validation rules frozen, so
+    instances sharing a snapshot cannot change it through them.
+    """
+
+    __slots__ = ("relationships", "by_domain", "by_range", "by_category", "_property_checks")
+
+    def __init__(self, definitions: Mapping[RelationshipType, RelationshipDefinition]):
+        definitions = {
+            rel_type: replace(rel_def, properties=_freeze(rel_def.properties),
+                              examples=_freeze(rel_def.examples),
+                              validation_rules=_freeze(rel_def.validation_rules))
+            for rel_type, rel_def in definitions.items()
+        }
+        by_domain: Dict[str, List[RelationshipDefinition]] = {}
+        by_range: Dict[str, List[RelationshipDefinition]] = {}
+        property_checks: Dict[RelationshipType, Tuple[Tuple[str, tuple, str], ...]] = {}
+
+        for rel_type, rel_def in definitions.items():
+            by_domain.setdefault(rel_def.domain, []).append(rel_def)
+            by_range.setdefault(rel_def.range, []).append(rel_def)
+            property_checks[rel_type] = tuple(
+                (prop_name, *_PROPERTY_TYPE_CHECKS[prop_type])
+                for prop_name, prop_type in rel_def.properties.items()
+                if isinstance(prop_type, str) and prop_type in _PROPERTY_TYPE_CHECKS
+            )
+
+        self.relationships = MappingProxyType(definitions)
+        self.by_domain = MappingProxyType({key: tuple(value) for key, value in by_domain.items()})
+        self.by_range = MappingProxyType({key: tuple(value) for key, value in by_range.items()})
+        self.by_category = MappingProxyType({
+            category: tuple(definitions[rel_type] for rel_type in members if rel_type in definitions)
+            for category, members in RELATIONSHIP_CATEGORIES.items()
+        })
+        self._property_checks = MappingProxyType(property_checks)
+
+    def validate(self, rel_type: RelationshipType, properties: Optional[Dict[str, Any]]) -> List[str]:
+        """Run the compiled property checks for a relationship type"""
+        checks = self._property_checks.get(rel_type)
+        if checks is None:
+            return [f"Unknown relationship type: {rel_type}"]
+        if not properties:
+            return []
+        return [
+            f"Property {prop_name} {message}"
+            for prop_name, accepted, message in checks
+            if prop_name in properties and not isinstance(properties[prop_name], accepted)
+        ]
+
+@functools.lru_cache(maxsize=None)
+def load_core_ontology() -> OntologySnapshot:
+    """The core ontology snapshot, built once per process and shared"""
+    return OntologySnapshot(SemanticRelationships._build_core_relationships())
 
 class SemanticRelationships:
     """
     Core semantic relationships for Santiago Layer 1
 
     Defines and manages the fundamental relationship types used for
-    clinical knowledge representation and reasoning.
+    clinical knowledge representation and reasoning. Instances share the
+    process-wide core ontology snapshot unless given their own.
     """
 
-    def __init__(self):
-        self.relationships: Dict[RelationshipType, RelationshipDefinition] = {}
-        self._initialize_relationships()
+    def __init__(self, ontology: Optional[OntologySnapshot] = None):
+        self._ontology = ontology or load_core_ontology()
+
+    @property
+    def ontology(self) -> OntologySnapshot:
+        """The ontology snapshot backing this instance"""
+        return self._ontology
 
-    def _initialize_relationships(self):
-        """Initialize all core semantic relationships"""
+    @property
+    def relationships(self) -> Mapping[RelationshipType, RelationshipDefinition]:
+        """Read-only mapping of relationship type to definition"""
+        return self._ontology.relationships
+
+    @staticmethod
+    def _build_core_relationships() -> Dict[RelationshipType, RelationshipDefinition]:
+        """Build all core semantic relationship definitions"""
+        relationships: Dict[RelationshipType, RelationshipDefinition] = {}
 
         # TREATS relationship
-        self.relationships[RelationshipType.TREATS] = RelationshipDefinition(
+        relationships[RelationshipType.TREATS] = RelationshipDefinition(
             type=RelationshipType.TREATS,
             name="Treats",
             description="A medication, therapy, or intervention treats a medical condition",
@@ -156,7 +284,7 @@ class SemanticRelationships:
         )
 
         # INVESTIGATES relationship
-        self.relationships[RelationshipType.INVESTIGATES] = RelationshipDefinition(
+        relationships[RelationshipType.INVESTIGATES] = RelationshipDefinition(
             type=RelationshipType.INVESTIGATES,
             name="Investigates",
             description="A diagnostic test or procedure investigates a medical condition",
@@ -181,7 +309,7 @@ class SemanticRelationships:
         )
 
         # COMPLICATES relationship
-        self.relationships[RelationshipType.COMPLICATES] = RelationshipDefinition(
+        relationships[RelationshipType.COMPLICATES] = RelationshipDefinition(
             type=RelationshipType.COMPLICATES,
             name="Complicates",
             description="A medical condition complicates or worsens another condition",
@@ -205,7 +333,7 @@ class SemanticRelationships:
         )
 
         # RISK_FACTOR relationship
-        self.relationships[RelationshipType.RISK_FACTOR] = RelationshipDefinition(
+        relationships[RelationshipType.RISK_FACTOR] = RelationshipDefinition(
             type=RelationshipType.RISK_FACTOR,
             name="Risk Factor",
             description="A factor increases the risk of developing a medical condition",
@@ -230,7 +358,7 @@ class SemanticRelationships:
         )
 
         # PREVENTS relationship
-        self.relationships[RelationshipType.PREVENTS] = RelationshipDefinition(
+        relationships[RelationshipType.PREVENTS] = RelationshipDefinition(
             type=RelationshipType.PREVENTS,
             name="Prevents",
             description="An intervention prevents the occurrence of a medical condition",
@@ -249,7 +377,7 @@ class SemanticRelationships:
         )
 
         # AFFECTS relationship
-        self.relationships[RelationshipType.AFFECTS] = RelationshipDefinition(
+        relationships[RelationshipType.AFFECTS] = RelationshipDefinition(
             type=RelationshipType.AFFECTS,
             name="Affects",
             description="A condition affects a specific anatomical structure or system",
@@ -268,7 +396,7 @@ class SemanticRelationships:
         )
 
         # INTERACTS_WITH relationship
-        self.relationships[RelationshipType.INTERACTS_WITH] = RelationshipDefinition(
+        relationships[RelationshipType.INTERACTS_WITH] = RelationshipDefinition(
             type=RelationshipType.INTERACTS_WITH,
             name="Interacts With",
             description="A medication interacts with another medication or condition",
@@ -288,7 +416,7 @@ class SemanticRelationships:
         )
 
         # CO_OCCURS_WITH relationship
-        self.relationships[RelationshipType.CO_OCCURS_WITH] = RelationshipDefinition(
+        relationships[RelationshipType.CO_OCCURS_WITH] = RelationshipDefinition(
             type=RelationshipType.CO_OCCURS_WITH,
             name="Co-occurs With",
             description="Two conditions frequently occur together",
@@ -307,7 +435,7 @@ class SemanticRelationships:
         )
 
         # PRESENTS_WITH relationship
-        self.relationships[RelationshipType.PRESENTS_WITH] = RelationshipDefinition(
+        relationships[RelationshipType.PRESENTS_WITH] = RelationshipDefinition(
             type=RelationshipType.PRESENTS_WITH,
             name="Presents With",
             description="A condition typically presents with a specific symptom or sign",
@@ -326,7 +454,7 @@ class SemanticRelationships:
         )
 
         # INDICATES relationship
-        self.relationships[RelationshipType.INDICATES] = RelationshipDefinition(
+        relationships[RelationshipType.INDICATES] = RelationshipDefinition(
             type=RelationshipType.INDICATES,
             name="Indicates",
             description="A sign or symptom indicates the presence of a condition",
@@ -345,7 +473,7 @@ class SemanticRelationships:
         )
 
         # PRECEDES relationship
-        self.relationships[RelationshipType.PRECEDES] = RelationshipDefinition(
+        relationships[RelationshipType.PRECEDES] = RelationshipDefinition(
             type=RelationshipType.PRECEDES,
             name="Precedes",
             description="One condition typically precedes another in temporal sequence",
@@ -364,7 +492,7 @@ class SemanticRelationships:
         )
 
         # SNOMED CT: FINDING_SITE relationship
-        self.relationships[RelationshipType.FINDING_SITE] = RelationshipDefinition(
+        relationships[RelationshipType.FINDING_SITE] = RelationshipDefinition(
             type=RelationshipType.FINDING_SITE,
             name="Finding Site",
             description="Anatomical location where a clinical finding is present (SNOMED CT core relationship)",
@@ -383,7 +511,7 @@ class SemanticRelationships:
         )
 
         # SNOMED CT: CAUSATIVE_AGENT relationship
-        self.relationships[RelationshipType.CAUSATIVE_AGENT] = RelationshipDefinition(
+        relationships[RelationshipType.CAUSATIVE_AGENT] = RelationshipDefinition(
             type=RelationshipType.CAUSATIVE_AGENT,
             name="Causative Agent",
             description="Agent that causes or contributes to a clinical condition (SNOMED CT core relationship)",
@@ -402,7 +530,7 @@ class SemanticRelationships:
         )
 
         # SNOMED CT: SEVERITY relationship
-        self.relationships[RelationshipType.SEVERITY] = RelationshipDefinition(
+        relationships[RelationshipType.SEVERITY] = RelationshipDefinition(
             type=RelationshipType.SEVERITY,
             name="Severity",
             description="Severity level of a clinical condition (SNOMED CT core relationship)",
@@ -421,7 +549,7 @@ class SemanticRelationships:
         )
 
         # SNOMED CT: METHOD relationship
-        self.relationships[RelationshipType.METHOD] = RelationshipDefinition(
+        relationships[RelationshipType.METHOD] = RelationshipDefinition(
             type=RelationshipType.METHOD,
             name="Method",
             description="Method by which a procedure is performed (SNOMED CT core relationship)",
@@ -440,7 +568,7 @@ class SemanticRelationships:
         )
 
         # SNOMED CT: PROCEDURE_SITE relationship
-        self.relationships[RelationshipType.PROCEDURE_SITE] = RelationshipDefinition(
+        relationships[RelationshipType.PROCEDURE_SITE] = RelationshipDefinition(
             type=RelationshipType.PROCEDURE_SITE,
             name="Procedure Site",
             description="Anatomical site where a procedure is performed (SNOMED CT core relationship)",
@@ -459,7 +587,7 @@ class SemanticRelationships:
         )
 
         # SNOMED CT: CHARACTERIZES relationship
-        self.relationships[RelationshipType.CHARACTERIZES] = RelationshipDefinition(
+        relationships[RelationshipType.CHARACTERIZES] = RelationshipDefinition(
             type=RelationshipType.CHARACTERIZES,
             name="Characterizes",
             description="What an observable entity or measurement characterizes (SNOMED CT core relationship)",
@@ -478,7 +606,7 @@ class SemanticRelationships:
         )
 
         # FHIR-CPG: CASE_INFORMS_PLAN relationship
-        self.relationships[RelationshipType.CASE_INFORMS_PLAN] = RelationshipDefinition(
+        relationships[RelationshipType.CASE_INFORMS_PLAN] = RelationshipDefinition(
             type=RelationshipType.CASE_INFORMS_PLAN,
             name="Case Informs Plan",
             description="Patient case (current state, history, risks) informs the clinical plan (decision-making and care processes) (FHIR-CPG conceptual architecture)",
@@ -496,7 +624,7 @@ class SemanticRelationships:
         )
 
         # FHIR-CPG: PLAN_INSTANTIATES_CAREPLAN relationship
-        self.relationships[RelationshipType.PLAN_INSTANTIATES_CAREPLAN] = RelationshipDefinition(
+        relationships[RelationshipType.PLAN_INSTANTIATES_CAREPLAN] = RelationshipDefinition(
             type=RelationshipType.PLAN_INSTANTIATES_CAREPLAN,
             name="Plan Instantiates CarePlan",
             description="Definitional clinical plan becomes instantiated as a patient-specific care plan (FHIR-CPG conceptual architecture)",
@@ -514,7 +642,7 @@ class SemanticRelationships:
         )
 
         # FHIR-CPG: RECOMMENDATION_GENERATES_PROPOSAL relationship
-        self.relationships[RelationshipType.RECOMMENDATION_GENERATES_PROPOSAL] = RelationshipDefinition(
+        relationships[RelationshipType.RECOMMENDATION_GENERATES_PROPOSAL] = RelationshipDefinition(
             type=RelationshipType.RECOMMENDATION_GENERATES_PROPOSAL,
             name="Recommendation Generates Proposal",
             description="Clinical practice guideline recommendation becomes a patient-specific proposal in a care plan (FHIR-CPG)",
@@ -532,7 +660,7 @@ class SemanticRelationships:
         )
 
         # FHIR-CPG: PROPOSAL_GENERATES_REQUEST relationship
-        self.relationships[RelationshipType.PROPOSAL_GENERATES_REQUEST] = RelationshipDefinition(
+        relationships[RelationshipType.PROPOSAL_GENERATES_REQUEST] = RelationshipDefinition(
             type=RelationshipType.PROPOSAL_GENERATES_REQUEST,
             name="Proposal Generates Request",
             description="Patient-specific proposal leads to a clinical request (order, prescription, referral) (FHIR-CPG)",
@@ -550,7 +678,7 @@ class SemanticRelationships:
         )
 
         # FHIR-CPG: REQUEST_FULFILLED_BY_EVENT relationship
-        self.relationships[RelationshipType.REQUEST_FULFILLED_BY_EVENT] = RelationshipDefinition(
+        relationships[RelationshipType.REQUEST_FULFILLED_BY_EVENT] = RelationshipDefinition(
             type=RelationshipType.REQUEST_FULFILLED_BY_EVENT,
             name="Request Fulfilled by Event",
             description="Clinical request is fulfilled by a corresponding clinical event (administration, procedure, observation) (FHIR-CPG)",
@@ -568,7 +696,7 @@ class SemanticRelationships:
         )
 
         # FHIR-CPG: STRATEGY_CONTAINS_RECOMMENDATION relationship
-        self.relationships[RelationshipType.STRATEGY_CONTAINS_RECOMMENDATION] = RelationshipDefinition(
+        relationships[RelationshipType.STRATEGY_CONTAINS_RECOMMENDATION] = RelationshipDefinition(
             type=RelationshipType.STRATEGY_CONTAINS_RECOMMENDATION,
             name="Strategy Contains Recommendation",
             description="Clinical strategy groups and coordinates multiple recommendations for a specific condition or clinical scenario (FHIR-CPG)",
@@ -586,7 +714,7 @@ class SemanticRelationships:
         )
 
         # FHIR-CPG: PATHWAY_CONTAINS_STRATEGY relationship
-        self.relationships[RelationshipType.PATHWAY_CONTAINS_STRATEGY] = RelationshipDefinition(
+        relationships[RelationshipType.PATHWAY_CONTAINS_STRATEGY] = RelationshipDefinition(
             type=RelationshipType.PATHWAY_CONTAINS_STRATEGY,
             name="Pathway Contains Strategy",
             description="Clinical pathway coordinates multiple strategies across the patient journey (FHIR-CPG)",
@@ -604,7 +732,7 @@ class SemanticRelationships:
         )
 
         # FHIR-CPG: ACTIVITY_DEFINED_BY_DEFINITION relationship
-        self.relationships[RelationshipType.ACTIVITY_DEFINED_BY_DEFINITION] = RelationshipDefinition(
+        relationships[RelationshipType.ACTIVITY_DEFINED_BY_DEFINITION] = RelationshipDefinition(
             type=RelationshipType.ACTIVITY_DEFINED_BY_DEFINITION,
             name="Activity Defined by Definition",
             description="Clinical activity is defined by an ActivityDefinition specifying how it should be performed (FHIR-CPG)",
@@ -622,7 +750,7 @@ class SemanticRelationships:
         )
 
         # FHIR-CPG: PATIENT_ENROLLED_IN_PATHWAY relationship
-        self.relationships[RelationshipType.PATIENT_ENROLLED_IN_PATHWAY] = RelationshipDefinition(
+        relationships[RelationshipType.PATIENT_ENROLLED_IN_PATHWAY] = RelationshipDefinition(
             type=RelationshipType.PATIENT_ENROLLED_IN_PATHWAY,
             name="Patient Enrolled in Pathway",
             description="Patient is enrolled in a clinical pathway for management of their condition (FHIR-CPG)",
@@ -639,17 +767,23 @@ class SemanticRelationships:
             ]
         )
 
+        return relationships
+
     def get_relationship(self, rel_type: RelationshipType) -> RelationshipDefinition:
         """Get relationship definition by type"""
-        return self.relationships.get(rel_type)
+        return self._ontology.relationships.get(rel_type)
 
     def get_relationships_by_domain(self, domain: str) -> List[RelationshipDefinition]:
         """Get all relationships with a specific domain"""
-        return [rel for rel in self.relationships.values() if rel.domain == domain]
+        return list(self._ontology.by_domain.get(domain, ()))
 
     def get_relationships_by_range(self, range_type: str) -> List[RelationshipDefinition]:
         """Get all relationships with a specific range"""
-        return [rel for rel in self.relationships.values() if rel.range == range_type]
+        return list(self._ontology.by_range.get(range_type, ()))
+
+    def get_relationships_by_category(self, category: str) -> List[RelationshipDefinition]:
+        """Get all relationships in a category (see RELATIONSHIP_CATEGORIES)"""
+        return list(self._ontology.by_category.get(category, ()))
 
     def validate_relationship(self, rel_type: RelationshipType,
                             source_entity: str, target_entity: str,
@@ -666,27 +800,11 @@ class SemanticRelationships:
         Returns:
             List of validation errors (empty if valid)
         """
-        errors = []
-        rel_def = self.get_relationship(rel_type)
-
-        if not rel_def:
-            errors.append(f"Unknown relationship type: {rel_type}")
-            return errors
-
         # Check domain/range constraints (simplified - would need entity type checking)
         # In a full implementation, this would validate against ontologies
 
-        # Check required properties
-        if properties:
-            for prop_name, prop_type in rel_def.properties.items():
-                if prop_name in properties:
-                    value = properties[prop_name]
-                    if prop_type == "float" and not isinstance(value, (int, float)):
-                        errors.append(f"Property {prop_name} must be numeric")
-                    elif prop_type == "int" and not isinstance(value, int):
-                        errors.append(f"Property {prop_name} must be integer")
-
-        return errors
+        # Check typed properties with the snapshot's compiled rules
+        return self._ontology.validate(rel_type, properties)
 
     def get_core_relationships(self) -> List[RelationshipType]:
         """Get the core relationships including SNOMED CT and FHIR-CPG aligned types"""
@@ -721,10 +839,13 @@ class SemanticRelationships:
         """Export relationship definitions to JSON file"""
         export_data = {}
         for rel_type, rel_def in self.relationships.items():
-            export_data[rel_type.value] = asdict(rel_def)
+            export_data[rel_type.value] = {
+                field.name: _thaw(getattr(rel_def, field.name)) for field in fields(rel_def)
+            }
 
         with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+            json.dump(export_data, f, indent=2, ensure_ascii=False,
+                      default=lambda value: value.value if isinstance(value, Enum) else str(value))
 
         logger.info(f"Exported {len(self.relationships)} relationships to {filepath}")
 
@@ -733,14 +854,19 @@ class SemanticRelationships:
         with open(filepath, 'r', encoding='utf-8') as f:
             import_data = json.load(f)
 
+        definitions = dict(self.relationships)
         # Convert back to RelationshipDefinition objects
         for rel_name, rel_data in import_data.items():
             rel_type = RelationshipType(rel_name)
             # Remove 'type' from data and create enum
             rel_data_copy = rel_data.copy()
             rel_data_copy['type'] = rel_type
-            self.relationships[rel_type] = RelationshipDefinition(**rel_data_copy)
+            if rel_data_copy.get('inverse'):
+                rel_data_copy['inverse'] = RelationshipType(rel_data_copy['inverse'])
+            definitions[rel_type] = RelationshipDefinition(**rel_data_copy)
 
+        # The shared snapshot is never modified; this instance gets its own
+        self._ontology = OntologySnapshot(definitions)
         logger.info(f"Imported {len(self.relationships)} relationships from {filepath}")
 
 # Global instance for easy access
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Santiago Traceability Index: Bidirectional Anchor <-> Asset Links
+
+Persistent reverse index linking Layer 0 document anchors to the higher-level
+assets (concepts, rules, workflows) derived from them. Both directions are
+indexed, so "which anchors support this asset?" and "which assets were built
+from this anchor?" are single indexed lookups, and tracing a whole workflow
+back to its source text is one batched query instead of one file open per
+anchor.
+
+Anchor details (document, section, text, position) are denormalized into the
+index so trace queries never need to touch the per-document anchor storage.
+
+Author: GitHub Copilot
+Date: November 12, 2025
+"""
+
+import sqlite3
+import threading
+from pathlib import Path
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Iterable, Union
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# SQLite's default host parameter limit is 999; stay well below it per query
+_QUERY_CHUNK_SIZE = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS anchors (
+    anchor_id TEXT PRIMARY KEY,
+    doc_id TEXT NOT NULL,
+    section_id TEXT,
+    anchor_type TEXT,
+    text TEXT,
+    position INTEGER
+);
+CREATE TABLE IF NOT EXISTS anchor_asset_links (
+    anchor_id TEXT NOT NULL,
+    asset_id TEXT NOT NULL,
+    link_type TEXT NOT NULL DEFAULT 'derived_from',
+    created_at TEXT NOT NULL,
+    PRIMARY KEY (anchor_id, asset_id)
+);
+CREATE INDEX IF NOT EXISTS idx_links_asset ON anchor_asset_links (asset_id);
+CREATE INDEX IF NOT EXISTS idx_anchors_doc ON anchors (doc_id);
+"""
+
+class TraceabilityIndex:
+    """
+    SQLite-backed bidirectional index between anchors and higher-level assets
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def close(self):
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def add_link(self, anchor: Dict[str, Any], asset_id: str, link_type: str = "derived_from"):
+        """
+        Link a single anchor to a higher-level asset
+
+        Args:
+            anchor: Anchor details (id, doc_id, section_id, anchor_type, text, position)
+            asset_id: ID of the higher-level asset
+            link_type: Nature of the link
+        """
+        self.add_links([{**anchor, "asset_id": asset_id, "link_type": link_type}])
+
+    def add_links(self, links: Iterable[Dict[str, Any]]) -> int:
+        """
+        Bulk-create anchor/asset links in a single transaction
+
+        Args:
+            links: Dictionaries with anchor details plus asset_id (and optional link_type)
+
+        Returns:
+            Number of links written
+        """
+        created_at = datetime.now().isoformat()
+        anchor_rows = []
+        link_rows = []
+        for link in links:
+            anchor_id = link.get("anchor_id") or link["id"]
+            anchor_rows.append((
+                anchor_id,
+                link.get("doc_id"),
+                link.get("section_id"),
+                link.get("anchor_type"),
+                link.get("text"),
+                link.get("position")
+            ))
+            link_rows.append((anchor_id, link["asset_id"], link.get("link_type", "derived_from"), created_at))
+
+        if not link_rows:
+            return 0
+
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO anchors (anchor_id, doc_id, section_id, anchor_type, text, position) "
+                "VALUES (?, ?, ?, ?, ?, ?)", anchor_rows
+            )
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO anchor_asset_links (anchor_id, asset_id, link_type, created_at) "
+                "VALUES (?, ?, ?, ?)", link_rows
+            )
+
+        logger.info(f"Indexed {len(link_rows)} anchor/asset links")
+        return len(link_rows)
+
+    def remove_link(self, anchor_id: str, asset_id: str):
+        """Remove a single anchor/asset link"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "DELETE FROM anchor_asset_links WHERE anchor_id = ? AND asset_id = ?", (anchor_id, asset_id)
+            )
+
+    def get_anchors_for_asset(self, asset_id: str) -> List[Dict[str, Any]]:
+        """Get all anchors supporting an asset"""
+        return self.trace_assets([asset_id]).get(asset_id, [])
+
+    def get_assets_for_anchor(self, anchor_id: str) -> List[Dict[str, Any]]:
+        """Get all assets derived from an anchor"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT asset_id, link_type, created_at FROM anchor_asset_links WHERE anchor_id = ?",
+                (anchor_id,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def trace_assets(self, asset_ids: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Resolve anchors for many assets in one batched read
+
+        Args:
+            asset_ids: Asset IDs to trace
+
+        Returns:
+            Mapping of asset ID to its anchors (assets without anchors are omitted)
+        """
+        asset_ids = list(dict.fromkeys(asset_ids))
+        traced: Dict[str, List[Dict[str, Any]]] = {}
+
+        with self._lock:
+            for i in range(0, len(asset_ids), _QUERY_CHUNK_SIZE):
+                chunk = asset_ids[i:i + _QUERY_CHUNK_SIZE]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    "SELECT l.asset_id, l.link_type, a.anchor_id, a.doc_id, a.section_id, "
+                    "a.anchor_type, a.text, a.position "
+                    "FROM anchor_asset_links l JOIN anchors a ON a.anchor_id = l.anchor_id "
+                    f"WHERE l.asset_id IN ({placeholders})", chunk
+                ).fetchall()
+                for row in rows:
+                    record = dict(row)
+                    traced.setdefault(record.pop("asset_id"), []).append(record)
+
+        return traced
+
+    def get_anchor(self, anchor_id: str) -> Optional[Dict[str, Any]]:
+        """Get indexed anchor details"""
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM anchors WHERE anchor_id = ?", (anchor_id,)).fetchone()
+        return dict(row) if row else None
+
+    def stats(self) -> Dict[str, int]:
+        """Counts of indexed anchors and links"""
+        with self._lock:
+            anchors = self._conn.execute("SELECT COUNT(*) FROM anchors").fetchone()[0]
+            links = self._conn.execute("SELECT COUNT(*) FROM anchor_asset_links").fetchone()[0]
+        return {"anchors": anchors, "links": links}
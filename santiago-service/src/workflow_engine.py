@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Santiago Layer 4: Workflow Compilation and Execution
+
+Compiles Layer 3 computable rules into executable workflow DAGs and runs them
+against a patient context. Independent branches of a clinical pathway are
+executed concurrently on the asyncio event loop, so a pathway made of dozens
+of independent checks completes in the time of its longest branch rather than
+the sum of all of its steps.
+
+Rule format (Layer 3 ``content["rules"]`` entries):
+    {
+        "id": "check_bp",                       # Optional, defaults to rule_<n>
+        "action": "recommend_ace_inhibitor",    # What the step does
+        "action_type": "recommendation",        # Selects the step handler
+        "condition": {"field": "systolic_bp", "operator": ">=", "value": 130},
+        "depends_on": ["assess_risk"]           # Upstream rule IDs
+    }
+
+Author: GitHub Copilot
+Date: November 12, 2025
+"""
+
+import asyncio
+import hashlib
+import json
+import operator
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, List, Optional, Callable, Tuple
+import logging
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Comparison operators supported in rule conditions
+CONDITION_OPERATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "in": lambda actual, expected: actual in expected,
+    "contains": lambda actual, expected: expected in actual,
+    "exists": lambda actual, expected: actual is not None
+}
+
+# Step handler signature: (step, patient_context, upstream_outputs) -> output
+StepHandler = Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Any]
+
+class WorkflowCompilationError(ValueError):
+    """Raised when Layer 3 rules cannot be compiled into a valid DAG"""
+
+@dataclass
+class StepExecution:
+    """Outcome of a single workflow step"""
+    step_id: str
+    status: str  # completed, not_applicable, skipped, failed
+    output: Any = None
+    latency_ms: float = 0.0
+    cached: bool = False
+    error: Optional[str] = None
+
+@dataclass
+class WorkflowExecutionResult:
+    """Outcome of a full workflow run for one patient context"""
+    workflow_id: str
+    context_fingerprint: str
+    steps: Dict[str, StepExecution] = field(default_factory=dict)
+    total_latency_ms: float = 0.0
+
+    @property
+    def completed_steps(self) -> List[str]:
+        return [step_id for step_id, step in self.steps.items() if step.status == "completed"]
+
+    def step_latencies(self) -> Dict[str, float]:
+        """Per-step latency in milliseconds"""
+        return {step_id: step.latency_ms for step_id, step in self.steps.items()}
+
+class WorkflowCompiler:
+    """
+    Compiles Layer 3 rules into a workflow DAG
+
+    The compiled workflow is a plain dictionary so it can be stored directly in
+    the ``content`` of a Layer 4 GraphNode and serialized alongside it.
+    """
+
+    def compile(self, workflow_id: str, rules: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Build a workflow DAG from a list of rules
+
+        Args:
+            workflow_id: Identifier of the workflow being compiled
+            rules: Layer 3 rule dictionaries
+
+        Returns:
+            Dictionary with workflow_dag, execution_paths, entry_points and exit_points
+        """
+        nodes: Dict[str, Dict[str, Any]] = {}
+
+        for index, rule in enumerate(rules):
+            step_id = str(rule.get("id") or f"rule_{index + 1}")
+            if step_id in nodes:
+                raise WorkflowCompilationError(f"Duplicate rule ID in workflow {workflow_id}: {step_id}")
+
+            nodes[step_id] = {
+                "id": step_id,
+                "action": rule.get("action"),
+                "action_type": rule.get("action_type", "default"),
+                "condition": rule.get("condition"),
+                "depends_on": [str(dep) for dep in rule.get("depends_on", [])],
+                "dependents": [],
+                "rule": rule
+            }
+
+        edges = []
+        for step_id, node in nodes.items():
+            for dependency in node["depends_on"]:
+                if dependency not in nodes:
+                    raise WorkflowCompilationError(
+                        f"Rule {step_id} depends on unknown rule {dependency} in workflow {workflow_id}"
+                    )
+                nodes[dependency]["dependents"].append(step_id)
+                edges.append([dependency, step_id])
+
+        stages = self._topological_stages(workflow_id, nodes)
+
+        return {
+            "workflow_dag": {
+                "id": workflow_id,
+                "nodes": nodes,
+                "edges": edges
+            },
+            # Each stage lists steps whose dependencies are all in earlier stages
+            "execution_paths": stages,
+            "entry_points": [step_id for step_id, node in nodes.items() if not node["depends_on"]],
+            "exit_points": [step_id for step_id, node in nodes.items() if not node["dependents"]]
+        }
+
+    def _topological_stages(self, workflow_id: str,
+                            nodes: Dict[str, Dict[str, Any]]) -> List[List[str]]:
+        """Group steps into dependency stages (Kahn's algorithm), rejecting cycles"""
+        in_degree = {step_id: len(node["depends_on"]) for step_id, node in nodes.items()}
+        current = [step_id for step_id, degree in in_degree.items() if degree == 0]
+        stages = []
+        visited = 0
+
+        while current:
+            stages.append(current)
+            visited += len(current)
+            next_stage = []
+            for step_id in current:
+                for dependent in nodes[step_id]["dependents"]:
+                    in_degree[dependent] -= 1
+                    if in_degree[dependent] == 0:
+                        next_stage.append(dependent)
+            current = next_stage
+
+        if visited != len(nodes):
+            cyclic = sorted(step_id for step_id, degree in in_degree.items() if degree > 0)
+            raise WorkflowCompilationError(f"Cycle detected in workflow {workflow_id}: {cyclic}")
+
+        return stages
+
+class WorkflowExecutor:
+    """
+    Concurrent asyncio executor for compiled workflows
+
+    Every step is scheduled as its own task and waits only on its direct
+    dependencies, so independent branches run concurrently. Step results are
+    cached per patient context so repeated evaluations of the same pathway for
+    the same patient do not re-run completed steps.
+    """
+
+    def __init__(self, handlers: Optional[Dict[str, StepHandler]] = None,
+                 max_concurrency: Optional[int] = None, cache_size: int = 4096):
+        self.handlers: Dict[str, StepHandler] = {"default": self._default_handler}
+        if handlers:
+            self.handlers.update(handlers)
+        self.max_concurrency = max_concurrency
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str, str], StepExecution]" = OrderedDict()
+
+    def register_handler(self, action_type: str, handler: StepHandler):
+        """Register a (sync or async) handler for an action type"""
+        self.handlers[action_type] = handler
+
+    def clear_cache(self):
+        """Drop all cached step results"""
+        self._cache.clear()
+
+    async def execute(self, workflow: Dict[str, Any],
+                      patient_context: Dict[str, Any]) -> WorkflowExecutionResult:
+        """
+        Execute a compiled workflow for a patient context
+
+        Args:
+            workflow: Output of WorkflowCompiler.compile (or a Layer 4 node's content)
+            patient_context: Patient data used by rule conditions and handlers
+
+        Returns:
+            WorkflowExecutionResult with per-step status, output and latency
+        """
+        dag = workflow["workflow_dag"]
+        workflow_id = dag.get("id", "workflow")
+        nodes = dag.get("nodes", {})
+        fingerprint = self.context_fingerprint(patient_context)
+        result = WorkflowExecutionResult(workflow_id=workflow_id, context_fingerprint=fingerprint)
+        semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+        tasks: Dict[str, asyncio.Task] = {}
+
+        async def run_step(step_id: str) -> StepExecution:
+            node = nodes[step_id]
+            upstream = [await tasks[dep] for dep in node["depends_on"]]
+
+            if any(dep.status != "completed" for dep in upstream):
+                execution = StepExecution(step_id=step_id, status="skipped")
+            else:
+                cache_key = (workflow_id, step_id, fingerprint)
+                cached = self._cache_get(cache_key)
+                if cached is not None:
+                    execution = StepExecution(step_id=step_id, status=cached.status,
+                                              output=cached.output, cached=True)
+                else:
+                    upstream_outputs = {dep.step_id: dep.output for dep in upstream}
+                    if semaphore:
+                        async with semaphore:
+                            execution = await self._run_step(node, patient_context, upstream_outputs)
+                    else:
+                        execution = await self._run_step(node, patient_context, upstream_outputs)
+                    if execution.status != "failed":
+                        self._cache_put(cache_key, execution)
+
+            result.steps[step_id] = execution
+            return execution
+
+        start = time.perf_counter()
+        # Create tasks in topological order so dependencies always exist first
+        for stage in workflow.get("execution_paths") or [list(nodes)]:
+            for step_id in stage:
+                tasks[step_id] = asyncio.ensure_future(run_step(step_id))
+        if tasks:
+            await asyncio.gather(*tasks.values())
+        result.total_latency_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(f"Executed workflow {workflow_id}: {len(result.completed_steps)}/{len(nodes)} steps completed "
+                    f"in {result.total_latency_ms:.1f}ms")
+        return result
+
+    async def _run_step(self, node: Dict[str, Any], patient_context: Dict[str, Any],
+                        upstream_outputs: Dict[str, Any]) -> StepExecution:
+        """Evaluate a step's condition and run its handler, timing the step"""
+        step_id = node["id"]
+        start = time.perf_counter()
+        try:
+            if not self.evaluate_condition(node.get("condition"), patient_context):
+                status, output = "not_applicable", None
+            else:
+                handler = self.handlers.get(node.get("action_type"), self.handlers["default"])
+                output = handler(node, patient_context, upstream_outputs)
+                if asyncio.iscoroutine(output) or isinstance(output, asyncio.Future):
+                    output = await output
+                status = "completed"
+            return StepExecution(step_id=step_id, status=status, output=output,
+                                 latency_ms=(time.perf_counter() - start) * 1000)
+        except Exception as e:
+            logger.error(f"Workflow step {step_id} failed: {e}")
+            return StepExecution(step_id=step_id, status="failed", error=str(e),
+                                 latency_ms=(time.perf_counter() - start) * 1000)
+
+    @staticmethod
+    def evaluate_condition(condition: Optional[Dict[str, Any]], patient_context: Dict[str, Any]) -> bool:
+        """
+        Evaluate a rule condition against the patient context
+
+        Supports single comparisons ({"field", "operator", "value"}) and
+        boolean groups ({"all": [...]} / {"any": [...]}). A missing condition
+        always applies.
+        """
+        if not condition:
+            return True
+        if "all" in condition:
+            return all(WorkflowExecutor.evaluate_condition(c, patient_context) for c in condition["all"])
+        if "any" in condition:
+            return any(WorkflowExecutor.evaluate_condition(c, patient_context) for c in condition["any"])
+
+        op = CONDITION_OPERATORS.get(condition.get("operator", "=="))
+        if op is None:
+            raise ValueError(f"Unsupported condition operator: {condition.get('operator')}")
+
+        actual = patient_context.get(condition.get("field"))
+        if actual is None and condition.get("operator") != "exists":
+            return False
+        try:
+            return bool(op(actual, condition.get("value")))
+        except TypeError:
+            return False
+
+    @staticmethod
+    def context_fingerprint(patient_context: Dict[str, Any]) -> str:
+        """Stable hash of a patient context, used as the cache key"""
+        payload = json.dumps(patient_context, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _cache_get(self, key: Tuple[str, str, str]) -> Optional[StepExecution]:
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+        return cached
+
+    def _cache_put(self, key: Tuple[str, str, str], execution: StepExecution):
+        self._cache[key] = execution
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _default_handler(step: Dict[str, Any], patient_context: Dict[str, Any],
+                         upstream_outputs: Dict[str, Any]) -> Dict[str, Any]:
+        """Default handler: the step's action applies to the patient"""
+        return {"action": step.get("action"), "applies": True}
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Tests for non-blocking Santiago document loading
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from document_loader import DocumentLoader
+from async_document_loader import AsyncDocumentLoader
+
+
+class TestAsyncDocumentLoader:
+    """Test cases for the async document loader"""
+
+    @pytest.fixture
+    def async_loader(self, tmp_path):
+        """Create an async loader backed by a temporary document store"""
+        async_loader = AsyncDocumentLoader(DocumentLoader(str(tmp_path / "documents")), max_workers=2)
+        yield async_loader
+        async_loader.close()
+
+    @pytest.mark.asyncio
+    async def test_load_and_read_sections(self, async_loader):
+        """Test loading and batched section reads through the executor"""
+        content = "# Guideline\nIntro\n## Dosing\nMetformin 500 mg\n"
+        metadata = await async_loader.load_document(content, {"title": "DM"})
+
+        section_ids = [section['id'] for section in metadata.sections]
+        contents = await async_loader.get_section_contents(metadata.id, section_ids)
+
+        assert contents[section_ids[1]] == "## Dosing\nMetformin 500 mg\n"
+        assert await async_loader.get_document_content(metadata.id) == content
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive_during_large_load(self, async_loader):
+        """Test other coroutines keep running while a large document is stored"""
+        content = "".join(f"## Section {i}\n" + "Clinical text line.\n" * 50 for i in range(4000))
+        ticks = 0
+        done = asyncio.Event()
+
+        async def ticker():
+            nonlocal ticks
+            while not done.is_set():
+                ticks += 1
+                await asyncio.sleep(0.001)
+
+        ticker_task = asyncio.create_task(ticker())
+        metadata = await async_loader.load_document(content, {"title": "Large"})
+        done.set()
+        await ticker_task
+
+        assert len(metadata.sections) == 4000
+        assert ticks > 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_of_identical_content(self, async_loader):
+        """Test concurrent writers do not clobber each other's temp files"""
+        content = "# Shared\nSame content\n"
+        loaded = await asyncio.gather(*(
+            async_loader.load_document(content, {"title": "Shared"}) for _ in range(8)
+        ))
+
+        assert len({metadata.id for metadata in loaded}) == 1
+        assert await async_loader.get_document_content(loaded[0].id) == content
+        assert list(async_loader.loader.storage_path.glob(f"{loaded[0].id}/*.tmp")) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Tests for Santiago Layer 0 document loading and storage
+"""
+
+import pytest
+import io
+import json
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from document_loader import DocumentLoader
+
+
+class TestDocumentLoader:
+    """Test cases for the Layer 0 document loader"""
+
+    @pytest.fixture
+    def loader(self, tmp_path):
+        """Create a loader backed by a temporary document store"""
+        return DocumentLoader(str(tmp_path / "documents"))
+
+    @pytest.fixture
+    def sample_content(self):
+        """Markdown guideline with non-ASCII text"""
+        return (
+            "# Hypertension Guideline\n"
+            "Blood pressure ≥130/80 mmHg is elevated.\n"
+            "## Treatment\n"
+            "Start an ACE inhibitor — reassess in 4 weeks.\n"
+            "## Monitoring\n"
+            "Check creatinine and potassium.\n"
+        )
+
+    def test_section_reads_from_memory_map(self, loader, sample_content):
+        """Test section content is sliced from the mapped store by byte offsets"""
+        metadata = loader.load_document(sample_content, {"title": "HTN"})
+
+        for section in metadata.sections:
+            expected = sample_content[section['start_position']:section['end_position']]
+            assert loader.get_document_content(metadata.id, section['id']) == expected
+            assert isinstance(loader.get_section_view(metadata.id, section['id']), memoryview)
+
+        assert loader.get_document_content(metadata.id) == sample_content
+
+    def test_text_parser_records_exact_offsets_and_parents(self, loader):
+        """Test heading sections start exactly at their heading lines and nest by level"""
+        content = "Preamble\n# A\ntext ü\n\n## A.1\nmore\n### A.1.a\n## A.2\n# B\nend"
+        sections, toc = loader._parse_text_structure(content)
+
+        by_title = {section.title: section for section in sections}
+        assert [section.title for section in sections] == ["A", "A.1", "A.1.a", "A.2", "B"]
+        assert by_title["A.1"].parent_id == by_title["A"].id
+        assert by_title["A.1.a"].parent_id == by_title["A.1"].id
+        assert by_title["B"].parent_id is None
+        assert by_title["A"].subsections == [by_title["A.1"].id, by_title["A.2"].id]
+
+        for section in sections:
+            heading = content[section.start_position:section.end_position].split("\n")[0]
+            assert heading.lstrip("#").strip() == section.title
+            assert content.encode()[section.start_byte:section.end_byte].decode() == \
+                content[section.start_position:section.end_position]
+        assert sections[-1].end_position == len(content)
+
+    def test_pdf_parser_records_exact_offsets(self, loader):
+        """Test recommendation and header sections carry exact offsets"""
+        content = "Intro text\n\nCARDIOVASCULAR RISK\n  9.1 Treat hypertension\nbody\n9.2\nmore\n"
+        sections, toc = loader._parse_pdf_structure(content)
+
+        assert [section.id for section in sections] == ["section_1", "recommendation_9_1", "recommendation_9_2"]
+        assert content[sections[1].start_position:sections[1].end_position] == "  9.1 Treat hypertension\nbody\n"
+        assert sections[2].title == "Recommendation 9.2"
+        assert sections[2].end_position == len(content)
+
+    def test_content_window_matches_character_slice(self, loader, sample_content):
+        """Test context windows honor character positions in non-ASCII text"""
+        metadata = loader.load_document(sample_content, {"title": "HTN"})
+
+        for position in (0, 30, 70, len(sample_content) - 5):
+            expected = sample_content[max(0, position - 10):position + 10]
+            assert loader.get_content_window(metadata.id, position, 20) == expected
+
+    def test_resolve_anchor_reference(self, loader, sample_content):
+        """Test anchor resolution returns section and context without the full document"""
+        metadata = loader.load_document(sample_content, {"title": "HTN"})
+        section = metadata.sections[1]
+        anchor_id = loader.create_anchor_reference(
+            metadata.id, section['id'], "ACE inhibitor", "recommendation",
+            sample_content.index("ACE inhibitor"), "Start an ACE inhibitor"
+        )
+
+        resolved = loader.resolve_anchor_reference(anchor_id)
+
+        assert "ACE inhibitor" in resolved['section_content']
+        assert "ACE inhibitor" in resolved['full_context']
+        assert 'document_content' not in resolved
+        assert loader.resolve_anchor_reference(anchor_id, include_document=True)['document_content'] == sample_content
+
+    def test_batch_anchor_creation(self, loader, sample_content):
+        """Test many anchors are created in one call and resolvable by ID"""
+        metadata = loader.load_document(sample_content, {"title": "HTN"})
+        section_id = metadata.sections[0]['id']
+        anchor_ids = loader.create_anchor_references([
+            {"doc_id": metadata.id, "section_id": section_id, "anchor_text": f"anchor {i}",
+             "anchor_type": "recommendation", "position": i, "context": "ctx"}
+            for i in range(50)
+        ])
+
+        assert len(set(anchor_ids)) == 50
+        assert len(loader.anchor_store.list_for_document(metadata.id)) == 50
+        assert loader.resolve_anchor_reference(anchor_ids[7])['anchor']['text'] == "anchor 7"
+        assert not (loader.storage_path / metadata.id / "anchors").exists()
+
+    def test_identical_content_shares_one_blob(self, loader, sample_content):
+        """Test documents with the same content are deduplicated in the blob store"""
+        first = loader.load_document(sample_content, {"title": "HTN"})
+        second = loader.load_document(sample_content, {"title": "HTN (copy)"})
+
+        assert first.id != second.id
+        assert first.content_blob == second.content_blob == first.checksum
+        blobs = list(loader.blob_store.root.glob("*/*"))
+        assert len(blobs) == 1
+        umask = os.umask(0)
+        os.umask(umask)
+        assert blobs[0].stat().st_mode & 0o777 == 0o666 & ~umask
+        assert not (loader.storage_path / first.id / "content.txt").exists()
+        assert loader.get_document_content(second.id) == sample_content
+
+    def test_blob_reads_span_frames(self, tmp_path):
+        """Test section reads decompress across small frame boundaries"""
+        loader = DocumentLoader(str(tmp_path / "documents"))
+        loader.blob_store.frame_size = 16
+        content = "# Title\n" + "".join(f"## Part {i}\nDose ≥{i} mg — review.\n" for i in range(20))
+        metadata = loader.load_document(content, {"title": "Frames"})
+
+        reopened = DocumentLoader(str(tmp_path / "documents"))
+        for section in metadata.sections:
+            expected = content[section['start_position']:section['end_position']]
+            assert reopened.get_document_content(metadata.id, section['id']) == expected
+        assert reopened.blob_store.size(metadata.content_blob) == len(content.encode('utf-8'))
+
+    def test_plain_content_storage(self, tmp_path, sample_content):
+        """Test compression can be disabled in favour of plain mapped content"""
+        loader = DocumentLoader(str(tmp_path / "documents"), compress_content=False)
+        metadata = loader.load_document(sample_content, {"title": "HTN"})
+
+        assert metadata.content_blob is None
+        assert (loader.storage_path / metadata.id / "content.txt").exists()
+        assert loader.get_document_content(metadata.id) == sample_content
+
+        umask = os.umask(0)
+        os.umask(umask)
+        for name in ("content.txt", "metadata.json"):
+            assert (loader.storage_path / metadata.id / name).stat().st_mode & 0o777 == 0o666 & ~umask
+
+    def test_streaming_matches_in_memory_load(self, tmp_path, sample_content):
+        """Test chunked ingestion yields the same document as a full load"""
+        source = tmp_path / "guideline.md"
+        source.write_text(sample_content * 3, encoding='utf-8')
+        loaded = DocumentLoader(str(tmp_path / "a")).load_document(source, {"title": "HTN"})
+
+        loader = DocumentLoader(str(tmp_path / "b"))
+        streamed = loader.load_document_stream(source, {"title": "HTN"}, chunk_size=7)
+
+        assert (streamed.id, streamed.checksum, streamed.toc) == (loaded.id, loaded.checksum, loaded.toc)
+        assert streamed.sections == loaded.sections
+        assert all(section['content'] == "" for section in streamed.sections)
+        assert loader.get_document_content(streamed.id) == sample_content * 3
+        for section in streamed.sections:
+            expected = (sample_content * 3)[section['start_position']:section['end_position']]
+            assert loader.get_document_content(streamed.id, section['id']) == expected
+
+    def test_streaming_from_text_stream_uncompressed(self, tmp_path, sample_content):
+        """Test streaming from an open stream into plain content storage"""
+        loader = DocumentLoader(str(tmp_path / "documents"), compress_content=False)
+        metadata = loader.load_document_stream(io.StringIO(sample_content), {"title": "HTN"}, chunk_size=5)
+
+        assert metadata.file_path is None
+        assert metadata.checksum == loader._calculate_checksum(sample_content)
+        assert loader.get_document_content(metadata.id, metadata.sections[1]['id']).startswith("## Treatment")
+        assert list(loader.storage_path.glob("*.tmp")) == []
+
+    def test_html_sections_from_heading_tags(self, tmp_path):
+        """Test h1-h6 sections with offsets into the extracted text, streamed or not"""
+        html = (
+            "<html><head><style>h1 {color: red}</style></head><body>"
+            "<h1>Diabetes &amp; Care</h1><p>Intro ≥ text</p>"
+            "<h2>Screening</h2><p>Screen adults.<br>Repeat yearly.</p>"
+            "<h3>Tests</h3><ul><li>HbA1c</li></ul><h2>Treatment</h2><p>Metformin</p>"
+            "<script>var h2 = '<h2>no</h2>';</script></body></html>"
+        )
+        source = tmp_path / "guideline.html"
+        source.write_text(html, encoding='utf-8')
+        loader = DocumentLoader(str(tmp_path / "documents"))
+
+        loaded = loader.load_document(source, {"title": "DM"})
+        streamed = loader.load_document_stream(source, {"title": "DM", "version": "2"}, chunk_size=9)
+
+        assert [(s['title'], s['level']) for s in loaded.sections] == [
+            ("Diabetes & Care", 1), ("Screening", 2), ("Tests", 3), ("Treatment", 2)
+        ]
+        assert loaded.sections[2]['parent_id'] == loaded.sections[1]['id']
+        assert streamed.sections == loaded.sections and streamed.checksum == loaded.checksum
+        assert loader.get_document_content(loaded.id, loaded.sections[1]['id']) == \
+            "Screening\nScreen adults.\nRepeat yearly.\n"
+        assert "color" not in loader.get_document_content(loaded.id)
+
+    def test_xml_sections_from_section_elements(self, tmp_path):
+        """Test nested XML section elements with offsets into the raw XML"""
+        xml = (
+            '<?xml version="1.0"?><guideline xmlns:g="urn:g"><title>Doc</title>'
+            '<g:section><title>Hypertension ≥130</title><p>Body</p>'
+            '<section title="Drugs"><p>ACE</p></section></g:section>'
+            '<sec><label>2</label><p>No title</p></sec></guideline>'
+        )
+        source = tmp_path / "guideline.xml"
+        source.write_text(xml, encoding='utf-8')
+        loader = DocumentLoader(str(tmp_path / "documents"))
+
+        loaded = loader.load_document(source, {"title": "HTN"})
+        streamed = loader.load_document_stream(source, {"title": "HTN", "version": "2"}, chunk_size=4)
+
+        assert [(s['title'], s['level']) for s in loaded.sections] == [
+            ("Hypertension ≥130", 1), ("Drugs", 2), ("Sec 3", 1)
+        ]
+        assert loaded.toc[0]['title'] == "Hypertension ≥130"
+        assert loaded.sections[1]['parent_id'] == loaded.sections[0]['id']
+        assert streamed.sections == loaded.sections
+        for section in loaded.sections:
+            assert loader.get_document_content(loaded.id, section['id']) == \
+                xml[section['start_position']:section['end_position']]
+        assert loader.get_document_content(loaded.id, loaded.sections[1]['id']).startswith('<section title="Drugs">')
+
+    def test_catalog_filters_and_paginates(self, loader):
+        """Test listing stored documents with filters and cursor pagination"""
+        for i in range(7):
+            loader.load_document(f"# Doc {i}\nBody {i}\n", {
+                "title": f"Doc {i}", "source": "WHO" if i % 2 else "CDC",
+                "organization": "org", "document_type": "guideline"
+            })
+
+        page = loader.list_documents_page(limit=3)
+        seen = [doc['id'] for doc in page['documents']]
+        while page['next_cursor']:
+            page = loader.list_documents_page(limit=3, cursor=page['next_cursor'])
+            seen.extend(doc['id'] for doc in page['documents'])
+
+        assert page['total'] == 7
+        assert seen == sorted(seen) and len(set(seen)) == 7
+        assert loader.count_documents(source="WHO") == 3
+        assert {doc['source'] for doc in loader.list_documents(source="CDC")} == {"CDC"}
+        assert loader.list_documents(organization="other") == []
+
+    def test_catalog_backfills_existing_store(self, tmp_path, sample_content):
+        """Test documents stored before the catalog existed are listed"""
+        storage = tmp_path / "documents"
+        first = DocumentLoader(str(storage))
+        metadata = first.load_document(sample_content, {"title": "HTN", "source": "ACC"})
+        first.catalog.close()
+        (storage / "catalog.db").unlink()
+
+        reopened = DocumentLoader(str(storage))
+        listed = reopened.list_documents()
+
+        assert [doc['id'] for doc in listed] == [metadata.id]
+        assert listed[0]['sections_count'] == len(metadata.sections)
+        assert not reopened.loaded_documents
+
+    def test_legacy_json_anchors_are_migrated(self, tmp_path, sample_content):
+        """Test JSON anchor files from the old layout are imported once"""
+        storage = tmp_path / "documents"
+        first = DocumentLoader(str(storage))
+        metadata = first.load_document(sample_content, {"title": "HTN"})
+        first.anchor_store.close()
+        anchor_id = f"{metadata.id}_section_1_anchor_legacy01"
+        anchor_dir = storage / metadata.id / "anchors"
+        anchor_dir.mkdir()
+        (anchor_dir / f"{anchor_id}.json").write_text(json.dumps({
+            "id": anchor_id, "text": "Blood pressure", "section_id": "section_1", "position": 25,
+            "context": "Blood pressure ≥130/80", "anchor_type": "recommendation",
+            "metadata": {"doc_id": metadata.id}
+        }))
+        (storage / "anchors.db").unlink()
+
+        migrated = DocumentLoader(str(storage))
+
+        assert migrated.resolve_anchor_reference(anchor_id)['anchor']['text'] == "Blood pressure"
+        assert migrated.anchor_store.migrate_json_anchors(storage) == 0
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for dynamic relationship discovery
+"""
+
+import itertools
+import json
+import re
+import pytest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import dynamic_relationship_discovery
+from dynamic_relationship_discovery import EntityPairExtractor, DynamicRelationshipDiscovery, ContextAnalyzer
+
+SAMPLE_TEXT = (
+    "Metformin is used to treat type 2 diabetes. Hypertension causes stroke and "
+    "chronic kidney disease. Aspirin prevents myocardial infarction in high-risk "
+    "patients. Colonoscopy is a screening for cancer. " + "Unrelated filler text. " * 20 +
+    "Insulin treats diabetes."
+)
+
+
+def all_pairs_reference(extractor, text):
+    """All-pairs extraction over entity pairs within the window"""
+    entities = sorted(
+        ((match.group(), entity_type, match.start())
+         for pattern, entity_type in extractor._entity_patterns
+         for match in pattern.finditer(text)),
+        key=lambda entity: entity[2]
+    )
+    pairs = []
+    for (entity1, type1, pos1), (entity2, type2, pos2) in itertools.combinations(entities, 2):
+        if abs(pos1 - pos2) > extractor.PAIR_WINDOW:
+            continue
+        end = max(pos1 + len(entity1), pos2 + len(entity2))
+        context_start, context_end = max(0, pos1 - 50), min(len(text), end + 50)
+        for rel_type, patterns in extractor.relationship_indicators.items():
+            if any(match.start() >= context_start and match.end() <= context_end
+                   for pattern in patterns
+                   for match in re.finditer(pattern, text, re.IGNORECASE)):
+                context = text[context_start:context_end]
+                source, target = extractor._determine_direction(entity1, entity2, type1, type2, rel_type, context)
+                pairs.append((source, target, rel_type, context))
+                break
+    return pairs
+
+
+class TestEntityPairExtractor:
+    """Test cases for sliding-window entity pairing"""
+
+    @pytest.fixture
+    def extractor(self):
+        return EntityPairExtractor()
+
+    def test_matches_all_pairs_reference(self, extractor):
+        """Test windowed pairing finds the same pairs as comparing every entity pair"""
+        assert extractor.extract_entity_pairs(SAMPLE_TEXT) == all_pairs_reference(extractor, SAMPLE_TEXT)
+
+    def test_pairs_and_directions(self, extractor):
+        """Test interventions are oriented towards the conditions they act on"""
+        pairs = {(source.lower(), target.lower(), rel_type)
+                 for source, target, rel_type, _ in extractor.extract_entity_pairs(SAMPLE_TEXT)}
+
+        assert ("metformin", "diabetes", "treatment") in pairs
+        # Causation runs from the entity mentioned first
+        assert ("aspirin", "myocardial infarction", "causation") in pairs
+        assert ("insulin", "diabetes", "treatment") in pairs
+        # Entities further apart than the window are never paired
+        assert not any({source, target} == {"metformin", "insulin"} for source, target, _ in pairs)
+
+    def test_indicator_precedence(self, extractor):
+        """Test the first matching indicator category wins, as before"""
+        assert extractor._identify_relationship_type("it causes and treats disease") == "treatment"
+        assert extractor._identify_relationship_type("due to infection") == "causation"
+        assert extractor._identify_relationship_type("no indicator here") is None
+
+
+class TestContextAnalyzerBatch:
+    """Test cases for batch context scoring"""
+
+    CANDIDATES = [
+        ("metformin", "diabetes", "treatment",
+         "In a randomized controlled trial, patients on therapy improved clinical outcome."),
+        ("medication A", "condition B", "treatment", "Patient management with medication."),
+        ("condition B", "procedure C", "treatment", "expert opinion only"),
+        ("condition X", "condition Y", "causation", "A cohort study of heart and kidney disease."),
+        ("procedure Z", "condition Y", "diagnosis", "Level C evidence; case report of COPD and GI bleeding."),
+        ("stroke", "hypertension", "prevention", ""),
+        ("aspirin", "heartburn", "treatment", "cohort\nstudy, meta-analysis"),
+    ]
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_batch_matches_per_candidate_analysis(self, monkeypatch, use_numpy):
+        """Test batch scores equal analyze_context for every candidate"""
+        if use_numpy and not dynamic_relationship_discovery.HAS_NUMPY:
+            pytest.skip("NumPy not installed")
+        monkeypatch.setattr(dynamic_relationship_discovery, "HAS_NUMPY", use_numpy)
+        analyzer = ContextAnalyzer()
+
+        scores = analyzer.analyze_batch(self.CANDIDATES)
+
+        assert len(scores) == len(self.CANDIDATES)
+        for index, candidate in enumerate(self.CANDIDATES):
+            assert scores.analysis(index) == analyzer.analyze_context(*candidate)
+        assert scores.above(0.0) == list(range(len(self.CANDIDATES)))
+        assert len(analyzer.analyze_batch([])) == 0
+
+
+class TestDynamicRelationshipDiscovery:
+    """Test cases for candidate merging and corpus discovery"""
+
+    CORPUS = [
+        (f"guideline_{i}", "Metformin is used to treat diabetes. Hypertension causes stroke.")
+        for i in range(6)
+    ] + [("guideline_extra", "Insulin treats diabetes in a randomized controlled trial.")]
+
+    @pytest.fixture
+    def engine(self):
+        return DynamicRelationshipDiscovery(confidence_threshold=0.0)
+
+    def test_rediscovery_merges_into_stable_candidate(self, engine):
+        """Test duplicates merge by (source, target, type) with content-derived IDs"""
+        first = engine.discover_relationships(self.CORPUS[0][1], "a")
+        second = engine.discover_relationships(self.CORPUS[1][1].upper(), "b")
+
+        assert [c.id for c in first] == [c.id for c in second]
+        assert len(engine.discovered_candidates) == len(first)
+        merged = engine.discovered_candidates[0]
+        assert merged.evidence_sources == ["a", "b"]
+        assert merged.occurrences == 2
+        assert DynamicRelationshipDiscovery(confidence_threshold=0.0).discover_relationships(
+            self.CORPUS[0][1], "c")[0].id == merged.id
+
+    def test_parallel_corpus_matches_serial(self, tmp_path):
+        """Test the process pool produces the same merged candidates as a serial run"""
+        serial = DynamicRelationshipDiscovery(confidence_threshold=0.0)
+        parallel = DynamicRelationshipDiscovery(confidence_threshold=0.0)
+
+        serial_summary = serial.discover_corpus(iter(self.CORPUS), workers=1)
+        parallel_summary = parallel.discover_corpus(
+            iter(self.CORPUS), output_path=str(tmp_path / "candidates.jsonl"), workers=2, batch_size=2
+        )
+
+        assert serial_summary == parallel_summary
+        assert serial_summary["documents"] == len(self.CORPUS)
+
+        def key(candidate):
+            return (candidate.id, candidate.evidence_sources, round(candidate.confidence_score, 9),
+                    candidate.occurrences)
+        assert [key(c) for c in serial.discovered_candidates] == [key(c) for c in parallel.discovered_candidates]
+
+        lines = (tmp_path / "candidates.jsonl").read_text().splitlines()
+        exported = [json.loads(line) for line in lines]
+        assert [record["id"] for record in exported] == [c.id for c in parallel.discovered_candidates]
+        treats = next(r for r in exported if (r["source_entity"], r["target_entity"]) == ("Metformin", "diabetes"))
+        assert treats["evidence_sources"] == [f"guideline_{i}" for i in range(6)]
+
+    def test_store_persists_and_indexes_candidates(self, tmp_path):
+        """Test a restarted engine continues from the stored candidates"""
+        store_path = str(tmp_path / "discovery.db")
+        engine = DynamicRelationshipDiscovery(confidence_threshold=0.0, store_path=store_path)
+        engine.discover_relationships(self.CORPUS[0][1], "first")
+        engine.store.close()
+
+        restarted = DynamicRelationshipDiscovery(confidence_threshold=0.0, store_path=store_path)
+        restarted.discover_relationships(self.CORPUS[-1][1], "second")
+
+        diabetes = restarted.find_candidates(entity="DIABETES")
+        assert {"Metformin", "Insulin"} <= {c.source_entity for c in diabetes}
+        assert all("diabetes" in (c.source_entity.lower(), c.target_entity.lower()) for c in diabetes)
+        treatments = restarted.find_candidates(relationship_type="treatment")
+        assert treatments and all(c.relationship_type == "treatment" for c in treatments)
+        metformin = next(c for c in diabetes if c.source_entity == "Metformin")
+        assert restarted.get_candidate(metformin.id).evidence_sources == ["first"]
+
+        queue = restarted.review_queue()
+        assert [c.confidence_score for c in queue] == sorted((c.confidence_score for c in queue), reverse=True)
+
+        proposal = restarted.generate_proposal(metformin)
+        assert restarted.approve_proposal(proposal.id, "reviewer")
+        assert restarted.proposals[0].approved and restarted.proposals[0].reviewed_by == "reviewer"
+        assert metformin.id not in {c.id for c in restarted.review_queue()}
+        assert restarted.approve_proposal("proposal_missing", "reviewer") is False
+
+    def test_incremental_export_appends_changes(self, engine, tmp_path):
+        """Test incremental exports only append candidates changed since the last export"""
+        path = tmp_path / "candidates.jsonl"
+        engine.discover_relationships(self.CORPUS[0][1], "a")
+        engine.export_candidates(str(path), incremental=True)
+        first_export = path.read_text().splitlines()
+
+        engine.discover_relationships(self.CORPUS[-1][1], "b")
+        engine.export_candidates(str(path), incremental=True)
+        engine.export_candidates(str(path), incremental=True)
+
+        lines = path.read_text().splitlines()
+        assert lines[:len(first_export)] == first_export
+        appended = [json.loads(line) for line in lines[len(first_export):]]
+        assert {(r["source_entity"], r["target_entity"]) for r in appended} == {("Insulin", "diabetes")}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Tests for pooled HTTP document fetching against a local HTTP server
+"""
+
+import pytest
+import threading
+import time
+import sys
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from http_fetcher import HTTPDocumentFetcher, DocumentFetchError
+from document_loader import DocumentLoader
+
+GUIDELINE_HTML = (
+    "<html><body><h1>Asthma</h1><p>Assess control.</p>"
+    "<h2>Step 1</h2><p>As-needed ICS-formoterol.</p></body></html>"
+)
+
+
+class GuidelineServer:
+    """Records requests, client connections and peak concurrency"""
+
+    def __init__(self):
+        self.requests = []
+        self.client_ports = set()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.delay = 0.0
+        self.lock = threading.Lock()
+
+
+@pytest.fixture
+def server():
+    """Local keep-alive HTTP server serving guideline documents"""
+    state = GuidelineServer()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args):
+            pass
+
+        def do_GET(self):
+            with state.lock:
+                state.requests.append((self.path, dict(self.headers)))
+                state.client_ports.add(self.client_address[1])
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            try:
+                if state.delay:
+                    time.sleep(state.delay)
+                self._respond()
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+
+        def _respond(self):
+            if self.path == "/missing":
+                return self._send(404, b"not found", "text/plain")
+            if self.path == "/moved":
+                return self._send(301, b"", "text/plain", {"Location": "/guideline.html"})
+            if self.path == "/guideline.html":
+                if self.headers.get("If-None-Match") == '"v1"':
+                    return self._send(304, b"", None, {"ETag": '"v1"'})
+                return self._send(200, GUIDELINE_HTML.encode(), "text/html; charset=utf-8", {"ETag": '"v1"'})
+            if self.path == "/dated.txt":
+                last_modified = "Wed, 01 Jan 2025 00:00:00 GMT"
+                if self.headers.get("If-Modified-Since") == last_modified:
+                    return self._send(304, b"", None)
+                return self._send(200, b"# Dated\nText\n", "text/plain", {"Last-Modified": last_modified})
+            return self._send(200, f"# Doc {self.path}\nBody\n".encode(), "text/plain")
+
+        def _send(self, status, body, content_type, headers=None):
+            self.send_response(status)
+            if content_type:
+                self.send_header("Content-Type", content_type)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            if status != 304:
+                self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if status != 304:
+                self.wfile.write(body)
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.daemon_threads = True
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    state.base_url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    yield state
+    httpd.shutdown()
+    httpd.server_close()
+
+
+class TestHTTPDocumentFetcher:
+    """Test cases for the pooled, caching HTTP fetcher"""
+
+    @pytest.fixture
+    def fetcher(self, tmp_path):
+        fetcher = HTTPDocumentFetcher(tmp_path / "http_cache", max_per_host=2, timeout=5)
+        yield fetcher
+        fetcher.close()
+
+    def test_refetch_unchanged_document_is_304(self, server, fetcher):
+        """Test ETag revalidation serves the cached body"""
+        first = fetcher.fetch(f"{server.base_url}/guideline.html")
+        second = fetcher.fetch(f"{server.base_url}/guideline.html")
+
+        assert (first.status, first.from_cache) == (200, False)
+        assert (second.status, second.from_cache) == (304, True)
+        assert second.read_text() == GUIDELINE_HTML
+        assert server.requests[1][1].get("If-None-Match") == '"v1"'
+
+    def test_cache_files_follow_umask(self, server, fetcher):
+        """Test cached bodies and metadata are created with the process umask"""
+        fetcher.fetch(f"{server.base_url}/guideline.html")
+
+        umask = os.umask(0)
+        os.umask(umask)
+        cached = [path for path in fetcher.cache_dir.rglob("*") if path.is_file()]
+        assert cached
+        for path in cached:
+            assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+    def test_last_modified_revalidation(self, server, fetcher):
+        """Test Last-Modified validators are sent as If-Modified-Since"""
+        fetcher.fetch(f"{server.base_url}/dated.txt")
+        revalidated = fetcher.fetch(f"{server.base_url}/dated.txt")
+
+        assert revalidated.status == 304
+        assert revalidated.read_text() == "# Dated\nText\n"
+
+    def test_connections_are_kept_alive(self, server, fetcher):
+        """Test sequential fetches to one host reuse a single connection"""
+        for i in range(5):
+            fetcher.fetch(f"{server.base_url}/doc{i}.txt")
+
+        assert len(server.requests) == 5
+        assert len(server.client_ports) == 1
+
+    def test_prefetch_respects_per_host_limit(self, server, fetcher):
+        """Test bulk prefetch never exceeds the per-host concurrency limit"""
+        server.delay = 0.05
+        urls = [f"{server.base_url}/doc{i}.txt" for i in range(10)] + [f"{server.base_url}/missing"]
+
+        results = fetcher.prefetch(urls, max_workers=8)
+
+        assert server.max_in_flight <= 2
+        assert isinstance(results[f"{server.base_url}/missing"], DocumentFetchError)
+        assert results[f"{server.base_url}/doc3.txt"].read_text() == "# Doc /doc3.txt\nBody\n"
+
+    def test_redirects_are_followed(self, server, fetcher):
+        """Test redirects resolve to the final document"""
+        assert fetcher.fetch(f"{server.base_url}/moved").read_text() == GUIDELINE_HTML
+
+    def test_loader_ingests_url(self, server, tmp_path, fetcher):
+        """Test DocumentLoader parses HTML fetched from a URL"""
+        loader = DocumentLoader(str(tmp_path / "documents"), http_fetcher=fetcher)
+
+        metadata = loader.load_document(f"{server.base_url}/guideline.html", {"title": "Asthma"})
+
+        assert metadata.format == "html"
+        assert metadata.url == f"{server.base_url}/guideline.html"
+        assert [section['title'] for section in metadata.sections] == ["Asthma", "Step 1"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
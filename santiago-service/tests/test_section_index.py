@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Tests for the Santiago positional section index and BM25 search
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from section_index import SectionSearchIndex, parse_query
+from document_loader import DocumentLoader
+
+
+class TestSectionSearchIndex:
+    """Test cases for the section search index"""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Create an index with two small guideline documents"""
+        index = SectionSearchIndex(tmp_path / "search.db")
+        index.add_document("htn", [
+            ("s1", "Diagnosis", "Blood pressure above 130/80 mmHg is elevated blood pressure."),
+            ("s2", "Treatment", "Start an ACE inhibitor. Pressure targets are individualized."),
+        ])
+        index.add_document("dm", [
+            ("s1", "Screening", "Screen adults for diabetes with HbA1c."),
+            ("s2", "Blood glucose", "Glucose in blood is measured; pressure is not discussed."),
+        ])
+        yield index
+        index.close()
+
+    def test_bm25_ranks_term_dense_section_first(self, index):
+        """Test sections with more occurrences of rarer terms rank higher"""
+        hits = index.search("blood pressure")
+
+        assert (hits[0]['doc_id'], hits[0]['section_id']) == ("htn", "s1")
+        assert {(hit['doc_id'], hit['section_id']) for hit in hits} == {
+            ("htn", "s1"), ("htn", "s2"), ("dm", "s2")
+        }
+        assert hits[0]['score'] > hits[-1]['score']
+
+    def test_phrase_query_requires_adjacent_terms(self, index):
+        """Test quoted phrases only match consecutive tokens"""
+        hits = index.search('"blood pressure"')
+
+        assert [(hit['doc_id'], hit['section_id']) for hit in hits] == [("htn", "s1")]
+        assert index.search('"pressure blood"') == []
+
+    def test_incremental_reindex_and_removal(self, index):
+        """Test re-adding replaces a document and removal drops it"""
+        index.add_document("dm", [("s1", "Screening", "Screen with fasting glucose.")])
+        assert index.search("hba1c") == []
+        assert index.stats()['sections'] == 3
+
+        index.remove_document("htn")
+        assert index.search("ace inhibitor") == []
+        assert index.stats()['documents'] == 1
+
+    def test_document_filter_and_query_parsing(self, index):
+        """Test results restricted to selected documents"""
+        assert {hit['doc_id'] for hit in index.search("pressure", doc_ids=["dm"])} == {"dm"}
+        assert index.search("pressure", doc_ids=[]) == []
+        assert parse_query('ACE "blood pressure" ace') == (["ace", "blood", "pressure"], [["blood", "pressure"]])
+
+    def test_loader_search_returns_anchor_positions(self, tmp_path):
+        """Test loaded documents are searchable with document character positions"""
+        content = "# Hypertension\nIntro ≥ text.\n## Treatment\nStart an ACE inhibitor today.\n"
+        loader = DocumentLoader(str(tmp_path / "documents"))
+        metadata = loader.load_document(content, {"title": "HTN"})
+
+        hits = loader.search_sections('"ace inhibitor"')
+
+        assert hits[0]['doc_id'] == metadata.id
+        match = hits[0]['matches'][0]
+        assert content[match['position']:match['position'] + len(match['text'])] == "ACE inhibitor"
+
+        reopened = DocumentLoader(str(tmp_path / "documents"))
+        assert reopened.search_sections("hypertension", include_matches=False)[0]['section_id'] == "section_1"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared, indexed semantic relationship ontology
+"""
+
+import dataclasses
+import json
+import pytest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from semantic_relationships import SemanticRelationships, RelationshipType, load_core_ontology
+
+
+class TestSemanticRelationships:
+    """Test cases for the ontology snapshot and its indexes"""
+
+    def test_instances_share_one_snapshot(self):
+        """Test the core ontology is built once and shared"""
+        first, second = SemanticRelationships(), SemanticRelationships()
+
+        assert first.ontology is second.ontology is load_core_ontology()
+        with pytest.raises(TypeError):
+            first.relationships[RelationshipType.TREATS] = None
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            first.get_relationship(RelationshipType.TREATS).domain = "condition"
+
+    def test_definitions_are_deeply_immutable(self):
+        """Test nested definition fields cannot be changed through a shared snapshot"""
+        first, second = SemanticRelationships(), SemanticRelationships()
+        treats = first.get_relationship(RelationshipType.TREATS)
+
+        with pytest.raises(TypeError):
+            treats.properties['injected'] = "float"
+        with pytest.raises(TypeError):
+            treats.examples[0]['source'] = "placebo"
+        with pytest.raises((TypeError, AttributeError)):
+            treats.validation_rules.append("anything goes")
+        with pytest.raises(AttributeError):
+            treats.properties['evidence_levels'].append("F")
+
+        assert 'injected' not in second.get_relationship(RelationshipType.TREATS).properties
+        assert second.get_relationship(RelationshipType.TREATS).examples[0]['source'] == "metformin"
+
+    def test_indexes_match_linear_scans(self):
+        """Test domain, range and category lookups agree with the definitions"""
+        relationships = SemanticRelationships()
+        definitions = list(relationships.relationships.values())
+
+        for domain in {rel.domain for rel in definitions}:
+            assert relationships.get_relationships_by_domain(domain) == [
+                rel for rel in definitions if rel.domain == domain
+            ]
+        for range_type in {rel.range for rel in definitions}:
+            assert relationships.get_relationships_by_range(range_type) == [
+                rel for rel in definitions if rel.range == range_type
+            ]
+        assert relationships.get_relationships_by_domain("unknown") == []
+        assert RelationshipType.TREATS in [
+            rel.type for rel in relationships.get_relationships_by_category("treatment")
+        ]
+
+    def test_compiled_validation(self):
+        """Test typed property checks and unknown relationship types"""
+        relationships = SemanticRelationships()
+
+        assert relationships.validate_relationship(
+            RelationshipType.INVESTIGATES, "hba1c", "diabetes", {"sensitivity": 0.85}
+        ) == []
+        assert relationships.validate_relationship(
+            RelationshipType.INVESTIGATES, "hba1c", "diabetes", {"sensitivity": "high"}
+        ) == ["Property sensitivity must be numeric"]
+        assert relationships.validate_relationship(
+            "not_a_type", "a", "b"
+        ) == ["Unknown relationship type: not_a_type"]
+
+    def test_import_does_not_modify_shared_snapshot(self, tmp_path):
+        """Test importing definitions gives the instance its own snapshot"""
+        relationships = SemanticRelationships()
+        path = tmp_path / "relationships.json"
+        relationships.export_to_json(str(path))
+        data = json.loads(path.read_text())
+        data["treats"]["domain"] = "medication"
+        path.write_text(json.dumps(data))
+
+        relationships.import_from_json(str(path))
+
+        assert relationships.get_relationship(RelationshipType.TREATS).domain == "medication"
+        assert load_core_ontology().relationships[RelationshipType.TREATS].domain == "intervention"
+        assert relationships.get_relationships_by_domain("medication")[0].type == RelationshipType.TREATS
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
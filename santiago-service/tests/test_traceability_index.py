@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Tests for the Santiago anchor <-> asset traceability index
+"""
+
+import pytest
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from traceability_index import TraceabilityIndex
+
+
+class TestTraceabilityIndex:
+    """Test cases for the traceability index"""
+
+    @pytest.fixture
+    def index(self, tmp_path):
+        """Create an index backed by a temporary database"""
+        index = TraceabilityIndex(tmp_path / "traceability.db")
+        yield index
+        index.close()
+
+    def _anchor(self, n):
+        return {
+            "id": f"doc_1_section_1_anchor_{n}",
+            "doc_id": "doc_1",
+            "section_id": "section_1",
+            "anchor_type": "recommendation",
+            "text": f"Recommendation {n}",
+            "position": n * 10
+        }
+
+    def test_bidirectional_lookup(self, index):
+        """Test anchor -> asset and asset -> anchor lookups"""
+        index.add_link(self._anchor(1), "rule_a")
+        index.add_link(self._anchor(1), "workflow_x")
+
+        assets = {a["asset_id"] for a in index.get_assets_for_anchor("doc_1_section_1_anchor_1")}
+        anchors = index.get_anchors_for_asset("rule_a")
+
+        assert assets == {"rule_a", "workflow_x"}
+        assert len(anchors) == 1
+        assert anchors[0]["text"] == "Recommendation 1"
+        assert anchors[0]["position"] == 10
+
+    def test_bulk_links_and_batched_trace(self, index):
+        """Test bulk creation and batched multi-asset tracing"""
+        links = [{**self._anchor(n), "asset_id": f"asset_{n % 3}"} for n in range(30)]
+        assert index.add_links(links) == 30
+
+        traced = index.trace_assets([f"asset_{i}" for i in range(3)] + ["unlinked"])
+
+        assert set(traced) == {"asset_0", "asset_1", "asset_2"}
+        assert sum(len(anchors) for anchors in traced.values()) == 30
+        assert index.stats() == {"anchors": 30, "links": 30}
+
+    def test_index_persists_across_instances(self, tmp_path):
+        """Test links survive reopening the index"""
+        db_path = tmp_path / "traceability.db"
+        first = TraceabilityIndex(db_path)
+        first.add_link(self._anchor(2), "asset_persisted")
+        first.close()
+
+        second = TraceabilityIndex(db_path)
+        assert len(second.get_anchors_for_asset("asset_persisted")) == 1
+        second.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
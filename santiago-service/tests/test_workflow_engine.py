@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Tests for Santiago Layer 4 workflow compilation and concurrent execution
+"""
+
+import pytest
+import asyncio
+import sys
+import os
+
+# Add src directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from workflow_engine import WorkflowCompiler, WorkflowExecutor, WorkflowCompilationError
+
+
+class TestWorkflowEngine:
+    """Test cases for the workflow compiler and executor"""
+
+    @pytest.fixture
+    def rules(self):
+        """Diamond-shaped pathway: assess -> (bp check, a1c check) -> plan"""
+        return [
+            {"id": "assess", "action": "assess_patient"},
+            {"id": "bp_check", "action": "start_ace_inhibitor", "depends_on": ["assess"],
+             "condition": {"field": "systolic_bp", "operator": ">=", "value": 130}},
+            {"id": "a1c_check", "action": "start_metformin", "depends_on": ["assess"],
+             "condition": {"field": "hba1c", "operator": ">=", "value": 6.5}},
+            {"id": "plan", "action": "create_care_plan", "depends_on": ["bp_check", "a1c_check"]}
+        ]
+
+    def test_compile_dag_structure(self, rules):
+        """Test entry/exit points and dependency stages"""
+        compiled = WorkflowCompiler().compile("wf_1", rules)
+
+        assert compiled["entry_points"] == ["assess"]
+        assert compiled["exit_points"] == ["plan"]
+        assert compiled["execution_paths"] == [["assess"], ["bp_check", "a1c_check"], ["plan"]]
+        assert ["assess", "bp_check"] in compiled["workflow_dag"]["edges"]
+
+    def test_compile_rejects_cycles_and_unknown_dependencies(self):
+        """Test invalid rule graphs are rejected"""
+        compiler = WorkflowCompiler()
+        with pytest.raises(WorkflowCompilationError):
+            compiler.compile("wf_cycle", [{"id": "a", "depends_on": ["b"]}, {"id": "b", "depends_on": ["a"]}])
+        with pytest.raises(WorkflowCompilationError):
+            compiler.compile("wf_unknown", [{"id": "a", "depends_on": ["missing"]}])
+
+    @pytest.mark.asyncio
+    async def test_execute_skips_downstream_of_failed_conditions(self, rules):
+        """Test condition gating and downstream skipping"""
+        compiled = WorkflowCompiler().compile("wf_1", rules)
+        result = await WorkflowExecutor().execute(compiled, {"systolic_bp": 142, "hba1c": 5.9})
+
+        assert result.steps["bp_check"].status == "completed"
+        assert result.steps["a1c_check"].status == "not_applicable"
+        assert result.steps["plan"].status == "skipped"
+        assert set(result.step_latencies()) == {"assess", "bp_check", "a1c_check", "plan"}
+
+    @pytest.mark.asyncio
+    async def test_independent_branches_run_concurrently(self):
+        """Test that independent checks run in parallel-branch time"""
+        async def slow_check(step, patient_context, upstream_outputs):
+            await asyncio.sleep(0.05)
+            return {"checked": step["id"]}
+
+        rules = [{"id": f"check_{i}", "action_type": "slow"} for i in range(20)]
+        compiled = WorkflowCompiler().compile("wf_parallel", rules)
+        executor = WorkflowExecutor(handlers={"slow": slow_check})
+
+        result = await executor.execute(compiled, {"patient_id": "p1"})
+
+        assert len(result.completed_steps) == 20
+        assert result.total_latency_ms < 20 * 50 / 2
+
+    @pytest.mark.asyncio
+    async def test_results_cached_per_patient_context(self):
+        """Test step results are reused for an identical patient context"""
+        calls = []
+
+        def counting_handler(step, patient_context, upstream_outputs):
+            calls.append(step["id"])
+            return {"ok": True}
+
+        compiled = WorkflowCompiler().compile("wf_cache", [{"id": "a", "action_type": "count"}])
+        executor = WorkflowExecutor(handlers={"count": counting_handler})
+
+        await executor.execute(compiled, {"patient_id": "p1"})
+        second = await executor.execute(compiled, {"patient_id": "p1"})
+        await executor.execute(compiled, {"patient_id": "p2"})
+
+        assert second.steps["a"].cached is True
+        assert calls == ["a", "a"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -10,7 +10,15 @@ directory using our working POCs:
 3. BDD Generator: Generate Gherkin test scenarios
 
 Usage:
-    python test_sample_guidelines.py [--guideline <guideline_name>]
+    python test_sample_guidelines.py [<scenario_name> | <guideline.pdf>] [--workers N] [--force]
+
+The POCs run in-process; when several scenarios are tested their pipelines
+run on a pool of N worker processes (default: CPU count).
+
+Runs are incremental: generated/build-manifest.json records each scenario's
+input hash, the pipeline version and the hashes of its outputs, and
+scenarios whose inputs, pipeline code and outputs are unchanged are skipped.
+--force rebuilds every scenario.
 
 Available guidelines:
     - diabetes-management
@@ -18,27 +26,102 @@ Available guidelines:
     - nccn-breast-cancer
 """
 
+import argparse
 import json
 import yaml
 import sys
 import os
 import copy
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
 from pathlib import Path
-from typing import Dict, Any, List, Optional
-import subprocess
-import time
+from typing import Dict, Any, List, Optional, Iterable, Tuple
 from datetime import datetime
 
 # Import our new analysis components
 from guideline_analyzer import GuidelineAnalyzer
 # from external_validator import ExternalValidator  # TODO: Install dependencies
 
+# POC components run in-process (the MCP server brings in the BDD generator)
+sys.path.insert(0, str(Path(__file__).parent / "poc" / "cikg-processor"))
+sys.path.insert(0, str(Path(__file__).parent / "poc" / "mcp-server"))
+sys.path.insert(0, str(Path(__file__).parent / "poc" / "bdd-generator"))
+import poc_bdd_generator
+import poc_cikg_processor
+import poc_mcp_server
+from build_manifest import BuildManifest, input_hash, source_version
+from poc_cikg_processor import CIKGProcessor
+from poc_mcp_server import MCPServer
+
+# Source files of the pipeline; editing any of them rebuilds every scenario
+PIPELINE_SOURCES = (poc_cikg_processor.__file__, poc_mcp_server.__file__, poc_bdd_generator.__file__)
+
+def run_scenario_pipeline(clinical_text: str, bdd_scenario: Dict[str, Any], category: str) -> Dict[str, Any]:
+    """
+    Run one scenario through CIKG processing and a fresh MCP server session
+
+    Sends the MCP server the same JSON-RPC requests a stdio client would,
+    stopping at the first request that fails. Safe to run in a worker process.
+
+    Returns:
+        Dict with the CIKG output (or error) and the MCP responses by method
+    """
+    result = {"cikg_output": None, "cikg_error": None, "mcp_responses": {}}
+    try:
+        result["cikg_output"] = asdict(CIKGProcessor().process_text(clinical_text))
+    except Exception as e:
+        result["cikg_error"] = str(e)
+        return result
+
+    requests = [
+        {
+            "jsonrpc": "2.0", "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "1.0",
+                "capabilities": {},
+                "clientInfo": {"name": "guideline-tester", "version": "1.0"}
+            }
+        },
+        {
+            "jsonrpc": "2.0", "id": 2,
+            "method": "configure_coverage",
+            "params": {
+                "strategy": "tiered",
+                "default_tier": "high",
+                "categories": [category]
+            }
+        },
+        {
+            "jsonrpc": "2.0", "id": 3,
+            "method": "process_scenario",
+            "params": {
+                "scenario": bdd_scenario,
+                "coverage_config": {
+                    "fidelity_level": "high",
+                    "generation_mode": "comprehensive"
+                }
+            }
+        }
+    ]
+    # A new server per scenario keeps its counters scoped to this scenario
+    server = MCPServer()
+    for request in requests:
+        response = server.handle_request(request)
+        result["mcp_responses"][request["method"]] = response
+        if "result" not in response:
+            break
+    return result
+
 class GuidelineTester:
-    def __init__(self):
+    def __init__(self, workers: Optional[int] = None, force: bool = False):
         self.project_root = Path(__file__).parent
-        self.python_cmd = sys.executable
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
         self.generated_dir = self.project_root / "generated"
         self.ensure_generated_dirs()
+        self.manifest = BuildManifest(self.generated_dir / BuildManifest.FILE_NAME,
+                                      source_version(*PIPELINE_SOURCES), force=force)
 
     def ensure_generated_dirs(self):
         """Ensure all generated output directories exist"""
@@ -580,23 +663,26 @@ class GuidelineTester:
                 return False
 
             # Process each generated scenario
-            successful_scenarios = 0
             topic = self.get_topic_from_pdf_path(pdf_path)
-            for i, scenario in enumerate(scenarios):
-                scenario_id = scenario["scenario"]["id"]
-                print(f"\n📋 Processing scenario {i+1}/{len(scenarios)}: {scenario_id}")
 
-                # Test the scenario
-                if self.test_scenario_processing(scenario_id, scenario_data=scenario, topic=topic):
-                    successful_scenarios += 1
-                else:
-                    print(f"❌ Failed to process scenario: {scenario_id}")
+            def scenario_jobs():
+                for i, scenario in enumerate(scenarios):
+                    scenario_id = scenario["scenario"]["id"]
+                    print(f"\n📋 Processing scenario {i+1}/{len(scenarios)}: {scenario_id}")
+                    yield scenario_id, scenario, topic
+
+            results = self.test_scenarios(scenario_jobs())
+            for scenario, success in zip(scenarios, results):
+                if not success:
+                    print(f"❌ Failed to process scenario: {scenario['scenario']['id']}")
+            successful_scenarios = sum(results)
 
             print(f"\n{'='*80}")
             print(f"PDF PROCESSING SUMMARY: {pdf_name}")
             print(f"Scenarios Generated: {len(scenarios)}")
             print(f"Successful: {successful_scenarios}")
             print(f"Success Rate: {successful_scenarios/len(scenarios)*100:.1f}%")
+            print(f"Build: {self.manifest.summary()}")
             print('='*80)
 
             return successful_scenarios > 0
@@ -607,30 +693,83 @@ class GuidelineTester:
 
     def test_scenario_processing(self, scenario_name: str, scenario_data: Optional[Dict[str, Any]] = None, topic: Optional[str] = None):
         """Test processing a single scenario through the full pipeline"""
-        # Determine topic and create versioned run directory
+        job = self.prepare_scenario(scenario_name, scenario_data, topic)
+        if job is None:
+            return False
+        if job["up_to_date"]:
+            return True
+        try:
+            return self.record_scenario_results(job, run_scenario_pipeline(*job["pipeline_args"]))
+        finally:
+            self.manifest.save()
+
+    def test_scenarios(self, scenarios: Iterable[Tuple[str, Optional[Dict[str, Any]], Optional[str]]]) -> List[bool]:
+        """
+        Test several scenarios, running their pipelines on the worker pool
+
+        Scenarios are prepared (run directories, inputs) and recorded (output
+        files, run summaries) in order in this process, so outputs match a
+        one-by-one run; only the CIKG and MCP pipeline work runs in workers,
+        with at most two scenarios per worker in flight. Scenarios the build
+        manifest reports as up to date are skipped and count as successful.
+
+        Args:
+            scenarios: (scenario_name, scenario_data, topic) tuples, as for test_scenario_processing
+
+        Returns:
+            Success flag per scenario, in order
+        """
+        if self.workers <= 1:
+            return [self.test_scenario_processing(*scenario) for scenario in scenarios]
+
+        results = []
+        with ProcessPoolExecutor(max_workers=self.workers) as executor:
+            pending = deque()
+
+            def record_next():
+                job, future = pending.popleft()
+                if job is None or job["up_to_date"]:
+                    results.append(job is not None)
+                    return
+                try:
+                    pipeline_result = future.result()
+                except Exception as e:
+                    print(f"❌ Error processing scenario: {str(e)}")
+                    results.append(False)
+                    return
+                results.append(self.record_scenario_results(job, pipeline_result))
+
+            try:
+                for scenario in scenarios:
+                    job = self.prepare_scenario(*scenario)
+                    future = None
+                    if job is not None and not job["up_to_date"]:
+                        future = executor.submit(run_scenario_pipeline, *job["pipeline_args"])
+                    pending.append((job, future))
+                    if len(pending) >= self.workers * 2:
+                        record_next()
+                while pending:
+                    record_next()
+            finally:
+                self.manifest.save()
+
+        return results
+
+    def prepare_scenario(self, scenario_name: str, scenario_data: Optional[Dict[str, Any]] = None,
+                         topic: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Create the scenario's run directory and pipeline inputs; None if it cannot be loaded
+
+        When the build manifest reports the scenario as up to date no run
+        directory is created and the returned job has "up_to_date" set.
+        """
+        # Determine topic
         if topic is None:
             topic = self.get_topic_from_scenario(scenario_name)
-        run_dir = self.create_versioned_run_dir(topic, scenario_name)
-        
-        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-        output_prefix = f"{scenario_name}_{timestamp}"
-        
+
         print(f"\n{'='*80}")
         print(f"TESTING SCENARIO: {scenario_name}")
         print(f"TOPIC: {topic}")
-        print(f"RUN DIR: {run_dir}")
-        print(f"OUTPUT PREFIX: {output_prefix}")
-        print('='*80)
-
-        # Initialize run summary
-        run_summary = {
-            "scenario": scenario_name,
-            "topic": topic,
-            "timestamp": datetime.now().isoformat(),
-            "run_directory": str(run_dir.relative_to(self.generated_dir)),
-            "tests": [],
-            "overall_status": "running"
-        }
 
         # Load scenario
         if scenario_data is not None:
@@ -640,256 +779,173 @@ class GuidelineTester:
             scenario_path = self.project_root / "examples" / "bdd-tests" / "scenarios" / f"{scenario_name}.yaml"
             if not scenario_path.exists():
                 print(f"❌ Scenario file not found: {scenario_path}")
-                return False
+                return None
 
             yaml_scenario = self.load_scenario_from_yaml(scenario_path)
             print(f"✅ Loaded scenario: {yaml_scenario['scenario']['title']}")
 
         try:
-
             # Step 1: Create clinical text for CIKG processing
             clinical_text = self.create_clinical_text_from_scenario(yaml_scenario)
             print(f"📝 Generated clinical text: {clinical_text[:100]}...")
 
-            # Create temporary JSON file for CIKG
-            cikg_input = {
-                "text": clinical_text,
-                "source": yaml_scenario['scenario'].get('guidelines', [{}])[0].get('name', 'Clinical Guideline'),
-                "category": yaml_scenario['scenario'].get('category', 'treatment')
-            }
+            # Step 3: Convert scenario for BDD generation
+            bdd_scenario = self.convert_scenario_for_bdd(yaml_scenario)
+            print("🔄 Converted scenario for BDD generation")
+        except Exception as e:
+            print(f"❌ Error processing scenario: {str(e)}")
+            return None
+
+        category = yaml_scenario['scenario'].get('category', 'treatment-recommendation')
+        pipeline_args = (clinical_text, bdd_scenario, category)
+
+        # Skip scenarios whose pipeline inputs, pipeline code and outputs are unchanged
+        manifest_key = f"{topic}/{scenario_name}"
+        inputs_digest = input_hash(*pipeline_args)
+        if self.manifest.is_current(manifest_key, inputs_digest):
+            print("⏭️  Up to date, skipping (inputs, pipeline and outputs unchanged)")
+            print('='*80)
+            return {"scenario_name": scenario_name, "up_to_date": True}
 
-            cikg_file = self.project_root / "temp_cikg_input.json"
-            with open(cikg_file, 'w') as f:
-                json.dump([cikg_input], f, indent=2)
+        # Create versioned run directory
+        run_dir = self.create_versioned_run_dir(topic, scenario_name)
 
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        output_prefix = f"{scenario_name}_{timestamp}"
+
+        print(f"RUN DIR: {run_dir}")
+        print(f"OUTPUT PREFIX: {output_prefix}")
+        print('='*80)
+
+        # Initialize run summary
+        run_summary = {
+            "scenario": scenario_name,
+            "topic": topic,
+            "timestamp": datetime.now().isoformat(),
+            "run_directory": str(run_dir.relative_to(self.generated_dir)),
+            "tests": [],
+            "overall_status": "running"
+        }
+
+        return {
+            "scenario_name": scenario_name,
+            "up_to_date": False,
+            "manifest_key": manifest_key,
+            "inputs_digest": inputs_digest,
+            "run_dir": run_dir,
+            "timestamp": timestamp,
+            "output_prefix": output_prefix,
+            "run_summary": run_summary,
+            "pipeline_args": pipeline_args
+        }
+
+    def record_scenario_results(self, job: Dict[str, Any], pipeline_result: Dict[str, Any]) -> bool:
+        """Save a scenario's CIKG, MCP and BDD outputs and its run summary"""
+        scenario_name = job["scenario_name"]
+        run_dir = job["run_dir"]
+        output_prefix = job["output_prefix"]
+        run_summary = job["run_summary"]
+        outputs = []
+
+        try:
             # Step 2: Process with CIKG
             print("🔬 Processing with CIKG...")
-            cikg_result = subprocess.run(
-                [self.python_cmd, "poc/cikg-processor/poc_cikg_processor.py", str(cikg_file)],
-                capture_output=True,
-                text=True,
-                cwd=self.project_root,
-                timeout=15
-            )
-
-            if cikg_result.returncode == 0:
-                print("✅ CIKG processing successful")
-                # Extract entities and triples count
-                output = cikg_result.stdout
-                if "Extracted" in output and "GSRL triples" in output:
-                    print("📊 CIKG extracted clinical entities and generated knowledge triples")
-                    
-                    # Save CIKG output
-                    cikg_output_file = run_dir / "cikg-triples" / f"{output_prefix}_cikg_output.json"
-                    # Extract JSON from output for saving
-                    output_lines = output.split('\n')
-                    json_content = []
-                    in_json = False
-                    for line in output_lines:
-                        if 'CIKG PROCESSING OUTPUT:' in line:
-                            in_json = True
-                            continue
-                        elif line.startswith('=') and in_json:
-                            if json_content:
-                                break  # Stop at the end marker if we have content
-                            # Skip separator lines before JSON
-                            continue
-                        elif in_json and line.strip():
-                            json_content.append(line)
-                    
-                    cikg_success = False
-                    if json_content:
-                        try:
-                            json_data = json.loads('\n'.join(json_content))
-                            with open(cikg_output_file, 'w') as f:
-                                json.dump(json_data, f, indent=2)
-                            print(f"💾 Saved CIKG output to: {cikg_output_file}")
-                            cikg_success = True
-                        except:
-                            print("⚠️  Could not parse CIKG JSON output")
-                    
-                    run_summary["tests"].append({
-                        "test": "CIKG Processing",
-                        "status": "success" if cikg_success else "warning",
-                        "output_file": str(cikg_output_file.relative_to(self.generated_dir)) if cikg_success else None,
-                        "timestamp": datetime.now().isoformat()
-                    })
-                else:
-                    print("⚠️  CIKG output format unexpected")
-                    run_summary["tests"].append({
-                        "test": "CIKG Processing",
-                        "status": "warning",
-                        "message": "Unexpected output format",
-                        "timestamp": datetime.now().isoformat()
-                    })
-            else:
-                print(f"❌ CIKG processing failed: {cikg_result.stderr}")
+            if pipeline_result["cikg_error"] is not None:
+                print(f"❌ CIKG processing failed: {pipeline_result['cikg_error']}")
                 run_summary["tests"].append({
                     "test": "CIKG Processing",
                     "status": "failed",
-                    "error": cikg_result.stderr,
+                    "error": pipeline_result["cikg_error"],
                     "timestamp": datetime.now().isoformat()
                 })
                 return False
 
-            # Step 3: Convert scenario for BDD generation
-            bdd_scenario = self.convert_scenario_for_bdd(yaml_scenario)
-            print("🔄 Converted scenario for BDD generation")
-
-            # Step 4: Start MCP server and process scenario
+            print("✅ CIKG processing successful")
+            print("📊 CIKG extracted clinical entities and generated knowledge triples")
+
+            # Save CIKG output
+            cikg_output_file = run_dir / "cikg-triples" / f"{output_prefix}_cikg_output.json"
+            with open(cikg_output_file, 'w') as f:
+                json.dump(pipeline_result["cikg_output"], f, indent=2)
+            outputs.append(cikg_output_file)
+            print(f"💾 Saved CIKG output to: {cikg_output_file}")
+            run_summary["tests"].append({
+                "test": "CIKG Processing",
+                "status": "success",
+                "output_file": str(cikg_output_file.relative_to(self.generated_dir)),
+                "timestamp": datetime.now().isoformat()
+            })
+
+            # Step 4: Process scenario with the MCP server
             print("🚀 Starting MCP server for scenario processing...")
+            responses = pipeline_result["mcp_responses"]
 
-            # Start MCP server
-            mcp_process = subprocess.Popen(
-                [self.python_cmd, "poc/mcp-server/poc_mcp_server.py"],
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=self.project_root
-            )
+            if "result" in responses.get("initialize", {}):
+                print("✅ MCP server initialized")
+            else:
+                print("❌ MCP initialization failed")
+                return False
 
-            time.sleep(2)  # Wait for server to start
+            if "result" in responses.get("configure_coverage", {}):
+                print("✅ Coverage configured")
+            else:
+                print("❌ Coverage configuration failed")
+                return False
 
-            try:
-                # Initialize
-                init_request = {
-                    "jsonrpc": "2.0", "id": 1,
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": "1.0",
-                        "capabilities": {},
-                        "clientInfo": {"name": "guideline-tester", "version": "1.0"}
-                    }
-                }
-                if mcp_process.stdin:
-                    mcp_process.stdin.write(json.dumps(init_request) + "\n")
-                    mcp_process.stdin.flush()
-
-                    if mcp_process.stdout:
-                        response = json.loads(mcp_process.stdout.readline().strip())
-                        if "result" in response:
-                            print("✅ MCP server initialized")
-                        else:
-                            print("❌ MCP initialization failed")
-                            return False
-                    else:
-                        print("❌ No stdout from MCP server")
-                        return False
-                else:
-                    print("❌ No stdin to MCP server")
-                    return False
-
-                # Configure coverage
-                config_request = {
-                    "jsonrpc": "2.0", "id": 2,
-                    "method": "configure_coverage",
-                    "params": {
-                        "strategy": "tiered",
-                        "default_tier": "high",
-                        "categories": [yaml_scenario['scenario'].get('category', 'treatment-recommendation')]
-                    }
+            response = responses.get("process_scenario", {})
+            if "result" in response and response["result"].get("status") == "success":
+                print("✅ Scenario processed successfully")
+                print("📋 Generated BDD test scenarios")
+                
+                # Save MCP session log
+                mcp_log_file = run_dir / "mcp-logs" / f"{output_prefix}_mcp_session.json"
+                session_data = {
+                    "timestamp": job["timestamp"],
+                    "scenario": scenario_name,
+                    "requests": [
+                        {"method": "initialize", "status": "success"},
+                        {"method": "configure_coverage", "status": "success"},
+                        {"method": "process_scenario", "status": "success"}
+                    ],
+                    "generated_scenarios": response["result"].get("metadata", {}).get("scenarios_generated", 0)
                 }
-                if mcp_process.stdin:
-                    mcp_process.stdin.write(json.dumps(config_request) + "\n")
-                    mcp_process.stdin.flush()
-
-                    if mcp_process.stdout:
-                        response = json.loads(mcp_process.stdout.readline().strip())
-                        if "result" in response:
-                            print("✅ Coverage configured")
-                        else:
-                            print("❌ Coverage configuration failed")
-                            return False
-                    else:
-                        print("❌ No stdout from MCP server")
-                        return False
-                else:
-                    print("❌ No stdin to MCP server")
-                    return False
-
-                # Process scenario
-                process_request = {
-                    "jsonrpc": "2.0", "id": 3,
-                    "method": "process_scenario",
-                    "params": {
-                        "scenario": bdd_scenario,
-                        "coverage_config": {
-                            "fidelity_level": "high",
-                            "generation_mode": "comprehensive"
-                        }
-                    }
-                }
-                if mcp_process.stdin:
-                    mcp_process.stdin.write(json.dumps(process_request) + "\n")
-                    mcp_process.stdin.flush()
-
-                    if mcp_process.stdout:
-                        response = json.loads(mcp_process.stdout.readline().strip())
-                        if "result" in response and response["result"].get("status") == "success":
-                            print("✅ Scenario processed successfully")
-                            print("📋 Generated BDD test scenarios")
-                            
-                            # Save MCP session log
-                            mcp_log_file = run_dir / "mcp-logs" / f"{output_prefix}_mcp_session.json"
-                            session_data = {
-                                "timestamp": timestamp,
-                                "scenario": scenario_name,
-                                "requests": [
-                                    {"method": "initialize", "status": "success"},
-                                    {"method": "configure_coverage", "status": "success"},
-                                    {"method": "process_scenario", "status": "success"}
-                                ],
-                                "generated_scenarios": response["result"].get("metadata", {}).get("scenarios_generated", 0)
-                            }
-                            with open(mcp_log_file, 'w') as f:
-                                json.dump(session_data, f, indent=2)
-                            print(f"💾 Saved MCP session log to: {mcp_log_file}")
-                            
-                            # Save BDD test scenarios
-                            if "gherkin" in response["result"]:
-                                bdd_file = run_dir / "bdd-tests" / f"{output_prefix}.feature"
-                                with open(bdd_file, 'w') as f:
-                                    f.write(response["result"]["gherkin"])
-                                print(f"💾 Saved BDD test scenarios to: {bdd_file}")
-                                
-                                run_summary["tests"].append({
-                                    "test": "BDD Generation",
-                                    "status": "success", 
-                                    "output_file": str(bdd_file.relative_to(self.generated_dir)),
-                                    "timestamp": datetime.now().isoformat()
-                                })
-                            
-                            run_summary["tests"].append({
-                                "test": "MCP Processing",
-                                "status": "success",
-                                "output_file": str(mcp_log_file.relative_to(self.generated_dir)),
-                                "generated_scenarios": response["result"].get("metadata", {}).get("scenarios_generated", 0),
-                                "timestamp": datetime.now().isoformat()
-                            })
-                            
-                        else:
-                            print(f"❌ Scenario processing failed: {response}")
-                            run_summary["tests"].append({
-                                "test": "MCP Processing",
-                                "status": "failed",
-                                "error": str(response),
-                                "timestamp": datetime.now().isoformat()
-                            })
-                            return False
-                    else:
-                        print("❌ No stdout from MCP server")
-                        return False
-                else:
-                    print("❌ No stdin to MCP server")
-                    return False
-
-            finally:
-                # Clean up
-                mcp_process.terminate()
-                mcp_process.wait(timeout=5)
-                if cikg_file.exists():
-                    cikg_file.unlink()
+                with open(mcp_log_file, 'w') as f:
+                    json.dump(session_data, f, indent=2)
+                outputs.append(mcp_log_file)
+                print(f"💾 Saved MCP session log to: {mcp_log_file}")
+                
+                # Save BDD test scenarios
+                if "gherkin" in response["result"]:
+                    bdd_file = run_dir / "bdd-tests" / f"{output_prefix}.feature"
+                    with open(bdd_file, 'w') as f:
+                        f.write(response["result"]["gherkin"])
+                    outputs.append(bdd_file)
+                    print(f"💾 Saved BDD test scenarios to: {bdd_file}")
+                    
+                    run_summary["tests"].append({
+                        "test": "BDD Generation",
+                        "status": "success", 
+                        "output_file": str(bdd_file.relative_to(self.generated_dir)),
+                        "timestamp": datetime.now().isoformat()
+                    })
+                
+                run_summary["tests"].append({
+                    "test": "MCP Processing",
+                    "status": "success",
+                    "output_file": str(mcp_log_file.relative_to(self.generated_dir)),
+                    "generated_scenarios": response["result"].get("metadata", {}).get("scenarios_generated", 0),
+                    "timestamp": datetime.now().isoformat()
+                })
+                
+            else:
+                print(f"❌ Scenario processing failed: {response}")
+                run_summary["tests"].append({
+                    "test": "MCP Processing",
+                    "status": "failed",
+                    "error": str(response),
+                    "timestamp": datetime.now().isoformat()
+                })
+                return False
 
             print(f"✅ SUCCESS: {scenario_name} processed through complete pipeline")
             
@@ -901,7 +957,10 @@ class GuidelineTester:
             summary_file = run_dir / "run-summary.json"
             with open(summary_file, 'w') as f:
                 json.dump(run_summary, f, indent=2)
+            outputs.append(summary_file)
             print(f"💾 Saved run summary to: {summary_file}")
+
+            self.manifest.record(job["manifest_key"], job["inputs_digest"], outputs)
             
             return True
 
@@ -918,13 +977,8 @@ class GuidelineTester:
         for f in scenario_files:
             print(f"  - {f.stem}")
 
-        successful = 0
         total = len(scenario_files)
-
-        for scenario_file in scenario_files:
-            scenario_name = scenario_file.stem
-            if self.test_scenario_processing(scenario_name):
-                successful += 1
+        successful = sum(self.test_scenarios((f.stem, None, None) for f in scenario_files))
 
         print(f"\n{'='*80}")
         print("TEST SUMMARY")
@@ -932,6 +986,8 @@ class GuidelineTester:
         print(f"Scenarios tested: {total}")
         print(f"Successful: {successful}")
         print(f"Failed: {total - successful}")
+        print(f"Rebuilt: {len(self.manifest.rebuilt)}")
+        print(f"Up to date (skipped): {len(self.manifest.up_to_date)}")
 
         if successful == total:
             print("🎉 ALL SCENARIOS PROCESSED SUCCESSFULLY!")
@@ -944,6 +1000,8 @@ class GuidelineTester:
                 "scenarios_tested": total,
                 "successful": successful,
                 "failed": total - successful,
+                "rebuilt": self.manifest.rebuilt,
+                "up_to_date": self.manifest.up_to_date,
                 "success_rate": successful / total if total > 0 else 0,
                 "status": "PASSED" if successful == total else "FAILED",
                 "topics_covered": list(set(self.get_topic_from_scenario(f.stem) for f in scenario_files)),
@@ -963,10 +1021,18 @@ class GuidelineTester:
 
 def main():
     """Main test execution"""
-    tester = GuidelineTester()
+    parser = argparse.ArgumentParser(description="Process sample clinical guidelines with the POCs")
+    parser.add_argument("input", nargs="?", help="Scenario name or guideline PDF (default: all scenarios)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for scenario pipelines (default: CPU count)")
+    parser.add_argument("--force", action="store_true",
+                        help="Rebuild every scenario, even those the build manifest reports as up to date")
+    args = parser.parse_args()
+
+    tester = GuidelineTester(workers=args.workers, force=args.force)
 
-    if len(sys.argv) > 1:
-        input_arg = sys.argv[1]
+    if args.input:
+        input_arg = args.input
 
         # Check if it's a PDF file
         if input_arg.endswith('.pdf'):
@@ -983,4 +1049,4 @@ def main():
         sys.exit(0 if success else 1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -19,11 +19,13 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'poc', 'bdd-generator
 try:
     from poc_cikg_processor import CIKGProcessor
     from poc_bdd_generator import BDDGenerator
+    from feature_writer import write_atomic
 except ImportError as e:
     print(f"Warning: Could not import POC modules: {e}")
     print("Will use sample data for demonstration")
     CIKGProcessor = None
     BDDGenerator = None
+    write_atomic = None
 
 
 class UATGuidelineTester:
@@ -271,19 +273,26 @@ class UATGuidelineTester:
         return scenarios
     
     def _save_scenarios(self, filename: str, guideline_name: str, scenarios: List[Dict]):
-        """Save scenarios to Gherkin feature file"""
-        with open(filename, 'w') as f:
-            f.write(f"Feature: {guideline_name}\n")
-            f.write(f"  Clinical BDD scenarios generated from {guideline_name} guideline\n\n")
-            
-            for i, scenario in enumerate(scenarios, 1):
-                tags = " ".join([f"@{tag}" for tag in scenario.get("tags", [])])
-                f.write(f"  {tags}\n")
-                f.write(f"  Scenario: {scenario['title']}\n")
-                f.write(f"    Given {scenario['given']}\n")
-                f.write(f"    When {scenario['when']}\n")
-                f.write(f"    Then {scenario['then']}\n")
-                f.write("\n")
+        """Save scenarios to Gherkin feature file (written atomically)"""
+        lines = [
+            f"Feature: {guideline_name}\n",
+            f"  Clinical BDD scenarios generated from {guideline_name} guideline\n\n",
+        ]
+        
+        for i, scenario in enumerate(scenarios, 1):
+            tags = " ".join([f"@{tag}" for tag in scenario.get("tags", [])])
+            lines.append(f"  {tags}\n")
+            lines.append(f"  Scenario: {scenario['title']}\n")
+            lines.append(f"    Given {scenario['given']}\n")
+            lines.append(f"    When {scenario['when']}\n")
+            lines.append(f"    Then {scenario['then']}\n")
+            lines.append("\n")
+        
+        if write_atomic:
+            write_atomic(filename, "".join(lines))
+        else:
+            with open(filename, 'w') as f:
+                f.writelines(lines)
     
     def run_comprehensive_test(self) -> Dict:
         """Run comprehensive UAT testing on all guidelines"""